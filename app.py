@@ -6,11 +6,207 @@ Excel verileri ile fotoğrafları eşleştirip yeniden adlandıran ana program
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import logging
+import multiprocessing
 from pathlib import Path
 from typing import List, Dict, Optional
 import os
+import re
+import shutil
+import subprocess
+import sys
 import threading
+import time
 import webbrowser
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+
+from PIL import Image, ImageDraw, ImageFont
+try:
+    from PIL import ImageTk
+except ImportError:  # Bazı Linux dağıtımlarında ayrı pakette (python3-pil.imagetk)
+    ImageTk = None
+
+# Dosya yöneticisinde klasör açma komutu (platforma göre bir kez belirlenir)
+_OPEN_DIR_CMD = {"win32": ["explorer"], "darwin": ["open"]}.get(sys.platform, ["xdg-open"])
+
+# Windows'ta Explorer ayrık süreç olarak başlatılır (konsol/handle devralmaz)
+_OPEN_DIR_FLAGS = (getattr(subprocess, 'DETACHED_PROCESS', 0) |
+                   getattr(subprocess, 'CREATE_NEW_PROCESS_GROUP', 0)) if sys.platform == "win32" else 0
+
+
+def _launch_file_manager(path: Path) -> None:
+    """Klasörü dosya yöneticisinde aç; beklemeden döner (Tk arayüzü donmaz)"""
+    subprocess.Popen(_OPEN_DIR_CMD + [str(path)],
+                     stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                     close_fds=True, creationflags=_OPEN_DIR_FLAGS)
+
+
+# Linux reflink (copy-on-write) ioctl numarası
+_FICLONE = 0x40049409
+if sys.platform != 'win32':
+    import fcntl
+else:
+    fcntl = None
+
+# Dosya adı temizliği için bir kez hazırlanan tablolar ve desenler
+_INVALID_FILENAME_TRANS = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+_INVALID_FILENAME_TRANS_NOSPACE = str.maketrans({c: '_' for c in '<>:"/\\|?* '})
+_MULTI_UNDERSCORE_RE = re.compile(r'_{2,}')
+
+# Zaman damgalı çıktı klasörü adı (ör. 20250101_120000): rakam, '_' ve '-', en az bir rakam
+_TIMESTAMP_DIR_RE = re.compile(r'\A(?=.*\d)[\d_-]+\Z')
+
+
+@lru_cache(maxsize=4096)
+def _clean_filename_cached(filename: str, preserve_spaces: bool = False) -> str:
+    """Dosya adını temizle"""
+    if not preserve_spaces:
+        # Geçersiz karakterleri ve boşlukları tek geçişte alt çizgi yap
+        filename = filename.translate(_INVALID_FILENAME_TRANS_NOSPACE)
+
+        # Çoklu alt çizgileri tekle
+        filename = _MULTI_UNDERSCORE_RE.sub('_', filename)
+
+        # Baştan ve sondan alt çizgi kaldır
+        filename = filename.strip('_')
+    else:
+        # Geçersiz karakterleri alt çizgi yap, boşlukları koru ama çoklu boşlukları tekle
+        filename = ' '.join(filename.translate(_INVALID_FILENAME_TRANS).split())
+
+    # Boş ise varsayılan ad ver
+    if not filename:
+        filename = 'unnamed'
+
+    return filename
+
+
+# Süreç başına tek PDFGenerator (havuzdaki her işçi kendi örneğini bir kez kurar)
+_worker_pdf_generator = None
+
+
+def _render_class_pdf(class_name: str, photos_info: List[Dict], school_name: str,
+                      pdf_path: Path, photos_dir: Path) -> bool:
+    """Tek bir sınıfın fotoğraf listesi PDF'ini oluştur (süreç havuzunda çalışır)"""
+    global _worker_pdf_generator
+    if _worker_pdf_generator is None:
+        from pdf_generator import PDFGenerator
+        _worker_pdf_generator = PDFGenerator()
+
+    return _worker_pdf_generator.generate_class_photo_grid(
+        photos_with_names=photos_info,
+        class_name=class_name,
+        school_name=school_name,
+        output_path=pdf_path,
+        photos_dir=photos_dir
+    )
+
+
+# Sabit boyut yapılandırmaları (çıktı formatı sabit JPG); 'custom' çağrı anında kurulur
+_STATIC_SIZE_CONFIGS = MappingProxyType({
+    'e_okul': MappingProxyType({
+        'width_mm': 35,
+        'height_mm': 45,
+        'display_name': '35mm x 45mm (E-Okul)',
+        'folder_name': 'E-Okul',
+        'file_size_limit': (20, 150),  # KB cinsinden min-max
+        'quality': 85,
+        'dpi': 300,  # Minimum 300 DPI
+        'format': 'jpg'
+    }),
+    'acik_lise': MappingProxyType({
+        'width_px': 394,
+        'height_px': 512,
+        'display_name': '394px x 512px (Açık Lise)',
+        'folder_name': 'Acik_Lise',
+        'file_size_limit': (1, 150),  # KB cinsinden min-max
+        'quality': 90,
+        'dpi': 400,  # Açık Lise için zorunlu 400 DPI
+        'min_dpi': 400,  # Minimum DPI kontrolü
+        'format': 'jpg',
+        'force_biometric': True,  # Biyometrik kırpma zorla
+        'white_background': True  # Beyaz arka plan zorla
+    }),
+    'mebbis': MappingProxyType({
+        'width_px': 394,
+        'height_px': 512,
+        'display_name': '394px x 512px (MEBBIS)',
+        'folder_name': 'MEBBIS',
+        'file_size_limit': (1, 150),  # KB cinsinden min-max
+        'quality': 90,
+        'dpi': 300,  # 300 DPI
+        'format': 'jpg',
+        'force_biometric': True,  # Biyometrik kırpma zorla
+        'white_background': True  # Beyaz arka plan zorla
+    }),
+    'biometric': MappingProxyType({
+        'width_mm': 50,
+        'height_mm': 60,
+        'display_name': '50mm x 60mm (Biyometrik)',
+        'folder_name': 'Biyometrik',
+        'file_size_limit': None,  # Dosya boyutu sınırı yok
+        'quality': 95,
+        'dpi': 300,  # Minimum 300 DPI
+        'format': 'jpg'
+    }),
+    'vesikalik': MappingProxyType({
+        'width_mm': 45,
+        'height_mm': 60,
+        'display_name': '45mm x 60mm (Vesikalık)',
+        'folder_name': 'Vesikalik',
+        'file_size_limit': None,  # Dosya boyutu sınırı yok
+        'quality': 95,
+        'dpi': 300,  # Minimum 300 DPI
+        'format': 'jpg'
+    }),
+    'passport': MappingProxyType({
+        'width_mm': 35,
+        'height_mm': 35,
+        'display_name': '35mm x 35mm (Pasaport/Vize)',
+        'folder_name': 'Pasaport',
+        'file_size_limit': None,  # Dosya boyutu sınırı yok
+        'quality': 95,
+        'dpi': 300,  # Minimum 300 DPI
+        'format': 'jpg'
+    }),
+    'license': MappingProxyType({
+        'width_mm': 25,
+        'height_mm': 35,
+        'display_name': '25mm x 35mm (Ehliyet)',
+        'folder_name': 'Ehliyet',
+        'file_size_limit': None,  # Dosya boyutu sınırı yok
+        'quality': 95,
+        'dpi': 300,  # Minimum 300 DPI
+        'format': 'jpg'
+    }),
+    'original': MappingProxyType({
+        'width_mm': 0,
+        'height_mm': 0,
+        'display_name': 'Orijinal Boyut',
+        'folder_name': 'Orijinal',
+        'file_size_limit': None,
+        'quality': 95,
+        'dpi': 300,
+        'format': 'original'
+    })
+})
+
+# Özel boyut girdisi: 35, 35.5 veya 35,5
+_CUSTOM_NUMBER_RE = re.compile(r'^\d+([.,]\d+)?$')
+
+
+@dataclass
+class SizeContext:
+    """Bir boyutlandırma işlemi boyunca değişmeyen ayarlar"""
+    size_config: Dict
+    dimensions: object  # photo_processor.CropDimensions
+    crop_mode: str  # 'mebbis', 'acik_lise' veya 'auto'
+    white_background: bool
+    apply_watermark: bool
+    needs_size_opt: bool
+
 
 class ToolTip:
     """Tooltip sınıfı - Widget'lara açıklama baloncukları ekler"""
@@ -58,9 +254,10 @@ class ToolTip:
     def update_text(self, new_text):
         self.text = new_text
 
+from config import Config
 from excel_reader import ExcelReader
 from photo_processor import PhotoProcessor
-from utils import FileUtils, ValidationUtils, ProgressTracker
+from utils import FileUtils, ValidationUtils, ProgressTracker, VesiKolayUtils
 
 class ModernUI:
     """Modern UI stil sınıfı"""
@@ -117,6 +314,9 @@ class VesiKolayProApp:
         self.excel_file_path = None
         self.photo_directory = None
         self.excel_data = []
+        self._display_cache = []
+        self._class_index = {}
+        self._name_parts_cache = {}
         self.available_columns = []
         self.selected_naming_columns = []
         self.school_name = ""
@@ -124,6 +324,15 @@ class VesiKolayProApp:
         # Threading için
         self.current_operation = None
         self.cancel_requested = threading.Event()
+        self._photo_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+        self._pdf_generator = None
+        self._school_dir_cache = {}
+        self._watermark_cache = {}
+        self._font_cache = {}
+        self._log_buffer = deque()
+        self._log_lock = threading.Lock()
+        self._log_flush_scheduled = False
+        self._last_progress_update = 0.0
 
         # GUI oluştur
         self.setup_gui()
@@ -166,7 +375,6 @@ class VesiKolayProApp:
                         # ICO yoksa PNG'yi dene
                         png_icon_path = Path(__file__).parent / "images" / "vesikolaypro.png"
                         if png_icon_path.exists():
-                            from PIL import Image, ImageTk
                             # Görev çubuğu için daha büyük boyut
                             icon_image = Image.open(png_icon_path)
                             icon_image = icon_image.resize((48, 48), Image.Resampling.LANCZOS)
@@ -178,7 +386,6 @@ class VesiKolayProApp:
                 else:
                     png_icon_path = Path(__file__).parent / "images" / "vesikolaypro.png"
                     if png_icon_path.exists():
-                        from PIL import Image, ImageTk
                         # Linux için farklı boyutlarda ikonlar hazırla
                         icon_image = Image.open(png_icon_path)
                         
@@ -200,7 +407,6 @@ class VesiKolayProApp:
                         if ico_icon_path.exists():
                             try:
                                 # ICO dosyasını PNG'ye çevir
-                                from PIL import Image, ImageTk
                                 icon_image = Image.open(ico_icon_path)
                                 icon_image = icon_image.resize((48, 48), Image.Resampling.LANCZOS)
                                 self.icon_photo = ImageTk.PhotoImage(icon_image)
@@ -369,7 +575,6 @@ class VesiKolayProApp:
 
         # Program simgesi
         try:
-            from PIL import Image, ImageTk
             icon_path = Path(__file__).parent / "images" / "vesikolaypro.png"
             if icon_path.exists():
                 icon_image = Image.open(icon_path)
@@ -812,6 +1017,19 @@ class VesiKolayProApp:
         class_checkbox.pack(side=tk.LEFT)
         ToolTip(class_checkbox, "İşaretlenirse: Adlandırılmış fotoğraflar ayrıca sınıf bazında ayrı klasörlere de kopyalanır")
 
+        # Kopyalamak yerine taşıma
+        move_frame = tk.Frame(card_frame, bg=ModernUI.COLORS['card_bg'])
+        move_frame.pack(fill=tk.X, pady=(5, 0))
+
+        self.move_mode = tk.BooleanVar()
+        move_checkbox = tk.Checkbutton(move_frame,
+                                      text="Orijinal fotoğrafları koruma (kopyalamak yerine taşı)",
+                                      variable=self.move_mode,
+                                      bg=ModernUI.COLORS['card_bg'],
+                                      font=ModernUI.FONTS['body'])
+        move_checkbox.pack(side=tk.LEFT)
+        ToolTip(move_checkbox, "İşaretlenirse: Fotoğraflar kopyalanmaz, fotoğraf klasöründen adlandırılmış klasöre taşınır (daha hızlı, orijinaller silinir)")
+
     def create_photo_processing_card(self):
         """Fotoğraf işleme ayarları kartı"""
         card_frame = tk.Frame(self.scrollable_frame, 
@@ -1489,10 +1707,35 @@ class VesiKolayProApp:
 
     def log_message(self, message: str):
         """Durum metnine mesaj ekle"""
-        self.status_text.insert(tk.END, f"{message}\n")
+        self.log_messages([message])
+
+    def log_messages(self, messages: List[str]):
+        """Birden fazla mesajı tek seferde durum metnine ekle (thread'lerden güvenli)"""
+        if not messages:
+            return
+        if threading.current_thread() is not threading.main_thread():
+            # Çalışan thread'lerden gelen mesajlar tamponlanır, UI thread'inde toplu yazılır
+            with self._log_lock:
+                self._log_buffer.extend(messages)
+                schedule = not self._log_flush_scheduled
+                self._log_flush_scheduled = True
+            if schedule:
+                self.root.after(100, self._flush_log)
+            return
+        self.status_text.insert(tk.END, "\n".join(messages) + "\n")
         self.status_text.see(tk.END)
         self.root.update_idletasks()
 
+    def _flush_log(self):
+        """Tampondaki log mesajlarını UI thread'inde tek seferde yaz (her turda en fazla 200 satır)"""
+        with self._log_lock:
+            batch = [self._log_buffer.popleft() for _ in range(min(200, len(self._log_buffer)))]
+            remaining = bool(self._log_buffer)
+            self._log_flush_scheduled = remaining
+        self.log_messages(batch)
+        if remaining:
+            self.root.after(100, self._flush_log)
+
     def update_status(self, message: str, status_type: str = "info"):
         """Durum labelını güncelle - Renkli ikonlarla"""
         # Status ikonları
@@ -1536,7 +1779,12 @@ class VesiKolayProApp:
         self.root.update_idletasks()
 
     def update_progress_with_percentage(self, current, total):
-        """İlerleme çubuğunu yüzde ile güncelle"""
+        """İlerleme çubuğunu yüzde ile güncelle (en fazla saniyede ~30 kez)"""
+        now = time.monotonic()
+        if current < total and now - self._last_progress_update < 1 / 30:
+            return
+        self._last_progress_update = now
+
         if total > 0:
             percentage = (current / total) * 100
             self.progress['value'] = current
@@ -1572,6 +1820,43 @@ class VesiKolayProApp:
             self.excel_path_var.set(f"✅ {self.excel_file_path.name}")
             self.load_excel_data()
 
+    def _list_top_level_pngs(self, directory: Path) -> List[Path]:
+        """Dizinin kendisindeki PNG'ler (özyinelemesiz; glob("*.png") ile aynı eşleşme)"""
+        try:
+            with os.scandir(directory) as entries:
+                return [Path(entry.path) for entry in entries
+                        if os.path.normcase(entry.name).endswith('.png')
+                        and not entry.name.startswith('.') and entry.is_file()]
+        except OSError:
+            return []
+
+    def _scan_images(self, directory: Path):
+        """Dizini os.scandir ile tek geçişte tara: (sıralı tüm fotoğraflar, üst dizindeki PNG'ler)"""
+        supported_formats = self.photo_processor.supported_formats
+        images = []
+        pngs = []
+        pending = [(directory, True)]
+        while pending:
+            current, is_top = pending.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append((Path(entry.path), False))
+                            continue
+                        if not entry.is_file():
+                            continue
+                        ext = os.path.splitext(entry.name)[1].lower()
+                        if ext in supported_formats:
+                            path = Path(entry.path)
+                            images.append(path)
+                            if is_top and ext == '.png':
+                                pngs.append(path)
+            except OSError:
+                continue
+        images.sort()
+        return images, pngs
+
     def select_photo_directory(self):
         """Fotoğraf dizini seç"""
         directory = filedialog.askdirectory(title="Fotoğraf Dizini Seçin")
@@ -1581,8 +1866,8 @@ class VesiKolayProApp:
             self.photo_dir_var.set(f"✅ {self.photo_directory.name}")
             self.log_message(f"📂 Fotoğraf dizini seçildi: {self.photo_directory.name}")
             
-            # PNG dosyalarının varlığını kontrol et
-            png_files = list(self.photo_directory.glob("*.png"))
+            # PNG dosyalarının varlığını kontrol et (ana iş parçacığında; yalnızca üst dizin)
+            png_files = self._list_top_level_pngs(self.photo_directory)
             if png_files:
                 self.log_message(f"⚠️ PNG dosyaları tespit edildi: {len(png_files)} adet")
                 self.log_message("📋 NOT: En iyi sonuç için JPG formatındaki dosyaları kullanın")
@@ -1607,6 +1892,10 @@ class VesiKolayProApp:
                 self.excel_data = data_list
                 self.available_columns = available_columns
 
+                # Kayıt başına görüntü bilgilerini bir kez hesapla
+                self._name_parts_cache = {}
+                self._build_display_cache()
+
                 # Sütun seçeneklerini güncelle
                 self.column_combo['values'] = available_columns
                 if available_columns:
@@ -1630,6 +1919,154 @@ class VesiKolayProApp:
             self.log_message(f"❌ Excel dosyası okuma hatası: {e}")
             self.update_status("Excel okuma hatası")
 
+    def _build_display_cache(self):
+        """Öğrenci görüntü bilgilerini (ad, sınıf, numara) Excel yüklenirken bir kez hesapla"""
+        display_cache = []
+        class_index = {}
+        for i, record in enumerate(self.excel_data):
+            # Sınıf -> kayıt indeksleri (kimlik kartı sınıf filtresi için)
+            class_key = str(record.get('class_name', record.get('sınıf', '')))
+            class_index.setdefault(class_key, []).append(i)
+
+            # Ad bilgisini oluştur - daha kapsamlı sütun arama
+            name_parts = []
+            
+            # Tüm mevcut sütunları kontrol et
+            original_data = record.get('_original_data', {})
+            
+            # İlk ad için geniş sütun arama
+            first_name = ""
+            first_name_cols = [
+                'ad', 'Ad', 'AD', 'ADI', 'Adı', 'adi',
+                'name', 'first_name', 'firstName', 'First_Name',
+                'isim', 'İsim', 'ISIM', 'İSİM', 'Isim',
+                'adı', 'ismi'
+            ]
+            
+            for col in first_name_cols:
+                if col in original_data:
+                    value = str(original_data[col]).strip()
+                    if value and value.lower() not in ['nan', 'none', '', 'null']:
+                        first_name = value
+                        break
+            
+            # Soyad için geniş sütun arama
+            last_name = ""
+            last_name_cols = [
+                'soyad', 'Soyad', 'SOYAD', 'SOYADI', 'Soyadı', 'soyadi',
+                'surname', 'last_name', 'lastName', 'Last_Name',
+                'family_name', 'familyName', 'soyadı'
+            ]
+            
+            for col in last_name_cols:
+                if col in original_data:
+                    value = str(original_data[col]).strip()
+                    if value and value.lower() not in ['nan', 'none', '', 'null']:
+                        last_name = value
+                        break
+            
+            # Tam ad kombinasyonu sütunları da kontrol et
+            full_name_cols = [
+                'ad_soyad', 'Ad_Soyad', 'AD_SOYAD', 'AdSoyad',
+                'full_name', 'fullName', 'Full_Name',
+                'tam_ad', 'Tam_Ad', 'TAM_AD', 'TamAd',
+                'adsoyad', 'AdıSoyadı', 'isim_soyisim'
+            ]
+            
+            full_name_found = ""
+            for col in full_name_cols:
+                if col in original_data:
+                    value = str(original_data[col]).strip()
+                    if value and value.lower() not in ['nan', 'none', '', 'null']:
+                        full_name_found = value
+                        break
+            
+            # İsim oluşturma mantığı
+            if full_name_found:
+                # Tam ad bulunduysa onu kullan
+                name_parts = [full_name_found]
+            elif first_name and last_name:
+                # Ad ve soyad ayrı ayrı bulunduysa birleştir
+                name_parts = [first_name, last_name]
+            elif first_name:
+                # Sadece ad bulunduysa
+                name_parts = [first_name]
+            elif last_name:
+                # Sadece soyad bulunduysa
+                name_parts = [last_name]
+            else:
+                # Hiçbir ad bilgisi bulunamadıysa, diğer sütunları kontrol et
+                for col_name, col_value in original_data.items():
+                    value = str(col_value).strip()
+                    if (value and value.lower() not in ['nan', 'none', '', 'null'] and
+                        len(value) > 2 and not value.isdigit()):
+                        # İsim gibi görünen ilk değeri al
+                        name_parts = [value]
+                        break
+                
+                # Hala bulunamadıysa varsayılan isim ver
+                if not name_parts:
+                    name_parts = [f"Öğrenci_{i+1}"]
+            
+            student_name = " ".join(name_parts)
+            
+            # Sınıf bilgisini al
+            class_name = "Bilinmiyor"
+            class_cols = ['sınıf', 'Sınıf', 'SINIF', 'class', 'Class', 'class_name', 'sinif']
+            for col in class_cols:
+                if col in original_data:
+                    value = str(original_data[col]).strip()
+                    if value and value.lower() not in ['nan', 'none', '', 'null']:
+                        class_name = value
+                        break
+            
+            # Öğrenci numarasını al (varsa)
+            student_no = ""
+            no_cols = ['no', 'No', 'NO', 'numara', 'Numara', 'NUMARA', 'student_no', 'ogrenci_no']
+            for col in no_cols:
+                if col in original_data:
+                    value = str(original_data[col]).strip()
+                    if value and value.lower() not in ['nan', 'none', '', 'null']:
+                        student_no = value
+                        break
+            
+            # Görüntü metni oluştur
+            if student_no:
+                student_display = f"{student_name} ({student_no} - {class_name})"
+            else:
+                student_display = f"{student_name} ({class_name})"
+            
+            display_cache.append({
+                'student_name': student_name,
+                'class_name': class_name,
+                'student_no': student_no,
+                'display': student_display
+            })
+
+        self._display_cache = display_cache
+        self._class_index = class_index
+
+    def get_record_name_parts(self, selected_columns: List[str]) -> List[List[str]]:
+        """Seçili sütunlara göre her kaydın ad parçalarını döndür (sütun seçimi başına önbellekli)"""
+        key = tuple(selected_columns)
+        cached = self._name_parts_cache.get(key)
+        if cached is not None:
+            return cached
+
+        all_parts = []
+        for record in self.excel_data:
+            original_data = record.get('_original_data', {})
+            name_parts = []
+            for col in selected_columns:
+                if col in original_data:
+                    value = str(original_data[col]).strip()
+                    if value and value != 'nan':
+                        name_parts.append(value)
+            all_parts.append(name_parts)
+
+        self._name_parts_cache[key] = all_parts
+        return all_parts
+
     def add_column_to_selection(self):
         """Seçili sütunu ekle"""
         selection = self.available_listbox.curselection()
@@ -2651,130 +3088,28 @@ class VesiKolayProApp:
         scrollbar = ttk.Scrollbar(list_frame)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
+        # Liste içeriği tek bir Tcl değişkenine bağlı (tek atamada güncellenir)
+        student_list_var = tk.StringVar(value=())
         student_listbox = tk.Listbox(list_frame, selectmode=tk.MULTIPLE,
                                     font=ModernUI.FONTS['body'],
+                                    listvariable=student_list_var,
                                     yscrollcommand=scrollbar.set)
         student_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.config(command=student_listbox.yview)
         
-        # Öğrenci verilerini hazırla
-        student_list = []
-        for i, record in enumerate(self.excel_data):
-            # Ad bilgisini oluştur - daha kapsamlı sütun arama
-            name_parts = []
-            
-            # Tüm mevcut sütunları kontrol et
-            original_data = record.get('_original_data', {})
-            
-            # İlk ad için geniş sütun arama
-            first_name = ""
-            first_name_cols = [
-                'ad', 'Ad', 'AD', 'ADI', 'Adı', 'adi',
-                'name', 'first_name', 'firstName', 'First_Name',
-                'isim', 'İsim', 'ISIM', 'İSİM', 'Isim',
-                'adı', 'ismi'
-            ]
-            
-            for col in first_name_cols:
-                if col in original_data:
-                    value = str(original_data[col]).strip()
-                    if value and value.lower() not in ['nan', 'none', '', 'null']:
-                        first_name = value
-                        break
-            
-            # Soyad için geniş sütun arama
-            last_name = ""
-            last_name_cols = [
-                'soyad', 'Soyad', 'SOYAD', 'SOYADI', 'Soyadı', 'soyadi',
-                'surname', 'last_name', 'lastName', 'Last_Name',
-                'family_name', 'familyName', 'soyadı'
-            ]
-            
-            for col in last_name_cols:
-                if col in original_data:
-                    value = str(original_data[col]).strip()
-                    if value and value.lower() not in ['nan', 'none', '', 'null']:
-                        last_name = value
-                        break
-            
-            # Tam ad kombinasyonu sütunları da kontrol et
-            full_name_cols = [
-                'ad_soyad', 'Ad_Soyad', 'AD_SOYAD', 'AdSoyad',
-                'full_name', 'fullName', 'Full_Name',
-                'tam_ad', 'Tam_Ad', 'TAM_AD', 'TamAd',
-                'adsoyad', 'AdıSoyadı', 'isim_soyisim'
-            ]
-            
-            full_name_found = ""
-            for col in full_name_cols:
-                if col in original_data:
-                    value = str(original_data[col]).strip()
-                    if value and value.lower() not in ['nan', 'none', '', 'null']:
-                        full_name_found = value
-                        break
-            
-            # İsim oluşturma mantığı
-            if full_name_found:
-                # Tam ad bulunduysa onu kullan
-                name_parts = [full_name_found]
-            elif first_name and last_name:
-                # Ad ve soyad ayrı ayrı bulunduysa birleştir
-                name_parts = [first_name, last_name]
-            elif first_name:
-                # Sadece ad bulunduysa
-                name_parts = [first_name]
-            elif last_name:
-                # Sadece soyad bulunduysa
-                name_parts = [last_name]
-            else:
-                # Hiçbir ad bilgisi bulunamadıysa, diğer sütunları kontrol et
-                for col_name, col_value in original_data.items():
-                    value = str(col_value).strip()
-                    if (value and value.lower() not in ['nan', 'none', '', 'null'] and
-                        len(value) > 2 and not value.isdigit()):
-                        # İsim gibi görünen ilk değeri al
-                        name_parts = [value]
-                        break
-                
-                # Hala bulunamadıysa varsayılan isim ver
-                if not name_parts:
-                    name_parts = [f"Öğrenci_{i+1}"]
-            
-            student_name = " ".join(name_parts)
-            
-            # Sınıf bilgisini al
-            class_name = "Bilinmiyor"
-            class_cols = ['sınıf', 'Sınıf', 'SINIF', 'class', 'Class', 'class_name', 'sinif']
-            for col in class_cols:
-                if col in original_data:
-                    value = str(original_data[col]).strip()
-                    if value and value.lower() not in ['nan', 'none', '', 'null']:
-                        class_name = value
-                        break
-            
-            # Öğrenci numarasını al (varsa)
-            student_no = ""
-            no_cols = ['no', 'No', 'NO', 'numara', 'Numara', 'NUMARA', 'student_no', 'ogrenci_no']
-            for col in no_cols:
-                if col in original_data:
-                    value = str(original_data[col]).strip()
-                    if value and value.lower() not in ['nan', 'none', '', 'null']:
-                        student_no = value
-                        break
-            
-            # Görüntü metni oluştur
-            if student_no:
-                student_display = f"{student_name} ({student_no} - {class_name})"
-            else:
-                student_display = f"{student_name} ({class_name})"
-            
-            student_list.append((student_display, i))
+        # Öğrenci verilerini hazırla (Excel yüklenirken bir kez hesaplanır)
+        if len(self._display_cache) != len(self.excel_data):
+            self._build_display_cache()
+        student_list = [(info['display'], i) for i, info in enumerate(self._display_cache)]
+        student_search_keys = [display.lower() for display, _ in student_list]
+        filtered_list = []
         
         def update_student_list(filter_text=""):
-            student_listbox.delete(0, tk.END)
-            for display_name, index in student_list:
-                if filter_text.lower() in display_name.lower():
-                    student_listbox.insert(tk.END, display_name)
+            nonlocal filtered_list
+            filter_text = filter_text.lower()
+            filtered_list = [item for item, key in zip(student_list, student_search_keys)
+                             if filter_text in key]
+            student_list_var.set(tuple(display for display, _ in filtered_list))
         
         # İlk doldurma
         update_student_list()
@@ -2797,10 +3132,6 @@ class VesiKolayProApp:
                 return
             
             selected_students = []
-            current_filter = search_var.get().lower()
-            filtered_list = [(display, idx) for display, idx in student_list 
-                           if current_filter in display.lower()]
-            
             for listbox_index in indices:
                 if listbox_index < len(filtered_list):
                     _, original_index = filtered_list[listbox_index]
@@ -2852,25 +3183,23 @@ class VesiKolayProApp:
 
             # Ana çıktı dizini oluştur - VesiKolayPro konumunda
             from datetime import datetime
-            from utils import VesiKolayUtils
             
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             clean_school_name = self.clean_filename(self.school_name)
 
             # VesiKolayPro ana dizininde okul klasörü oluştur
-            school_main_dir = VesiKolayUtils.get_school_directory(self.school_name)
+            school_main_dir = self._get_school_dir()
 
             # Tarih-saat alt klasörü
             base_output_dir = school_main_dir / timestamp
 
             # Dizin var mı kontrol et
             if base_output_dir.exists():
-                import time
                 time.sleep(1)
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 base_output_dir = school_main_dir / timestamp
 
-            base_output_dir.mkdir(exist_ok=True)
+            base_output_dir.mkdir(parents=True, exist_ok=True)
 
             # Ana okul klasörünü sınıf değişkeninde sakla
             self.current_school_output_dir = school_main_dir
@@ -2892,79 +3221,113 @@ class VesiKolayProApp:
             renamed_photos = []
             photos_by_class = {}
 
+            # 1) Yeni dosya adlarını sırayla belirle (çakışma kontrolü sıralı olmalı)
+            rename_tasks = []
+            # Kullanılan dosya adları (dizin bir kez taranır, çakışmalar bellekte çözülür)
+            used_names = {entry.name.casefold() for entry in os.scandir(renamed_dir)}
+            name_counters = {}
+
+            # Döngü boyunca değişmeyen değerleri önceden al
+            separator = self.separator_var.get() if hasattr(self, 'separator_var') else "_"
+            preserve_spaces = separator == " "
+            clean_filename = self.clean_filename
+            is_cancelled = self.cancel_requested.is_set
+            organize_by_class = self.organize_by_class.get()
+            excel_data = self.excel_data
+            record_name_parts = self.get_record_name_parts(selected_columns)
+
+            # Tüm kayıtların temizlenmiş adlarını döngüden önce toplu hesapla
+            clean_names = [
+                clean_filename(separator.join(parts or [f"photo_{i+1}"]), preserve_spaces=preserve_spaces)
+                for i, parts in enumerate(record_name_parts[:total_count])
+            ]
+
             for i in range(total_count):
                 # İptal kontrolü
-                if self.cancel_requested.is_set():
-                    self.log_message("⏹️ İşlem kullanıcı tarafından iptal edildi.")
+                if is_cancelled():
                     break
 
                 try:
                     photo = photos[i]
-                    data_record = self.excel_data[i]
-
-                    # Yeni dosya adı oluştur (çoklu sütun desteği)
-                    name_parts = []
-                    for col in selected_columns:
-                        if col in data_record.get('_original_data', {}):
-                            value = str(data_record['_original_data'][col]).strip()
-                            if value and value != 'nan':
-                                name_parts.append(value)
-
-                    if not name_parts:
-                        name_parts = [f"photo_{i+1}"]
-
-                    # Dosya adını temizle ve oluştur (seçilen ayraçla)
-                    separator = self.separator_var.get() if hasattr(self, 'separator_var') else "_"
-                    if separator == " ":
-                        # Boşluk seçildiğinde gerçekten boşluk kullan
-                        base_name = " ".join(name_parts)
-                    else:
-                        base_name = separator.join(name_parts)
-                    clean_name = self.clean_filename(base_name, preserve_spaces=(separator == " "))
-                    new_filename = f"{clean_name}{photo.suffix}"
+                    data_record = excel_data[i]
+
+                    # Yeni dosya adı oluştur (çoklu sütun desteği, önceden hesaplanmış ad)
+                    new_filename = self._reserve_unique_filename(clean_names[i], photo.suffix, used_names, name_counters)
 
                     # Dosyayı kopyala ve yeniden adlandır
                     new_path = renamed_dir / new_filename
+                    rename_tasks.append((i, photo, data_record, new_path))
 
-                    # Aynı isimde dosya varsa numara ekle
-                    counter = 1
-                    original_new_path = new_path
-                    while new_path.exists():
-                        stem = original_new_path.stem
-                        suffix = original_new_path.suffix
-                        new_path = renamed_dir / f"{stem}_{counter}{suffix}"
-                        counter += 1
+                except Exception as e:
+                    error_count += 1
+                    self.log_message(f"❌ Hata {i+1}: {photos[i].name} - {e}")
 
-                    # Dosyayı kopyala
-                    FileUtils.copy_file_safe(photo, new_path, overwrite=True)
+            # 2) Kopyalama (veya taşıma) + watermark işlemlerini paralel çalıştır
+            apply_watermark = self.watermark_enabled.get()
+            move_originals = self.move_mode.get()
+            if move_originals:
+                self.log_message("🚚 Taşıma modu: Orijinal fotoğraflar adlandırılmış klasöre taşınacak")
 
-                    # Watermark ekle (eğer aktifse)
-                    if self.watermark_enabled.get():
-                        self.apply_watermark_to_photo(new_path)
+            def copy_and_watermark(photo, new_path):
+                if move_originals:
+                    self._move_file(photo, new_path)
+                else:
+                    self._fast_copy_file(photo, new_path)
 
-                    renamed_photos.append(new_path)
+                # Watermark ekle (eğer aktifse)
+                if apply_watermark:
+                    self.apply_watermark_to_photo(new_path)
 
-                    # Sınıf bilgisini al (sınıf organizasyonu için)
-                    if self.organize_by_class.get():
-                        class_name = self.photo_processor._get_class_name_from_record(data_record)
-                        if not class_name:
-                            class_name = "Sınıf_Bilgisi_Yok"
+            with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as executor:
+                futures = []
+                for task in rename_tasks:
+                    if is_cancelled():
+                        break
+                    futures.append((task, executor.submit(copy_and_watermark, task[1], task[3])))
+
+                # Sonuçları sırayla topla (arayüz güncellemeleri toplu yapılır)
+                log_buffer = []
+                last_ui_update = time.monotonic()
+                for done, ((i, photo, data_record, new_path), future) in enumerate(futures, 1):
+                    if is_cancelled():
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        break
 
-                        if class_name not in photos_by_class:
-                            photos_by_class[class_name] = []
-                        photos_by_class[class_name].append(new_path)
+                    try:
+                        future.result()
+                        renamed_photos.append(new_path)
 
-                    success_count += 1
-                    # Tüm işlemleri göster
-                    self.log_message(f"✅ {i+1:3d}. {photo.name} → {new_path.name}")
+                        # Sınıf bilgisini al (sınıf organizasyonu için)
+                        if organize_by_class:
+                            class_name = self.photo_processor._get_class_name_from_record(data_record)
+                            if not class_name:
+                                class_name = "Sınıf_Bilgisi_Yok"
 
-                except Exception as e:
-                    error_count += 1
-                    self.log_message(f"❌ Hata {i+1}: {photo.name} - {e}")
+                            if class_name not in photos_by_class:
+                                photos_by_class[class_name] = []
+                            photos_by_class[class_name].append(new_path)
 
-                # İlerlemeyi güncelle
-                self.progress['value'] = i + 1
-                self.update_status(f"İşleniyor: {i+1}/{total_count}")
+                        success_count += 1
+                        # Tüm işlemleri göster
+                        log_buffer.append(f"✅ {i+1:3d}. {photo.name} → {new_path.name}")
+
+                    except Exception as e:
+                        error_count += 1
+                        log_buffer.append(f"❌ Hata {i+1}: {photo.name} - {e}")
+
+                    # İlerlemeyi güncelle (her 50 fotoğrafta veya 100 ms'de bir)
+                    now = time.monotonic()
+                    if done % 50 == 0 or now - last_ui_update > 0.1 or done == len(futures):
+                        self.log_messages(log_buffer)
+                        log_buffer.clear()
+                        self.progress['value'] = i + 1
+                        self.update_status(f"İşleniyor: {i+1}/{total_count}")
+                        last_ui_update = now
+
+                self.log_messages(log_buffer)
+
+            if self.cancel_requested.is_set():
+                self.log_message("⏹️ İşlem kullanıcı tarafından iptal edildi.")
 
             # Sınıf bazında organizasyon
             if self.organize_by_class.get() and photos_by_class:
@@ -2983,7 +3346,12 @@ class VesiKolayProApp:
                         if self.cancel_requested.is_set():
                             break
                         class_photo_path = class_folder / photo_path.name
-                        FileUtils.copy_file_safe(photo_path, class_photo_path, overwrite=True)
+                        # Aynı disk üzerinde kopyalamak yerine hardlink oluştur
+                        try:
+                            os.link(photo_path, class_photo_path)
+                        except OSError:
+                            # Farklı disk / desteklenmeyen dosya sistemi veya hedef mevcut
+                            FileUtils.copy_file_safe(photo_path, class_photo_path, overwrite=True)
 
                     self.log_message(f"📁 {class_name}: {len(class_photos)} fotoğraf")
 
@@ -3033,8 +3401,10 @@ class VesiKolayProApp:
                 self.log_message("❌ Fotoğraf dizini gerekli.")
                 return
 
+            # Dizini tek geçişte tara (tüm fotoğraflar + üst dizindeki PNG'ler)
+            photos, png_files = self._scan_images(self.photo_directory)
+
             # PNG dosyaları için uyarı göster
-            png_files = list(self.photo_directory.glob("*.png"))
             if png_files:
                 result = messagebox.askyesno("PNG Dosyaları Tespit Edildi", 
                                            f"Dizinde {len(png_files)} adet PNG dosyası bulundu.\n\n"
@@ -3069,30 +3439,24 @@ class VesiKolayProApp:
                 self.log_message("❌ Boyut yapılandırması alınamadı.")
                 return
 
-            # Fotoğrafları al ve sırala
-            photos = self.photo_processor.get_image_files(self.photo_directory)
-            photos.sort()
-
             # Ana çıktı dizini oluştur - VesiKolayPro konumunda
             from datetime import datetime
-            from utils import VesiKolayUtils
             
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             clean_school_name = self.clean_filename(self.school_name)
 
             # VesiKolayPro ana dizininde okul klasörü oluştur
-            school_main_dir = VesiKolayUtils.get_school_directory(self.school_name)
+            school_main_dir = self._get_school_dir()
 
             # Tarih-saat alt klasörü
             base_output_dir = school_main_dir / timestamp
 
             if base_output_dir.exists():
-                import time
                 time.sleep(1)
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 base_output_dir = school_main_dir / timestamp
 
-            base_output_dir.mkdir(exist_ok=True)
+            base_output_dir.mkdir(parents=True, exist_ok=True)
 
             # Boyutlandırılmış fotoğraflar için dizin
             folder_suffix = "_named" if use_naming else "_original_names"
@@ -3117,76 +3481,92 @@ class VesiKolayProApp:
             success_count = 0
             error_count = 0
             processed_photos = []
+            log_buffer = []
+            used_names = {entry.name.casefold() for entry in os.scandir(sized_dir)}
+            name_counters = {}
+            last_ui_update = time.monotonic()
+
+            # Döngü boyunca değişmeyen değerleri önceden al
+            separator = self.separator_var.get() if hasattr(self, 'separator_var') else "_"
+            preserve_spaces = separator == " "
+            clean_filename = self.clean_filename
+            is_cancelled = self.cancel_requested.is_set
+            excel_data = self.excel_data
+            naming_count = len(excel_data) if use_naming and excel_data else 0
+            record_name_parts = self.get_record_name_parts(selected_columns) if naming_count else []
+
+            # Adlandırılacak kayıtların temizlenmiş adlarını döngüden önce toplu hesapla
+            clean_names = [
+                clean_filename(separator.join(parts or [f"photo_{i+1}"]), preserve_spaces=preserve_spaces)
+                for i, parts in enumerate(record_name_parts[:naming_count])
+            ]
 
+            # Seçilen formata göre dosya uzantısını belirle
+            # output_format = size_config.get('format', 'jpg') # Çıktı formatı seçimi kaldırıldı
+            file_extension = ".jpg" # Sabit JPG
+
+            # 1) Çıktı adlarını sırayla belirle (çakışma kontrolü sıralı olmalı)
+            crop_tasks = []
             for i in range(total_count):
-                # İptal kontrolü
-                if self.cancel_requested.is_set():
-                    self.log_message("⏹️ İşlem kullanıcı tarafından iptal edildi.")
-                    break
+                photo = photos[i]
 
-                try:
-                    photo = photos[i]
+                if i < naming_count:
+                    # Adlandırma yapılacak - önceden hesaplanmış adı kullan
+                    clean_name = clean_names[i]
+                else:
+                    # Orijinal dosya adını kullan
+                    clean_name = photo.stem
 
-                    if use_naming and self.excel_data and i < len(self.excel_data):
-                        # Adlandırma yapılacak
-                        data_record = self.excel_data[i]
-
-                        # Yeni dosya adı oluştur
-                        name_parts = []
-                        for col in selected_columns:
-                            if col in data_record.get('_original_data', {}):
-                                value = str(data_record['_original_data'][col]).strip()
-                                if value and value != 'nan':
-                                    name_parts.append(value)
-
-                        if not name_parts:
-                            name_parts = [f"photo_{i+1}"]
-
-                        # Dosya adını temizle ve oluştur
-                        separator = self.separator_var.get() if hasattr(self, 'separator_var') else "_"
-                        if separator == " ":
-                            base_name = " ".join(name_parts)
-                        else:
-                            base_name = separator.join(name_parts)
-                        clean_name = self.clean_filename(base_name, preserve_spaces=(separator == " "))
-                    else:
-                        # Orijinal dosya adını kullan
-                        clean_name = photo.stem
+                # Aynı isimde dosya varsa numara ekle
+                output_filename = self._reserve_unique_filename(clean_name, file_extension, used_names, name_counters)
 
-                    # Seçilen formata göre dosya uzantısını belirle
-                    # output_format = size_config.get('format', 'jpg') # Çıktı formatı seçimi kaldırıldı
-                    file_extension = ".jpg" # Sabit JPG
+                # Çıktı dosya yolu
+                crop_tasks.append((i, photo, sized_dir / output_filename))
 
-                    # Çıktı dosya yolu
-                    output_path = sized_dir / f"{clean_name}{file_extension}"
+            # 2) Fotoğrafları paylaşılan thread havuzunda kırp ve boyutlandır
+            # (OpenCV ve Pillow ağır işlemlerde GIL'i bırakır)
+            size_context = self._prepare_size_context(size_config)
+            futures = []
+            for i, photo, output_path in crop_tasks:
+                if is_cancelled():
+                    break
+                futures.append(self._photo_pool.submit(self.process_single_photo_fast, photo, output_path, size_context))
 
-                    # Aynı isimde dosya varsa numara ekle
-                    counter = 1
-                    original_output_path = output_path
-                    while output_path.exists():
-                        stem = original_output_path.stem
-                        suffix = original_output_path.suffix
-                        output_path = sized_dir / f"{stem}_{counter}{suffix}"
-                        counter += 1
+            for done, ((i, photo, output_path), future) in enumerate(zip(crop_tasks, futures), 1):
+                # İptal kontrolü
+                if is_cancelled():
+                    for pending in futures:
+                        pending.cancel()
+                    # Başlamış işler iptal edilemez; iptal bildirilmeden önce sized_dir'e yazmaları bitmeli
+                    wait(futures)
+                    log_buffer.append("⏹️ İşlem kullanıcı tarafından iptal edildi.")
+                    break
 
-                    # Fotoğrafı kırp ve boyutlandır
-                    success = self.process_single_photo(photo, output_path, size_config)
+                try:
+                    success = future.result()
 
                     if success:
                         processed_photos.append(output_path)
                         success_count += 1
-                        self.log_message(f"✅ {i+1:3d}. {photo.name} → {output_path.name}")
+                        log_buffer.append(f"✅ {i+1:3d}. {photo.name} → {output_path.name}")
                     else:
                         error_count += 1
-                        self.log_message(f"❌ {i+1:3d}. {photo.name} - Boyutlandırma başarısız")
+                        log_buffer.append(f"❌ {i+1:3d}. {photo.name} - Boyutlandırma başarısız")
 
                 except Exception as e:
                     error_count += 1
-                    self.log_message(f"❌ Hata {i+1}: {photo.name} - {e}")
+                    log_buffer.append(f"❌ Hata {i+1}: {photo.name} - {e}")
 
-                # İlerlemeyi güncelle
-                self.progress['value'] = i + 1
-                self.update_status(f"İşleniyor: {i+1}/{total_count}")
+                # İlerlemeyi güncelle (her 50 fotoğrafta veya 100 ms'de bir)
+                now = time.monotonic()
+                if done % 50 == 0 or now - last_ui_update > 0.1 or done == total_count:
+                    self.log_messages(log_buffer)
+                    log_buffer.clear()
+                    self.progress['value'] = done
+                    self.update_status(f"İşleniyor: {done}/{total_count}")
+                    last_ui_update = now
+
+            self.log_messages(log_buffer)
 
             # Sonuçları göster
             if not self.cancel_requested.is_set():
@@ -3234,22 +3614,16 @@ class VesiKolayProApp:
 
             self.update_status("PDF dosyaları oluşturuluyor...")
 
-            from pdf_generator import PDFGenerator
-            from utils import VesiKolayUtils
 
             # VesiKolayPro ana dizinindeki okul klasörünü bul
-            school_main_dir = VesiKolayUtils.get_school_directory(self.school_name)
+            school_main_dir = self._get_school_dir()
 
             # En son oluşturulan tarih-saat klasörünü bul
-            timestamp_dirs = [d for d in school_main_dir.iterdir() 
-                             if d.is_dir() and d.name.replace('_', '').replace('-', '').isdigit()]
+            base_output_dir = self._find_latest_timestamp_dir(school_main_dir)
 
-            if not timestamp_dirs:
+            if base_output_dir is None:
                 self.log_message("❌ Önce fotoğrafları adlandırın.")
                 return
-
-            # En son oluşturulan dizini seç
-            base_output_dir = max(timestamp_dirs, key=lambda x: x.stat().st_mtime)
             renamed_dir = base_output_dir / "renamed"
 
             if not renamed_dir.exists():
@@ -3260,9 +3634,11 @@ class VesiKolayProApp:
             pdf_dir = base_output_dir / "pdfs"
             pdf_dir.mkdir(parents=True, exist_ok=True)
 
-            # Adlandırılmış fotoğrafları al
+            # Adlandırılmış fotoğrafları al (get_image_files sıralı döndürür)
             renamed_photos = self.photo_processor.get_image_files(renamed_dir)
-            renamed_photos.sort()
+
+            # Kayıt başına ad parçaları (seçili sütunlar için önbellekli)
+            record_name_parts = self.get_record_name_parts(selected_columns)
 
             # Sınıf bazında fotoğrafları grupla - manuel olarak yapıyoruz
             photos_by_class = {}
@@ -3280,15 +3656,7 @@ class VesiKolayProApp:
                         class_name = 'Sınıf_Bilgisi_Yok'
 
                     # Öğrenci adını oluştur
-                    name_parts = []
-                    for col in selected_columns:
-                        if col in record.get('_original_data', {}):
-                            value = str(record['_original_data'][col]).strip()
-                            if value and value != 'nan':
-                                name_parts.append(value)
-
-                    if not name_parts:
-                        name_parts = [f"Öğrenci_{i+1}"]
+                    name_parts = record_name_parts[i] or [f"Öğrenci_{i+1}"]
 
                     student_name = " ".join(name_parts)
 
@@ -3307,49 +3675,67 @@ class VesiKolayProApp:
                 self.update_status("PDF oluşturulamadı - Sınıf bilgisi yok")
                 return
 
-            # PDF generator
-            pdf_generator = PDFGenerator()
-
             self.log_message(f"\n📄 === PDF OLUŞTURMA BAŞLIYOR ===")
             self.log_message(f"📂 {len(photos_by_class)} sınıf için PDF oluşturulacak")
 
             success_count = 0
             total_classes = len(photos_by_class)
 
-            for i, (class_name, photos_info) in enumerate(photos_by_class.items()):
-                if self.cancel_requested.is_set():
-                    break
-
+            # Okul adını al
+            school_name = self.school_name if self.school_name else "VesiKolay Pro"
+
+            # Sınıf başına görev listesi
+            pdf_tasks = []
+            for class_name, photos_info in photos_by_class.items():
+                # Güvenli dosya adı oluştur
+                safe_class_name = self.clean_filename(class_name)
+                pdf_path = pdf_dir / f"{safe_class_name}_fotoğraf_listesi.pdf"
+                pdf_tasks.append((class_name, photos_info, school_name, pdf_path, renamed_dir))
+
+            # En kalabalık sınıflar önce başlasın; büyük PDF'lerin üretim ve
+            # diske yazma süresi küçüklerin arkasında kuyrukta beklemez
+            pdf_tasks.sort(key=lambda task: len(task[1]), reverse=True)
+
+            # Her sınıfın PDF'i bağımsız ve CPU yoğun - ayrı süreçlerde paralel oluştur.
+            # Paketlenmiş (PyInstaller) sürümde freeze_support çağrılmadığından başlatılan süreçler
+            # giriş noktasını yeniden çalıştırır; orada sıralı üretime düşülür
+            if getattr(sys, 'frozen', False):
+                executor = ThreadPoolExecutor(max_workers=1)
+            else:
                 try:
-                    self.update_status(f"PDF oluşturuluyor: {i+1}/{total_classes}")
-
-                    # Güvenli dosya adı oluştur
-                    safe_class_name = self.clean_filename(class_name)
-                    pdf_path = pdf_dir / f"{safe_class_name}_fotoğraf_listesi.pdf"
-
-                    # Okul adını al
-                    school_name = self.school_name if self.school_name else "VesiKolay Pro"
-
-                    # PDF oluştur - fotoğraf grid formatında
-                    success = pdf_generator.generate_class_photo_grid(
-                        photos_with_names=photos_info,
-                        class_name=class_name,
-                        school_name=school_name,
-                        output_path=pdf_path,
-                        photos_dir=renamed_dir
-                    )
-                    
-                    # İlerleme güncelleme
-                    self.update_progress_with_percentage(i + 1, total_classes)
+                    # Çok iş parçacıklı Tk sürecini fork etmemek için spawn (PDFGenerator havuzuyla aynı)
+                    executor = ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, total_classes),
+                                                   mp_context=multiprocessing.get_context('spawn'))
+                except Exception as e:
+                    self.log_message(f"⚠️ Paralel PDF oluşturma başlatılamadı, sıralı devam ediliyor: {e}")
+                    executor = ThreadPoolExecutor(max_workers=1)
 
-                    if success:
-                        success_count += 1
-                        self.log_message(f"✅ {class_name}: {pdf_path.name} ({len(photos_info)} fotoğraf)")
-                    else:
-                        self.log_message(f"❌ {class_name}: PDF oluşturulamadı")
+            with executor:
+                futures = {executor.submit(_render_class_pdf, *task): task for task in pdf_tasks}
 
-                except Exception as e:
-                    self.log_message(f"❌ {class_name}: {e}")
+                for done, future in enumerate(as_completed(futures), 1):
+                    if self.cancel_requested.is_set():
+                        for pending in futures:
+                            pending.cancel()
+                        break
+
+                    class_name, photos_info, _, pdf_path, _ = futures[future]
+                    self.update_status(f"PDF oluşturuluyor: {done}/{total_classes}")
+
+                    try:
+                        success = future.result()
+
+                        # İlerleme güncelleme
+                        self.update_progress_with_percentage(done, total_classes)
+
+                        if success:
+                            success_count += 1
+                            self.log_message(f"✅ {class_name}: {pdf_path.name} ({len(photos_info)} fotoğraf)")
+                        else:
+                            self.log_message(f"❌ {class_name}: PDF oluşturulamadı")
+
+                    except Exception as e:
+                        self.log_message(f"❌ {class_name}: {e}")
 
             if not self.cancel_requested.is_set():
                 self.log_message(f"\n🎉 PDF oluşturma tamamlandı!")
@@ -3388,22 +3774,16 @@ class VesiKolayProApp:
 
             self.update_status("Kimlik kartları oluşturuluyor...")
 
-            from pdf_generator import PDFGenerator
-            from utils import VesiKolayUtils
 
             # VesiKolayPro ana dizinindeki okul klasörünü bul
-            school_main_dir = VesiKolayUtils.get_school_directory(self.school_name)
+            school_main_dir = self._get_school_dir()
 
             # En son oluşturulan tarih-saat klasörünü bul
-            timestamp_dirs = [d for d in school_main_dir.iterdir() 
-                             if d.is_dir() and d.name.replace('_', '').replace('-', '').isdigit()]
+            base_output_dir = self._find_latest_timestamp_dir(school_main_dir)
 
-            if not timestamp_dirs:
+            if base_output_dir is None:
                 self.log_message("❌ Önce fotoğrafları adlandırın.")
                 return
-
-            # En son oluşturulan dizini seç
-            base_output_dir = max(timestamp_dirs, key=lambda x: x.stat().st_mtime)
             renamed_dir = base_output_dir / "renamed"
 
             if not renamed_dir.exists():
@@ -3414,8 +3794,8 @@ class VesiKolayProApp:
             id_card_dir = base_output_dir / "id_cards"
             id_card_dir.mkdir(parents=True, exist_ok=True)
 
-            # PDF generator
-            pdf_generator = PDFGenerator()
+            # PDF generator (oturum boyunca paylaşılır)
+            pdf_generator = self._get_pdf_generator()
 
             # Set school logo path if available
             if hasattr(self, 'school_logo_path'):
@@ -3427,12 +3807,14 @@ class VesiKolayProApp:
             
             # İşlenecek kayıtları belirle
             if scope_type == "class" and selected_items:
-                # Sınıf bazlı filtreleme
-                filtered_data = []
-                for i, record in enumerate(self.excel_data):
-                    class_name = record.get('class_name', record.get('sınıf', ''))
-                    if str(class_name) in selected_items:
-                        filtered_data.append((i, record))
+                # Sınıf bazlı filtreleme (Excel yüklenirken kurulan sınıf indeksinden)
+                if len(self._display_cache) != len(self.excel_data):
+                    self._build_display_cache()
+                selected_indices = sorted(
+                    i for class_name in set(selected_items)
+                    for i in self._class_index.get(str(class_name), ())
+                )
+                filtered_data = [(i, self.excel_data[i]) for i in selected_indices]
                 self.log_message(f"📚 Seçili sınıflar: {', '.join(selected_items)}")
                 self.log_message(f"👥 Filtrelenmiş öğrenci sayısı: {len(filtered_data)}")
             elif scope_type == "individual" and selected_items:
@@ -3447,46 +3829,6 @@ class VesiKolayProApp:
                 filtered_data = [(i, record) for i, record in enumerate(self.excel_data)]
                 self.log_message(f"📋 Tüm öğrenci listesi: {len(filtered_data)} öğrenci")
 
-            # Öğrenci verilerini hazırla ve fotoğraf dosya adlarını eşleştir
-            students_for_cards = []
-            renamed_photos = self.photo_processor.get_image_files(renamed_dir)
-
-            for original_index, record in filtered_data:
-                if self.cancel_requested.is_set():
-                    break
-
-                # Fotoğraf dosya adını belirle
-                photo_filename = ""
-                if original_index < len(renamed_photos):
-                    photo_filename = renamed_photos[original_index].name
-
-                # Kullanıcının seçtiği sütunlardan veri oluştur
-                student_data = {
-                    'school_name': self.school_name,
-                    'photo_filename': photo_filename,
-                    'school_year': self.school_year_var.get() if hasattr(self, 'school_year_var') else "2025-2026",
-                    'selected_columns': getattr(self, 'id_card_selected_columns', []),
-                    'column_data': {}
-                }
-                
-                # Seçili sütunlar için verileri ekle
-                if hasattr(self, 'id_card_selected_columns'):
-                    for column in self.id_card_selected_columns:
-                        if column in record.get('_original_data', {}):
-                            value = str(record['_original_data'][column]).strip()
-                            if value and value != 'nan':
-                                student_data['column_data'][column] = value
-                            else:
-                                student_data['column_data'][column] = ""
-                        else:
-                            student_data['column_data'][column] = ""
-                
-                # Gradient renk ayarlarını ekle
-                if hasattr(self, 'id_card_color_settings'):
-                    student_data.update(self.id_card_color_settings)
-                
-                students_for_cards.append(student_data)
-
             # Logo yollarını kimlik kartı verilerine ekle
             main_logo_path = None
             second_logo_path = None
@@ -3501,21 +3843,61 @@ class VesiKolayProApp:
                     main_logo_path = self.id_card_logo_path
                 elif hasattr(self, 'school_logo_path') and self.school_logo_path:
                     main_logo_path = self.school_logo_path
-            
-            for student in students_for_cards:
-                if main_logo_path:
-                    student['main_logo_path'] = str(main_logo_path)
-                    student['logo_path'] = str(main_logo_path)  # Backward compatibility
-                if second_logo_path:
-                    student['second_logo_path'] = str(second_logo_path)
-                
-                # Add all ID card settings
-                if hasattr(self, 'id_card_settings'):
-                    student.update(self.id_card_settings)
 
-            if self.cancel_requested.is_set():
-                self.update_status("İşlem iptal edildi")
-                return
+            # Tüm kartlarda ortak olan alanları bir kez hesapla
+            renamed_photos = self.photo_processor.get_image_files(renamed_dir)
+            school_year = self.school_year_var.get() if hasattr(self, 'school_year_var') else "2025-2026"
+            selected_card_columns = getattr(self, 'id_card_selected_columns', [])
+            color_settings = getattr(self, 'id_card_color_settings', None)
+            card_settings = getattr(self, 'id_card_settings', None)
+            main_logo_str = str(main_logo_path) if main_logo_path else None
+            second_logo_str = str(second_logo_path) if second_logo_path else None
+            is_cancelled = self.cancel_requested.is_set
+
+            def iter_students_for_cards():
+                """Kart verilerini tek tek üret (tüm liste bellekte tutulmaz)"""
+                for original_index, record in filtered_data:
+                    if is_cancelled():
+                        return
+
+                    # Fotoğraf dosya adını belirle
+                    photo_filename = ""
+                    if original_index < len(renamed_photos):
+                        photo_filename = renamed_photos[original_index].name
+
+                    # Kullanıcının seçtiği sütunlardan veri oluştur
+                    # (ExcelReader değerleri yüklerken str + strip yapar, NaN hücreleri atlar)
+                    original_data = record.get('_original_data', {})
+                    column_data = {}
+                    for column in selected_card_columns:
+                        value = original_data.get(column, "")
+                        column_data[column] = "" if value == 'nan' else value
+
+                    student_data = {
+                        'school_name': self.school_name,
+                        'photo_filename': photo_filename,
+                        'school_year': school_year,
+                        'selected_columns': selected_card_columns,
+                        'column_data': column_data
+                    }
+
+                    # Gradient renk ayarlarını ekle
+                    if color_settings:
+                        student_data.update(color_settings)
+
+                    if main_logo_str:
+                        student_data['main_logo_path'] = main_logo_str
+                        student_data['logo_path'] = main_logo_str  # Backward compatibility
+                    if second_logo_str:
+                        student_data['second_logo_path'] = second_logo_str
+
+                    # Add all ID card settings
+                    if card_settings:
+                        student_data.update(card_settings)
+
+                    yield student_data
+
+            card_total = len(filtered_data)
 
             # Okul adını temizle
             clean_school_name = self.clean_filename(self.school_name)
@@ -3531,34 +3913,47 @@ class VesiKolayProApp:
             else:
                 pdf_path = id_card_dir / f"{clean_school_name}_ogrenci_kimlik_kartlari.pdf"
 
-            # İlerleme callback fonksiyonu tanımla
+            # İlerleme callback fonksiyonu tanımla (en fazla ~20 Hz, tek after çağrısı)
+            last_progress_post = 0.0
+
             def progress_callback(progress_percent, message):
-                # Ana thread'e güvenli şekilde ilerleme güncellemesi gönder
-                self.root.after(0, lambda: self.update_progress_with_percentage(
-                    int(progress_percent), 100))
-                self.root.after(0, lambda: self.update_status(message, "processing"))
+                nonlocal last_progress_post
+                now = time.monotonic()
+                if progress_percent < 100 and now - last_progress_post < 0.05:
+                    return
+                last_progress_post = now
+
+                # Ana thread'e güvenli şekilde ilerleme ve durum güncellemesini birlikte gönder
+                def post(percent=int(progress_percent), text=message):
+                    self.update_progress_with_percentage(percent, 100)
+                    self.update_status(text, "processing")
+
+                self.root.after(0, post)
 
             success = pdf_generator.generate_id_cards(
-                people=students_for_cards,
+                people=iter_students_for_cards(),
                 template_type="student", 
                 output_path=pdf_path,
                 photos_dir=renamed_dir,
-                progress_callback=progress_callback
+                progress_callback=progress_callback,
+                total_people=card_total,
+                is_cancelled=is_cancelled
             )
 
             if success and not self.cancel_requested.is_set():
                 self.log_message(f"\n🆔 === KİMLİK KARTLARI OLUŞTURULDU ===")
-                self.log_message(f"✅ {len(students_for_cards)} öğrenci kimlik kartı")
+                self.log_message(f"✅ {card_total} öğrenci kimlik kartı")
                 self.log_message(f"📁 Çıktı: {pdf_path.name}")
 
-                self.update_status(f"Kimlik kartları tamamlandı: {len(students_for_cards)} öğrenci")
+                self.update_status(f"Kimlik kartları tamamlandı: {card_total} öğrenci")
 
                 # Kimlik kartları erişim butonunu aktif et
                 self.root.after(0, lambda: self.id_cards_access_button.config(state="normal"))
 
-                result_msg = f"🆔 Kimlik kartları oluşturuldu!\n\n✅ {len(students_for_cards)} öğrenci\n📁 Konum: {id_card_dir.name}"
+                result_msg = f"🆔 Kimlik kartları oluşturuldu!\n\n✅ {card_total} öğrenci\n📁 Konum: {id_card_dir.name}"
                 self.root.after(0, lambda: messagebox.showinfo("Başarılı", result_msg))
             elif self.cancel_requested.is_set():
+                # İptalde generate_id_cards eksik PDF yazmaz; mevcut dosyaya dokunulmaz
                 self.update_status("İşlem iptal edildi")
             else:
                 self.log_message("❌ Kimlik kartları oluşturulamadı.")
@@ -3588,217 +3983,159 @@ class VesiKolayProApp:
         """Seçilen boyut yapılandırmasını döndür"""
         selected_display = self.size_combo.get()
         size_type = self.size_display_values.get(selected_display, "e_okul")
+
+        if size_type != 'custom':
+            return _STATIC_SIZE_CONFIGS.get(size_type)
+
         # output_format = self.output_format.get() # Çıktı formatı seçimi kaldırıldı
         output_format = 'jpg' # Sabit JPG
 
-        configurations = {
-            'e_okul': {
-                'width_mm': 35,
-                'height_mm': 45,
-                'display_name': '35mm x 45mm (E-Okul)',
-                'folder_name': 'E-Okul',
-                'file_size_limit': (20, 150),  # KB cinsinden min-max
-                'quality': 85,
-                'dpi': 300,  # Minimum 300 DPI
-                'format': output_format
-            },
-            'acik_lise': {
-                'width_px': 394,
-                'height_px': 512,
-                'display_name': '394px x 512px (Açık Lise)',
-                'folder_name': 'Acik_Lise',
-                'file_size_limit': (1, 150),  # KB cinsinden min-max
-                'quality': 90,
-                'dpi': 400,  # Açık Lise için zorunlu 400 DPI
-                'min_dpi': 400,  # Minimum DPI kontrolü
-                'format': 'jpg',
-                'force_biometric': True,  # Biyometrik kırpma zorla
-                'white_background': True  # Beyaz arka plan zorla
-            },
-            'mebbis': {
-                'width_px': 394,
-                'height_px': 512,
-                'display_name': '394px x 512px (MEBBIS)',
-                'folder_name': 'MEBBIS',
-                'file_size_limit': (1, 150),  # KB cinsinden min-max
-                'quality': 90,
-                'dpi': 300,  # 300 DPI
-                'format': 'jpg',
-                'force_biometric': True,  # Biyometrik kırpma zorla
-                'white_background': True  # Beyaz arka plan zorla
-            },
-            'biometric': {
-                'width_mm': 50,
-                'height_mm': 60,
-                'display_name': '50mm x 60mm (Biyometrik)',
-                'folder_name': 'Biyometrik',
-                'file_size_limit': None,  # Dosya boyutu sınırı yok
-                'quality': 95,
-                'dpi': 300,  # Minimum 300 DPI
-                'format': output_format
-            },
-            'vesikalik': {
-                'width_mm': 45,
-                'height_mm': 60,
-                'display_name': '45mm x 60mm (Vesikalık)',
-                'folder_name': 'Vesikalik',
-                'file_size_limit': None,  # Dosya boyutu sınırı yok
-                'quality': 95,
-                'dpi': 300,  # Minimum 300 DPI
-                'format': output_format
-            },
-            'passport': {
-                'width_mm': 35,
-                'height_mm': 35,
-                'display_name': '35mm x 35mm (Pasaport/Vize)',
-                'folder_name': 'Pasaport',
-                'file_size_limit': None,  # Dosya boyutu sınırı yok
-                'quality': 95,
-                'dpi': 300,  # Minimum 300 DPI
-                'format': output_format
-            },
-            'license': {
-                'width_mm': 25,
-                'height_mm': 35,
-                'display_name': '25mm x 35mm (Ehliyet)',
-                'folder_name': 'Ehliyet',
-                'file_size_limit': None,  # Dosya boyutu sınırı yok
-                'quality': 95,
-                'dpi': 300,  # Minimum 300 DPI
-                'format': output_format
-            },
-            'custom': {
-                'width': float(self.custom_width_var.get()) if self.custom_width_var.get().replace('.', '').replace(',', '').isdigit() else 35,
-                'height': float(self.custom_height_var.get()) if self.custom_height_var.get().replace('.', '').replace(',', '').isdigit() else 45,
-                'width_mm': float(self.custom_width_var.get()) if self.custom_width_var.get().replace('.', '').replace(',', '').isdigit() else 35,
-                'height_mm': float(self.custom_height_var.get()) if self.custom_height_var.get().replace('.', '').replace(',', '').isdigit() else 45,
-                'unit': self.custom_unit_var.get() if hasattr(self, 'custom_unit_var') else 'mm',
-                'display_name': f'{self.custom_width_var.get()}{self.custom_unit_var.get() if hasattr(self, "custom_unit_var") else "mm"} x {self.custom_height_var.get()}{self.custom_unit_var.get() if hasattr(self, "custom_unit_var") else "mm"} (Özel)',
-                'folder_name': 'Ozel_Boyut',
-                'file_size_limit': self._get_custom_file_size_limit(),
-                'quality': 95,
-                'dpi': int(self.custom_dpi_var.get()) if hasattr(self, 'custom_dpi_var') and self.custom_dpi_var.get().isdigit() else 300,
-                'format': output_format
-            },
-            'original': {
-                'width_mm': 0,
-                'height_mm': 0,
-                'display_name': 'Orijinal Boyut',
-                'folder_name': 'Orijinal',
-                'file_size_limit': None,
-                'quality': 95,
-                'dpi': 300,
-                'format': 'original'
-            }
+        def parse_custom(raw, default):
+            raw = raw.strip()
+            return float(raw.replace(',', '.')) if _CUSTOM_NUMBER_RE.match(raw) else default
+
+        width_raw = self.custom_width_var.get()
+        height_raw = self.custom_height_var.get()
+        width = parse_custom(width_raw, 35)
+        height = parse_custom(height_raw, 45)
+        unit = self.custom_unit_var.get() if hasattr(self, 'custom_unit_var') else 'mm'
+        dpi_raw = self.custom_dpi_var.get() if hasattr(self, 'custom_dpi_var') else ''
+
+        return {
+            'width': width,
+            'height': height,
+            'width_mm': width,
+            'height_mm': height,
+            'unit': unit,
+            'display_name': f'{width_raw}{unit} x {height_raw}{unit} (Özel)',
+            'folder_name': 'Ozel_Boyut',
+            'file_size_limit': self._get_custom_file_size_limit(),
+            'quality': 95,
+            'dpi': int(dpi_raw) if dpi_raw.isdigit() else 300,
+            'format': output_format
         }
 
-        return configurations.get(size_type)
+    def _prepare_size_context(self, size_config) -> "SizeContext":
+        """Boyut yapılandırmasından işlem boyunca değişmeyen bağlamı bir kez hazırla"""
+        from photo_processor import CropDimensions
+
+        # Boyutları belirle (pixel veya mm)
+        dpi = size_config.get('dpi', 300)
+        min_dpi = size_config.get('min_dpi', None)
+
+        if 'width_px' in size_config and 'height_px' in size_config:
+            # Pixel boyutları (Açık Lise gibi)
+            dimensions = CropDimensions(
+                width=size_config['width_px'],
+                height=size_config['height_px'],
+                unit='px',
+                dpi=dpi,
+                min_dpi=min_dpi
+            )
+        elif size_config.get('unit') == 'px' or 'width_px' in size_config:
+            # Pixel boyutları
+            width = size_config.get('width_px', size_config.get('width', 300))
+            height = size_config.get('height_px', size_config.get('height', 400))
+            dimensions = CropDimensions(
+                width=int(width),
+                height=int(height),
+                unit='px',
+                dpi=dpi,
+                min_dpi=min_dpi
+            )
+        elif size_config.get('unit') == 'cm':
+            # cm boyutları
+            width = size_config.get('width_cm', size_config.get('width', 3.5))
+            height = size_config.get('height_cm', size_config.get('height', 4.5))
+            dimensions = CropDimensions(
+                width=float(width),
+                height=float(height),
+                unit='cm',
+                dpi=dpi,
+                min_dpi=min_dpi
+            )
+        else:
+            # mm boyutları (varsayılan)
+            width = size_config.get('width_mm', size_config.get('width', 35))
+            height = size_config.get('height_mm', size_config.get('height', 45))
+            dimensions = CropDimensions(
+                width=float(width),
+                height=float(height),
+                unit='mm',
+                dpi=dpi,
+                min_dpi=min_dpi
+            )
+
+        # Açık Lise/MEBBIS için özel işleme - boyut tipine göre farklı fonksiyon
+        crop_mode = 'auto'
+        if size_config.get('force_biometric'):
+            selected_display = self.size_combo.get()
+            size_type = self.size_display_values.get(selected_display, "e_okul")
+            crop_mode = 'mebbis' if size_type == 'mebbis' else 'acik_lise'
+
+        return SizeContext(
+            size_config=size_config,
+            dimensions=dimensions,
+            crop_mode=crop_mode,
+            white_background=size_config.get('white_background', False),
+            apply_watermark=self.watermark_enabled.get(),
+            needs_size_opt=bool(size_config.get('file_size_limit'))
+        )
 
     def process_single_photo(self, input_path, output_path, size_config):
         """Tek bir fotoğrafı işle (kırp ve boyutlandır)"""
         try:
-            # Dosya varlığını kontrol et
-            if not input_path.exists():
+            context = self._prepare_size_context(size_config)
+        except Exception as e:
+            self.log_message(f"❌ Fotoğraf işleme genel hatası: {e}")
+            return False
+        return self.process_single_photo_fast(input_path, output_path, context)
+
+    def process_single_photo_fast(self, input_path, output_path, context: "SizeContext"):
+        """Tek bir fotoğrafı önceden hazırlanmış bağlamla işle (kırp ve boyutlandır)"""
+        try:
+            # Dosya varlığı ve boyutu tek stat çağrısıyla kontrol edilir
+            try:
+                input_size = os.stat(input_path).st_size
+            except FileNotFoundError:
                 self.log_message(f"❌ Dosya bulunamadı: {input_path}")
                 return False
 
-            # Dosya boyutunu kontrol et
-            if input_path.stat().st_size == 0:
+            if input_size == 0:
                 self.log_message(f"❌ Boş dosya: {input_path}")
                 return False
 
-            from photo_processor import CropDimensions
-
-            # Orijinal format korunacaksa dosya uzantısını al
-            # if size_config.get('format') == 'original': # Çıktı formatı seçimi kaldırıldı
-            #     original_extension = input_path.suffix.lower()
-            #     output_path = output_path.with_suffix(original_extension)
-
-            # Boyutları belirle (pixel veya mm)
-            dpi = size_config.get('dpi', 300)
-            min_dpi = size_config.get('min_dpi', None)
-
-            if 'width_px' in size_config and 'height_px' in size_config:
-                # Pixel boyutları (Açık Lise gibi)
-                dimensions = CropDimensions(
-                    width=size_config['width_px'],
-                    height=size_config['height_px'],
-                    unit='px',
-                    dpi=dpi,
-                    min_dpi=min_dpi
-                )
-            elif size_config.get('unit') == 'px' or 'width_px' in size_config:
-                # Pixel boyutları
-                width = size_config.get('width_px', size_config.get('width', 300))
-                height = size_config.get('height_px', size_config.get('height', 400))
-                dimensions = CropDimensions(
-                    width=int(width),
-                    height=int(height),
-                    unit='px',
-                    dpi=dpi,
-                    min_dpi=min_dpi
-                )
-            elif size_config.get('unit') == 'cm':
-                # cm boyutları
-                width = size_config.get('width_cm', size_config.get('width', 3.5))
-                height = size_config.get('height_cm', size_config.get('height', 4.5))
-                dimensions = CropDimensions(
-                    width=float(width),
-                    height=float(height),
-                    unit='cm',
-                    dpi=dpi,
-                    min_dpi=min_dpi
-                )
-            else:
-                # mm boyutları (varsayılan)
-                width = size_config.get('width_mm', size_config.get('width', 35))
-                height = size_config.get('height_mm', size_config.get('height', 45))
-                dimensions = CropDimensions(
-                    width=float(width),
-                    height=float(height),
-                    unit='mm',
-                    dpi=dpi,
-                    min_dpi=min_dpi
-                )
+            dimensions = context.dimensions
 
-            # Çıktı dosya formatını ayarla
-            # output_format = size_config.get('format', 'jpg') # Çıktı formatı seçimi kaldırıldı
-            output_format = 'jpg' # Sabit JPG
-            if output_format == 'original':
-                # Orijinal formatı koru
-                pass  # output_path zaten yukarıda ayarlandı
-            elif output_format == 'png':
-                output_path = output_path.with_suffix('.png')
-            else:
-                output_path = output_path.with_suffix('.jpg')
+            # Çıktı dosya formatı sabit JPG
+            output_path = output_path.with_suffix('.jpg')
 
             success = False
 
             # Açık Lise/MEBBIS için özel işleme
-            if size_config.get('force_biometric'):
+            if context.crop_mode == 'mebbis':
                 try:
-                    # Boyut tipine göre farklı fonksiyon çağır
-                    selected_display = self.size_combo.get()
-                    size_type = self.size_display_values.get(selected_display, "e_okul")
-
-                    if size_type == 'mebbis':
-                        success = self.photo_processor.crop_face_biometric_mebbis(
-                            input_path, 
-                            output_path, 
-                            dimensions,
-                            white_background=size_config.get('white_background', False)
-                        )
-                        if success:
-                            self.log_message(f"   🎯 MEBBIS biyometrik kırpma kullanıldı")
-                    else:
-                        success = self.photo_processor.crop_face_biometric_acik_lise(
-                            input_path, 
-                            output_path, 
-                            dimensions,
-                            white_background=size_config.get('white_background', False)
-                        )
-                        if success:
-                            self.log_message(f"   🎯 Açık Lise biyometrik kırpma kullanıldı")
+                    success = self.photo_processor.crop_face_biometric_mebbis(
+                        input_path, 
+                        output_path, 
+                        dimensions,
+                        white_background=context.white_background
+                    )
+                    if success:
+                        self.log_message(f"   🎯 MEBBIS biyometrik kırpma kullanıldı")
+                except Exception as bio_error:
+                    self.log_message(f"   ⚠️ Biyometrik kırpma hatası: {bio_error}")
+                    success = False
+            elif context.crop_mode == 'acik_lise':
+                try:
+                    success = self.photo_processor.crop_face_biometric_acik_lise(
+                        input_path, 
+                        output_path, 
+                        dimensions,
+                        white_background=context.white_background
+                    )
+                    if success:
+                        self.log_message(f"   🎯 Açık Lise biyometrik kırpma kullanıldı")
                 except Exception as bio_error:
                     self.log_message(f"   ⚠️ Biyometrik kırpma hatası: {bio_error}")
                     success = False
@@ -3829,20 +4166,10 @@ class VesiKolayProApp:
                     self.log_message(f"   ❌ Kırpma hatası: {crop_error}")
                     return False
 
-            # Watermark ekle (eğer aktifse)
-            if success and self.watermark_enabled.get():
-                try:
-                    self.apply_watermark_to_photo(output_path)
-                except Exception as watermark_error:
-                    self.log_message(f"   ⚠️ Watermark ekleme hatası: {watermark_error}")
-
-            # E-Okul için dosya boyutu kontrolü
-            if success and size_config.get('file_size_limit'):
+            # Watermark + E-Okul dosya boyutu kontrolü tek açma/kaydetme turunda
+            if success and (context.apply_watermark or context.needs_size_opt):
                 try:
-                    success = self.optimize_file_size(output_path, size_config)
-                    if success:
-                        final_size = output_path.stat().st_size / 1024
-                        self.log_message(f"   📏 Dosya boyutu optimize edildi: {final_size:.1f} KB")
+                    success = self._finalize_photo(output_path, context.size_config, context.apply_watermark)
                 except Exception as size_error:
                     self.log_message(f"   ⚠️ Dosya boyutu optimizasyonu hatası: {size_error}")
 
@@ -3852,66 +4179,118 @@ class VesiKolayProApp:
             self.log_message(f"❌ Fotoğraf işleme genel hatası: {e}")
             return False
 
-    def optimize_file_size(self, file_path, size_config):
-        """Dosya boyutunu optimize et (sadece E-Okul için)"""
+    def optimize_file_size(self, file_path, size_config, img=None, dpi_info=None):
+        """Dosya boyutunu optimize et (sadece E-Okul için)
+
+        img verilirse dosya yeniden açılmaz; JPEG kalitesi bellekte ikili arama ile bulunur.
+        Başarıda son dosya boyutunu (bayt), hatada None döndürür.
+        """
         try:
             min_kb, max_kb = size_config['file_size_limit']
             min_bytes = min_kb * 1024
             max_bytes = max_kb * 1024
 
-            from PIL import Image
+            import io
             import os
 
-            # Mevcut dosya boyutunu kontrol et
-            current_size = os.path.getsize(file_path)
-
-            if min_bytes <= current_size <= max_bytes:
-                return True
-
             # Dosya formatını al
             # output_format = size_config.get('format', 'jpg') # Çıktı formatı seçimi kaldırıldı
             output_format = 'jpg' # Sabit JPG
 
-            # Dosya boyutu uygun değilse kaliteyi ayarla
-            quality = size_config['quality']
-            original_quality = quality
+            encoded = {}
 
-            # Dosya çok büyükse kaliteyi düşür
-            while current_size > max_bytes and quality > 20:
-                quality -= 5
+            def encode(quality):
+                # Aynı kalite aramada ikinci kez kodlanmaz
+                buffer = encoded.get(quality)
+                if buffer is None:
+                    buffer = io.BytesIO()
+                    img.save(buffer, format='JPEG', quality=quality, optimize=True, dpi=dpi_info)
+                    encoded[quality] = buffer
+                return buffer
 
-                with Image.open(file_path) as img:
-                    # DPI bilgisini koru
-                    dpi_info = img.info.get('dpi', (300, 300))
+            # Görüntüyü tek sefer yükle ve mevcut boyutu kontrol et
+            if img is None:
+                current_size = os.path.getsize(file_path)
+                if min_bytes <= current_size <= max_bytes:
+                    return current_size
 
-                    if output_format.lower() == 'png':
-                        img.save(file_path, format='PNG', optimize=True, dpi=dpi_info)
-                    else:
-                        img.save(file_path, format='JPEG', quality=quality, optimize=True, dpi=dpi_info)
+                with Image.open(file_path) as source:
+                    dpi_info = source.info.get('dpi', (300, 300))
+                    source.load()
+                    img = source.copy()
+            else:
+                # Bellekteki görüntü (ör. watermark eklenmiş) varsayılan kalitede uygun mu?
+                dpi_info = dpi_info or img.info.get('dpi', (300, 300))
+                buffer = encode(95)
+                encoded_size = buffer.getbuffer().nbytes
+                if min_bytes <= encoded_size <= max_bytes:
+                    with open(file_path, 'wb') as f:
+                        f.write(buffer.getbuffer())
+                    return encoded_size
+
+            # Üst sınırı aşmayan en yüksek kaliteyi ikili arama ile bul (20-95 dahil).
+            # Boyut kaliteyle artar: bu kalite alt sınırın altındaysa aralığa giren kalite yoktur
+            # ve üst sınırı aşmadan ulaşılabilecek en büyük dosya budur
+            low, high = 20, 95
+            best_buffer = None
+            while low <= high:
+                quality = (low + high) // 2
+                buffer = encode(quality)
+                if buffer.getbuffer().nbytes <= max_bytes:
+                    best_buffer = buffer
+                    low = quality + 1
+                else:
+                    high = quality - 1
 
-                current_size = os.path.getsize(file_path)
+            if best_buffer is None:
+                # En düşük kalitede bile büyükse en küçük çıktıyı kullan
+                best_buffer = encode(20)
 
-            # Dosya çok küçükse kaliteyi artır (sadece JPEG için)
-            if current_size < min_bytes and quality < original_quality and output_format.lower() == 'jpg':
-                quality = min(95, quality + 20)
-                with Image.open(file_path) as img:
-                    # DPI bilgisini koru
-                    dpi_info = img.info.get('dpi', (300, 300))
-                    img.save(file_path, format='JPEG', quality=quality, optimize=True, dpi=dpi_info)
+            # Seçilen sonucu diske tek seferde yaz
+            with open(file_path, 'wb') as f:
+                f.write(best_buffer.getbuffer())
 
-            final_size = os.path.getsize(file_path)
+            # Yazılan boyut tampondan bilinir, diskten tekrar okunmaz
+            final_size = best_buffer.getbuffer().nbytes
             final_kb = final_size / 1024
 
             # Hedef aralıkta mı kontrol et
-            if min_kb <= final_kb <= max_kb:
-                return True
-            else:
+            if not min_kb <= final_kb <= max_kb:
                 self.log_message(f"   ⚠️ Dosya boyutu hedef aralığa getirilemedi: {final_kb:.1f} KB (Format: {output_format.upper()})")
-                return True  # Yine de devam et
+            return final_size  # Yine de devam et
 
         except Exception as e:
             self.log_message(f"❌ Dosya boyutu optimizasyonu hatası: {e}")
-            return False
+            return None
+
+    def _finalize_photo(self, output_path: Path, size_config, apply_watermark: bool) -> bool:
+        """Kırpılmış fotoğrafı tek açılışta watermark + boyut optimizasyonundan geçir"""
+
+        watermark_text = self.watermark_text_var.get().strip() if apply_watermark else ""
+
+        # Watermark bellekte eklenir, ara dosya kaydı yapılmaz
+        img = None
+        dpi_info = None
+        if watermark_text:
+            with Image.open(output_path) as source:
+                dpi_info = source.info.get('dpi', (300, 300))
+                try:
+                    img = self._draw_watermark(source, watermark_text, is_png=False)
+                except Exception as watermark_error:
+                    self.log_message(f"   ⚠️ Watermark ekleme hatası: {watermark_error}")
+
+        # E-Okul için dosya boyutu kontrolü (watermark'lı görüntü doğrudan kullanılır)
+        if size_config.get('file_size_limit'):
+            final_size = self.optimize_file_size(output_path, size_config, img=img, dpi_info=dpi_info)
+            if final_size is None:
+                return False
+            self.log_message(f"   📏 Dosya boyutu optimize edildi: {final_size / 1024:.1f} KB")
+            return True
+
+        if img is not None:
+            img.save(output_path, format='JPEG', quality=95, optimize=True, dpi=dpi_info)
+
+        return True
 
     def apply_watermark_to_photo(self, photo_path: Path):
         """Fotoğrafa sadece metin watermark ekle"""
@@ -3929,87 +4308,183 @@ class VesiKolayProApp:
             if photo_path.suffix.lower() == '.png':
                 self.log_message(f"⚠️ PNG dosyasına watermark ekleniyor: {photo_path.name}")
 
-            from PIL import Image, ImageDraw, ImageFont
 
             with Image.open(photo_path) as img:
                 # Format kontrolü
                 is_png = photo_path.suffix.lower() == '.png'
 
-                if is_png and img.mode != 'RGBA':
-                    img = img.convert('RGBA')
-                elif not is_png and img.mode != 'RGB':
-                    img = img.convert('RGB')
+                watermarked = self._draw_watermark(img, watermark_text, is_png)
 
                 if is_png:
-                    overlay = Image.new('RGBA', img.size, (0, 0, 0, 0))
+                    watermarked.save(photo_path, format='PNG', optimize=True)
                 else:
-                    overlay = Image.new('RGBA', img.size, (0, 0, 0, 0))
+                    watermarked.save(photo_path, format='JPEG', quality=95, optimize=True)
 
-                draw = ImageDraw.Draw(overlay)
+        except Exception as e:
+            self.log_message(f"❌ Watermark ekleme hatası: {e}")
 
-                font_size = max(20, min(img.width, img.height) // 30)
+    def _get_watermark_font(self, font_size: int):
+        """Watermark fontunu boyuta göre bir kez yükle"""
+        font = self._font_cache.get(font_size)
+        if font is None:
+            try:
+                font = ImageFont.truetype("arial.ttf", font_size)
+            except:
                 try:
-                    font = ImageFont.truetype("arial.ttf", font_size)
+                    font = ImageFont.truetype("C:/Windows/Fonts/arial.ttf", font_size)
                 except:
-                    try:
-                        font = ImageFont.truetype("C:/Windows/Fonts/arial.ttf", font_size)
-                    except:
-                        font = ImageFont.load_default()
-
-                bbox = draw.textbbox((0, 0), watermark_text, font=font)
-                text_width = bbox[2] - bbox[0]
-                text_height = bbox[3] - bbox[1]
-
-                margin = 20
-                x = img.width - text_width - margin
-                y = img.height - text_height - margin
+                    font = ImageFont.load_default()
+            self._font_cache[font_size] = font
+        return font
+
+    def _get_watermark_overlay(self, size, watermark_text: str):
+        """Aynı boyut ve metin için watermark katmanını bir kez oluştur: (RGBA parça, konum)"""
+        key = (size, watermark_text)
+        cached = self._watermark_cache.get(key)
+        if cached is not None:
+            return cached
+
+
+        width, height = size
+        font_size = max(20, min(width, height) // 30)
+        font = self._get_watermark_font(font_size)
+
+        bbox = ImageDraw.Draw(Image.new('RGBA', (1, 1))).textbbox((0, 0), watermark_text, font=font)
+        text_width = bbox[2] - bbox[0]
+        text_height = bbox[3] - bbox[1]
+
+        margin = 20
+        x = width - text_width - margin
+        y = height - text_height - margin
+
+        # Katman sadece watermark kutusunu kapsar (tüm fotoğraf boyutunda değil)
+        bg_padding = 10
+        left, top = x - bg_padding, y - bg_padding
+        tile = Image.new('RGBA', (text_width + 2 * bg_padding + 1, text_height + 2 * bg_padding + 1), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(tile)
+        draw.rectangle([0, 0, text_width + 2 * bg_padding, text_height + 2 * bg_padding], fill=(0, 0, 0, 128))
+        draw.text((bg_padding, bg_padding), watermark_text, font=font, fill=(255, 255, 255, 200))
+
+        # Metin değiştiğinde eski katmanlar birikmesin
+        if len(self._watermark_cache) >= 32:
+            self._watermark_cache.clear()
+        self._watermark_cache[key] = (tile, (left, top))
+        return tile, (left, top)
+
+    def _draw_watermark(self, img, watermark_text: str, is_png: bool = False):
+        """Bellekteki görüntüye metin watermark çiz (PNG için RGBA, diğerleri için RGB döner)"""
+        if is_png and img.mode != 'RGBA':
+            img = img.convert('RGBA')
+        elif not is_png and img.mode != 'RGB':
+            img = img.convert('RGB')
+        else:
+            img.load()
+
+        tile, (left, top) = self._get_watermark_overlay(img.size, watermark_text)
+
+        # Fotoğraf sınırları dışına taşan kısmı kırp
+        crop_left, crop_top = max(0, -left), max(0, -top)
+        left, top = max(0, left), max(0, top)
+        if crop_left or crop_top:
+            tile = tile.crop((crop_left, crop_top, tile.width, tile.height))
+        box = (left, top, min(img.width, left + tile.width), min(img.height, top + tile.height))
+        if box[2] <= box[0] or box[3] <= box[1]:
+            return img
+        if (box[2] - left, box[3] - top) != tile.size:
+            tile = tile.crop((0, 0, box[2] - left, box[3] - top))
+
+        # Tam boyutlu katman yerine sadece watermark kutusu bölgesi harmanlanır
+        if is_png:
+            img.alpha_composite(tile, dest=(left, top))
+        else:
+            # JPEG: katmanın alfa kanalı maske olarak kullanılır, RGBA'ya dönüş yok
+            img.paste(tile, box, tile)
+
+        return img
+
+    def _reserve_unique_filename(self, clean_name: str, suffix: str, used_names: set, name_counters: Dict[str, int]) -> str:
+        """Çıktı dizininde benzersiz dosya adı ayır (aynı isim varsa _1, _2 ... ekler)"""
+        # used_names küçük/büyük harf duyarsız tutulur (casefold); Windows/macOS dosya sistemlerinde
+        # yalnızca harf büyüklüğü farklı iki ad aynı dosyadır
+        filename = f"{clean_name}{suffix}"
+        key = filename.casefold()
+        if key in used_names:
+            counter = name_counters.get(key, 0) + 1
+            while f"{clean_name}_{counter}{suffix}".casefold() in used_names:
+                counter += 1
+            name_counters[key] = counter
+            filename = f"{clean_name}_{counter}{suffix}"
+        used_names.add(filename.casefold())
+        return filename
 
-                bg_padding = 10
-                draw.rectangle(
-                    [x - bg_padding, y - bg_padding, 
-                     x + text_width + bg_padding, y + text_height + bg_padding],
-                    fill=(0, 0, 0, 128)
-                )
+    def _fast_copy_file(self, src: Path, dst: Path):
+        """Dosyayı kopyala - Linux'ta önce reflink (CoW), sonra çekirdek içi kopya dene"""
+        if sys.platform.startswith('linux'):
+            try:
+                with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                    try:
+                        # Btrfs/XFS: veri kopyalanmaz, bloklar paylaşılır
+                        fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+                        remaining = 0
+                    except OSError:
+                        remaining = os.fstat(fsrc.fileno()).st_size
+                        while remaining > 0:
+                            copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                            if copied == 0:
+                                break
+                            remaining -= copied
+                if remaining == 0:
+                    shutil.copystat(src, dst)
+                    return
+            except OSError:
+                pass
 
-                draw.text((x, y), watermark_text, font=font, fill=(255, 255, 255, 200))
+        FileUtils.copy_file_safe(src, dst, overwrite=True)
 
-                if is_png:
-                    watermarked = Image.alpha_composite(img, overlay)
-                    watermarked.save(photo_path, format='PNG', optimize=True)
-                else:
-                    watermarked = Image.alpha_composite(img.convert('RGBA'), overlay)
-                    watermarked = watermarked.convert('RGB')
-                    watermarked.save(photo_path, format='JPEG', quality=95, optimize=True)
+    def _move_file(self, src: Path, dst: Path):
+        """Dosyayı taşı - aynı diskte sadece dizin kaydı değişir"""
+        try:
+            os.replace(src, dst)
+        except OSError:
+            # Farklı disk: kopyala ve kaynağı sil
+            shutil.move(str(src), str(dst))
+
+    def _get_pdf_generator(self):
+        """Paylaşılan PDFGenerator örneğini döndür (ilk kullanımda oluşturulur)"""
+        if self._pdf_generator is None:
+            from pdf_generator import PDFGenerator
+            self._pdf_generator = PDFGenerator()
+        return self._pdf_generator
+
+    def _get_school_dir(self) -> Path:
+        """Okulun VesiKolayPro klasörünü döndür (okul adı başına bir kez çözülür)"""
+        school_dir = self._school_dir_cache.get(self.school_name)
+        if school_dir is None:
+            school_dir = VesiKolayUtils.get_school_directory(self.school_name)
+            self._school_dir_cache[self.school_name] = school_dir
+        return school_dir
+
+    def _find_latest_timestamp_dir(self, school_main_dir: Path) -> Optional[Path]:
+        """Okul klasöründeki en son tarih-saat klasörünü bul (tek scandir, önbellekli stat)"""
+        latest_name = None
+        latest_mtime = None
+        try:
+            with os.scandir(school_main_dir) as entries:
+                for entry in entries:
+                    if not entry.is_dir(follow_symlinks=False) or not _TIMESTAMP_DIR_RE.match(entry.name):
+                        continue
+                    mtime = entry.stat().st_mtime
+                    if latest_mtime is None or mtime > latest_mtime:
+                        latest_name, latest_mtime = entry.name, mtime
+        except OSError as e:
+            self.logger.error(f"Zaman damgalı klasörler okunamadı: {e}")
+            return None
 
-        except Exception as e:
-            self.log_message(f"❌ Watermark ekleme hatası: {e}")
+        return Path(school_main_dir) / latest_name if latest_name else None
 
     def clean_filename(self, filename: str, preserve_spaces: bool = False) -> str:
-        """Dosya adını temizle"""
-        # Geçersiz karakterleri kaldır
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
-
-        if not preserve_spaces:
-            # Boşlukları alt çizgi ile değiştir (sadece preserve_spaces False ise)
-            filename = filename.replace(' ', '_')
-
-            # Çoklu alt çizgileri tekle
-            while '__' in filename:
-                filename = filename.replace('__', '_')
-
-            # Baştan ve sondan alt çizgi kaldır
-            filename = filename.strip('_')
-        else:
-            # Boşlukları koru ama çoklu boşlukları tekle
-            filename = ' '.join(filename.split())
-
-        # Boş ise varsayılan ad ver
-        if not filename:
-            filename = 'unnamed'
-
-        return filename
+        """Dosya adını temizle (sonuçlar önbelleklenir)"""
+        return _clean_filename_cached(filename, preserve_spaces)
 
     def open_output_directory(self):
         """Çıktı dizinini aç"""
@@ -4022,112 +4497,78 @@ class VesiKolayProApp:
             return
 
         # VesiKolayPro ana dizinindeki okul klasörünü aç
-        from utils import VesiKolayUtils
-        school_output_dir = VesiKolayUtils.get_school_directory(self.school_name)
+        school_output_dir = self._get_school_dir()
 
         if school_output_dir.exists():
-            # İşletim sistemine göre dizin açma
-            import subprocess
-            import sys
-            try:
-                if sys.platform == "win32":
-                    subprocess.run(["explorer", str(school_output_dir)])
-                elif sys.platform == "darwin":
-                    subprocess.run(["open", str(school_output_dir)])
-                else:
-                    subprocess.run(["xdg-open", str(school_output_dir)])
-                self.log_message(f"📁 Okul çıktı dizini açıldı: {school_output_dir.name}")
-            except Exception as e:
-                self.log_message(f"📁 Okul çıktı dizini yolu: {school_output_dir}")
-                self.log_message(f"❌ Dizin açma hatası: {e}")
+            self._open_in_file_manager(school_output_dir, "📁", "Okul çıktı dizini")
         else:
             self.log_message("❌ Henüz bu okul için çıktı dizini oluşturulmamış.")
 
     def open_pdf_directory(self):
         """PDF dizinini aç"""
+        self._open_latest_output_subdir("pdfs", "📄", "PDF dizini", "❌ Henüz PDF dosyası oluşturulmamış.")
+
+    def open_id_cards_directory(self):
+        """Kimlik kartları dizinini aç"""
+        self._open_latest_output_subdir("id_cards", "🆔", "Kimlik kartları dizini",
+                                        "❌ Henüz kimlik kartı oluşturulmamış.")
+
+    def _open_latest_output_subdir(self, subdir_name: str, icon: str, label: str, missing_message: str):
+        """En son tarih-saat klasöründeki alt dizini (pdfs, id_cards) aç"""
         if not self.school_name:
             messagebox.showwarning("Uyarı", "Önce okul adını girin.")
             return
 
         # VesiKolayPro ana dizinindeki okul klasörünü bul
-        from utils import VesiKolayUtils
-        school_main_dir = VesiKolayUtils.get_school_directory(self.school_name)
+        school_main_dir = self._get_school_dir()
 
         if not school_main_dir.exists():
             self.log_message("❌ Henüz bu okul için çıktı dizini oluşturulmamış.")
             return
 
         # En son oluşturulan tarih-saat klasörünü bul
-        timestamp_dirs = [d for d in school_main_dir.iterdir() 
-                         if d.is_dir() and d.name.replace('_', '').replace('-', '').isdigit()]
-
-        if not timestamp_dirs:
-            self.log_message("❌ Henüz PDF dosyası oluşturulmamış.")
-            return
-
-        # En son oluşturulan dizindeki PDF klasörünü aç
-        latest_dir = max(timestamp_dirs, key=lambda x: x.stat().st_mtime)
-        pdf_dir = latest_dir / "pdfs"
+        latest_dir = self._find_latest_timestamp_dir(school_main_dir)
+        target_dir = latest_dir / subdir_name if latest_dir is not None else None
 
-        if pdf_dir.exists():
-            import subprocess
-            import sys
-            try:
-                if sys.platform == "win32":
-                    subprocess.run(["explorer", str(pdf_dir)])
-                elif sys.platform == "darwin":
-                    subprocess.run(["open", str(pdf_dir)])
-                else:
-                    subprocess.run(["xdg-open", str(pdf_dir)])
-                self.log_message(f"📄 PDF dizini açıldı: {pdf_dir.name}")
-            except Exception as e:
-                self.log_message(f"📄 PDF dizini yolu: {pdf_dir}")
-                self.log_message(f"❌ Dizin açma hatası: {e}")
+        if target_dir is not None and target_dir.exists():
+            self._open_in_file_manager(target_dir, icon, label)
         else:
-            self.log_message("❌ Henüz PDF dosyası oluşturulmamış.")
-
-    def open_id_cards_directory(self):
-        """Kimlik kartları dizinini aç"""
-        if not self.school_name:
-            messagebox.showwarning("Uyarı", "Önce okul adını girin.")
-            return
+            self.log_message(missing_message)
 
-        # VesiKolayPro ana dizinindeki okul klasörünü bul
-        from utils import VesiKolayUtils
-        school_main_dir = VesiKolayUtils.get_school_directory(self.school_name)
+    def _open_in_file_manager(self, dir_path: Path, icon: str, label: str):
+        """Dizini dosya yöneticisinde aç ve sonucu logla"""
+        try:
+            _launch_file_manager(dir_path)
+            self.log_message(f"{icon} {label} açıldı: {dir_path.name}")
+        except Exception as e:
+            self.log_message(f"{icon} {label} yolu: {dir_path}")
+            self.log_message(f"❌ Dizin açma hatası: {e}")
 
-        if not school_main_dir.exists():
-            self.log_message("❌ Henüz bu okul için çıktı dizini oluşturulmamış.")
-            return
+    def _load_footer_logo(self, logo_path: Path, logo_height: int):
+        """Footer logosunu verilen yüksekliğe ölçekle; sonucu diskte önbellekle"""
+        cache_path = Config().VESIKOLAY_DIR / "cache" / f"{logo_path.stem}_h{logo_height}.png"
 
-        # En son oluşturulan tarih-saat klasörünü bul
-        timestamp_dirs = [d for d in school_main_dir.iterdir() 
-                         if d.is_dir() and d.name.replace('_', '').replace('-', '').isdigit()]
+        # Önbellek kaynak logodan yeniyse yeniden ölçekleme yapılmaz
+        try:
+            if cache_path.stat().st_mtime >= logo_path.stat().st_mtime:
+                cached = Image.open(cache_path)
+                cached.load()
+                return cached
+        except OSError:
+            pass
 
-        if not timestamp_dirs:
-            self.log_message("❌ Henüz kimlik kartı oluşturulmamış.")
-            return
+        with Image.open(logo_path) as source:
+            img_width, img_height = source.size
+            logo_width = int((img_width * logo_height) / img_height)
+            resized = source.resize((logo_width, logo_height), Image.Resampling.LANCZOS)
 
-        # En son oluşturulan dizindeki kimlik kartları klasörünü aç
-        latest_dir = max(timestamp_dirs, key=lambda x: x.stat().st_mtime)
-        id_cards_dir = latest_dir / "id_cards"
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            resized.save(cache_path, optimize=True)
+        except OSError as e:
+            self.logger.warning(f"Footer logo önbelleği yazılamadı: {e}")
 
-        if id_cards_dir.exists():
-            import subprocess
-            import sys
-            try:
-                if sys.platform == "win32":
-                    subprocess.run(["explorer", str(id_cards_dir)])
-                elif sys.platform == "darwin":
-                    subprocess.run(["open", str(id_cards_dir)])
-                else:
-                    subprocess.run(["xdg-open", str(id_cards_dir)])
-                self.log_message(f"🆔 Kimlik kartları dizini açıldı: {id_cards_dir.name}")
-            except Exception as e:
-                self.log_message(f"🆔 Kimlik kartları dizini yolu: {id_cards_dir}")
-                self.log_message(f"❌ Dizin açma hatası: {e}")
-        else:
-            self.log_message("❌ Henüz kimlik kartı oluşturulmamış.")
+        return resized
 
     def create_footer(self):
         """Footer bölümünü oluştur"""
@@ -4173,15 +4614,11 @@ class VesiKolayProApp:
 
         # Muallimun logosu
         try:
-            from PIL import Image, ImageTk
             muallimun_logo_path = Path(__file__).parent / "images" / "muallimun.png"
             if muallimun_logo_path.exists():
-                muallimun_image = Image.open(muallimun_logo_path)
                 # Logo boyutunu footer'a uygun şekilde ayarla (yükseklik: 25px)
                 logo_height = 25
-                img_width, img_height = muallimun_image.size
-                logo_width = int((img_width * logo_height) / img_height)
-                muallimun_resized = muallimun_image.resize((logo_width, logo_height), Image.Resampling.LANCZOS)
+                muallimun_resized = self._load_footer_logo(muallimun_logo_path, logo_height)
                 self.muallimun_logo = ImageTk.PhotoImage(muallimun_resized)
                 
                 muallimun_logo_label = tk.Label(muallimun_container,
@@ -4256,25 +4693,35 @@ class VesiKolayProApp:
             # Sessizce geç, startup'ta hata vermemeli
             pass
 
+    # Ortak gereksinimler: anahtar -> (kontrol, eksik listesi etiketi, uyarı metni)
+    _REQUIREMENT_CHECKS = {
+        'school': (lambda self: bool(self.school_name),
+                   "📝 Okul adı (Adım 1{note})",
+                   "⚠️ Önce okul adını girin.\n\n📝 Adım 1'de okul adını belirtmeniz gerekir."),
+        'excel': (lambda self: bool(self.excel_data),
+                  "📊 Excel dosyası (Adım 2{note})",
+                  "⚠️ Önce Excel dosyası seçin ve yükleyin.\n\n📊 Adım 2'de Excel dosyasını seçmeniz gerekir."),
+        'photos': (lambda self: bool(self.photo_directory),
+                   "📂 Fotoğraf klasörü (Adım 3{note})",
+                   "⚠️ Önce fotoğraf dizini seçin.\n\n📂 Adım 3'te fotoğraf klasörünü seçmeniz gerekir."),
+        'columns': (lambda self: bool(self.get_selected_columns()),
+                    "🔧 Sütun seçimi (Adım 4{note})",
+                    "⚠️ Adlandırma için en az bir sütun seçin.\n\n🔧 Adım 4'te sütun seçimi yapmanız gerekir."),
+    }
+
+    def _missing_requirements(self, keys, note: str = "") -> List[str]:
+        """Verilen gereksinimlerden sağlanmayanların etiketlerini sırayla döndür"""
+        checks = self._REQUIREMENT_CHECKS
+        return [checks[key][1].format(note=note) for key in keys if not checks[key][0](self)]
+
     def handle_check_button_click(self):
         """Kontrol butonuna tıklandığında çalışır"""
         # Kontrol butonu her zaman aktif olabilir, sadece temel kontrolleri yapar
-        if not self.school_name:
-            messagebox.showwarning("Eksik Bilgi", "⚠️ Önce okul adını girin.\n\n📝 Adım 1'de okul adını belirtmeniz gerekir.")
-            return
-            
-        if not self.excel_data:
-            messagebox.showwarning("Eksik Bilgi", "⚠️ Önce Excel dosyası seçin ve yükleyin.\n\n📊 Adım 2'de Excel dosyasını seçmeniz gerekir.")
-            return
-            
-        if not self.photo_directory:
-            messagebox.showwarning("Eksik Bilgi", "⚠️ Önce fotoğraf dizini seçin.\n\n📂 Adım 3'te fotoğraf klasörünü seçmeniz gerekir.")
-            return
-            
-        selected_columns = self.get_selected_columns()
-        if not selected_columns:
-            messagebox.showwarning("Eksik Bilgi", "⚠️ Adlandırma için en az bir sütun seçin.\n\n🔧 Adım 4'te sütun seçimi yapmanız gerekir.")
-            return
+        for key in ('school', 'excel', 'photos', 'columns'):
+            is_met, _, warning = self._REQUIREMENT_CHECKS[key]
+            if not is_met(self):
+                messagebox.showwarning("Eksik Bilgi", warning)
+                return
             
         # Tüm koşullar sağlanmışsa kontrolü çalıştır
         self.check_counts()
@@ -4325,20 +4772,7 @@ class VesiKolayProApp:
 
     def get_missing_requirements_for_rename(self):
         """Adlandırma için eksik gereksinimleri döndürür"""
-        missing = []
-        
-        if not self.school_name:
-            missing.append("📝 Okul adı (Adım 1)")
-        
-        if not self.excel_data:
-            missing.append("📊 Excel dosyası (Adım 2)")
-        
-        if not self.photo_directory:
-            missing.append("📂 Fotoğraf klasörü (Adım 3)")
-        
-        selected_columns = self.get_selected_columns()
-        if not selected_columns:
-            missing.append("🔧 Sütun seçimi (Adım 4)")
+        missing = self._missing_requirements(('school', 'excel', 'photos', 'columns'))
         
         if missing:
             missing.append("\n💡 Tüm gereksinimleri tamamladıktan sonra '🔍 Kontrol Et' butonuna tıklayın.")
@@ -4352,62 +4786,31 @@ class VesiKolayProApp:
         if not self.sizing_enabled.get():
             missing.append("🔧 Boyutlandırma seçeneğini aktifleştirin (Adım 5)")
         
-        if not self.school_name:
-            missing.append("📝 Okul adı (Adım 1)")
-        
-        if not self.photo_directory:
-            missing.append("📂 Fotoğraf klasörü (Adım 3)")
+        missing += self._missing_requirements(('school', 'photos'))
         
         # Adlandırma ile birlikte boyutlandırma yapılacaksa
         if self.sizing_with_naming.get():
-            if not self.excel_data:
-                missing.append("📊 Excel dosyası (Adım 2 - Adlandırma için)")
-            
-            selected_columns = self.get_selected_columns()
-            if not selected_columns:
-                missing.append("🔧 Sütun seçimi (Adım 4 - Adlandırma için)")
+            missing += self._missing_requirements(('excel', 'columns'), note=" - Adlandırma için")
         
         return "\n".join(missing) if missing else ""
 
     def get_missing_requirements_for_pdf(self):
         """PDF oluşturma için eksik gereksinimleri döndürür"""
-        missing = []
-        
-        if not self.school_name:
-            missing.append("📝 Okul adı (Adım 1)")
-        
-        if not self.excel_data:
-            missing.append("📊 Excel dosyası (Adım 2)")
-        
-        if not self.photo_directory:
-            missing.append("📂 Fotoğraf klasörü (Adım 3)")
-        
-        selected_columns = self.get_selected_columns()
-        if not selected_columns:
-            missing.append("🔧 Sütun seçimi (Adım 4)")
+        missing = self._missing_requirements(('school', 'excel', 'photos', 'columns'))
         
         missing.append("\n💡 PDF oluşturmadan önce fotoğrafları adlandırmanız gerekir.")
         missing.append("   '🔍 Kontrol Et' ardından '✨ Fotoğrafları Adlandır' işlemini yapın.")
         
-        return "\n".join(missing) if missing else ""
+        return "\n".join(missing)
 
     def get_missing_requirements_for_id_cards(self):
         """Kimlik kartı oluşturma için eksik gereksinimleri döndürür"""
-        missing = []
-        
-        if not self.school_name:
-            missing.append("📝 Okul adı (Adım 1)")
-        
-        if not self.excel_data:
-            missing.append("📊 Excel dosyası (Adım 2)")
-        
-        if not self.photo_directory:
-            missing.append("📂 Fotoğraf klasörü (Adım 3)")
+        missing = self._missing_requirements(('school', 'excel', 'photos'))
         
         missing.append("\n💡 Kimlik kartı oluşturmadan önce fotoğrafları adlandırmanız gerekir.")
         missing.append("   '🔍 Kontrol Et' ardından '✨ Fotoğrafları Adlandır' işlemini yapın.")
         
-        return "\n".join(missing) if missing else ""
+        return "\n".join(missing)
 
     def run_console_mode(self):
         """Konsol modunda çalıştır"""
@@ -4455,8 +4858,8 @@ class VesiKolayProApp:
             print(f"❌ Test Excel dosyası bulunamadı: {test_excel}")
 
         if test_photos.exists():
-            photos = list(test_photos.glob("*.jpg"))
-            print(f"✅ Test fotoğraf klasörü bulundu: {len(photos)} fotoğraf")
+            photo_count = sum(1 for _ in Config().iter_valid_images(test_photos))
+            print(f"✅ Test fotoğraf klasörü bulundu: {photo_count} fotoğraf")
         else:
             print(f"❌ Test fotoğraf klasörü bulunamadı: {test_photos}")
 
@@ -4465,7 +4868,6 @@ class VesiKolayProApp:
     def system_info(self):
         """Sistem bilgilerini göster"""
         import platform
-        import sys
 
         print("\n" + "=" * 30)
         print("SİSTEM BİLGİLERİ")
@@ -4,15 +4,120 @@ Application configuration and constants
 """
 
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Dict, Tuple
+from types import MappingProxyType
+from typing import Dict, Final, Iterator, Tuple, Union
 import logging
+import os
 import sys
 
-@dataclass
+# PHOTO_SIZES içinde zaten piksel cinsinden olan boyutlar
+_DIGITAL_SIZES = frozenset({'digital_small', 'digital_large'})
+
+# Okul klasörü adında alt çizgiye çevrilecek karakterler
+_SCHOOL_DIR_TRANS = str.maketrans({' ': '_', '/': '_', '\\': '_'})
+
+# Sabit ayar tabloları - tüm Config örnekleri aynı salt okunur nesneleri paylaşır
+
+# Predefined photo sizes (in mm)
+_PHOTO_SIZES: Final = MappingProxyType({
+    'passport': (35, 45),
+    'id_card': (50, 60),
+    'visa': (35, 35),
+    'us_passport': (51, 51),
+    'digital_small': (300, 400),  # pixels
+    'digital_large': (600, 800)   # pixels
+})
+
+# Naming patterns
+_NAMING_PATTERNS: Final = MappingProxyType({
+    'first_last': '{first_name}_{last_name}',
+    'last_first': '{last_name}_{first_name}',
+    'first_last_class': '{first_name}_{last_name}_{class_name}',
+    'number_first_last': '{student_no}_{first_name}_{last_name}',
+    'class_last_first': '{class_name}_{last_name}_{first_name}'
+})
+
+# Face detection parameters
+_FACE_DETECTION: Final = MappingProxyType({
+    'scale_factor': 1.1,
+    'min_neighbors': 5,
+    'min_size': (30, 30),
+    'padding_factor': 0.3
+})
+
+# Watermark settings
+_WATERMARK_SETTINGS: Final = MappingProxyType({
+    'default_size': (30, 30),  # Default watermark size in pixels
+    'max_size': (100, 100),    # Maximum allowed watermark size
+    'default_opacity': 0.7,    # Default opacity (0.0 to 1.0)
+    'default_position': 'bottom_right',  # Default position
+    'supported_positions': ('bottom_right', 'bottom_left', 'top_right', 'top_left'),
+    'margin': 10,  # Margin from edges in pixels
+    'supported_formats': ('.png', '.jpg', '.jpeg', '.gif', '.bmp')  # Supported watermark formats
+})
+
+# PDF settings
+_PDF_SETTINGS: Final = MappingProxyType({
+    'page_format': 'A4',
+    'margin': 10,
+    'id_card_size': (85.6, 53.98),  # Credit card size in mm
+    'quality': 85
+})
+
+# Application colors (for customtkinter)
+_COLORS: Final = MappingProxyType({
+    'primary': '#1f538d',
+    'secondary': '#14375e',
+    'success': '#28a745',
+    'warning': '#ffc107',
+    'error': '#dc3545',
+    'info': '#17a2b8'
+})
+
+
 class Config:
     """Application configuration"""
 
+    # Örnek başına yalnızca dizin yolları ve önbellekler tutulur
+    __slots__ = ('BASE_DIR', 'VESIKOLAY_DIR', 'TEMPLATES_DIR', 'LANGUAGES_DIR', 'LOG_DIR',
+                 'DATABASE_PATH', '_photo_size_px_cache', '_known_school_dirs')
+
+    # UI Configuration
+    WINDOW_TITLE = "VesiKolay Pro"
+    WINDOW_SIZE = "1200x800"
+    MIN_WINDOW_SIZE = (800, 600)
+
+    # Photo processing
+    SUPPORTED_IMAGE_FORMATS = frozenset({'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.webp'})
+    MAX_IMAGE_SIZE = 4000  # Maximum dimension in pixels
+    DEFAULT_DPI = 300
+
+    PHOTO_SIZES = _PHOTO_SIZES
+    NAMING_PATTERNS = _NAMING_PATTERNS
+    FACE_DETECTION = _FACE_DETECTION
+    WATERMARK_SETTINGS = _WATERMARK_SETTINGS
+    PDF_SETTINGS = _PDF_SETTINGS
+
+    # Language settings
+    DEFAULT_LANGUAGE = 'en'
+    SUPPORTED_LANGUAGES = ('en', 'tr')
+
+    COLORS = _COLORS
+
+    # File size limits (in MB)
+    MAX_FILE_SIZE = 50
+    MAX_EXCEL_SIZE = 10
+    _MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE << 20
+    _MAX_EXCEL_SIZE_BYTES = MAX_EXCEL_SIZE << 20
+
+    # Processing limits
+    MAX_PHOTOS_PER_BATCH = 1000
+    MAX_STUDENTS_PER_CLASS = 50
+
+    # Logging settings
+    LOG_LEVEL = logging.INFO
+    LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
     def __init__(self):
         # Base directories - exe için düzeltme
         if getattr(sys, 'frozen', False):
@@ -39,87 +144,11 @@ class Config:
         # Database - VesiKolayPro dizininde tut
         self.DATABASE_PATH = self.VESIKOLAY_DIR / "schools.db"
 
-        # UI Configuration
-        self.WINDOW_TITLE = "VesiKolay Pro"
-        self.WINDOW_SIZE = "1200x800"
-        self.MIN_WINDOW_SIZE = (800, 600)
-
-        # Photo processing
-        self.SUPPORTED_IMAGE_FORMATS = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.webp'}
-        self.MAX_IMAGE_SIZE = 4000  # Maximum dimension in pixels
-        self.DEFAULT_DPI = 300
-
-        # Predefined photo sizes (in mm)
-        self.PHOTO_SIZES = {
-            'passport': (35, 45),
-            'id_card': (50, 60),
-            'visa': (35, 35),
-            'us_passport': (51, 51),
-            'digital_small': (300, 400),  # pixels
-            'digital_large': (600, 800)   # pixels
-        }
-
-        # Naming patterns
-        self.NAMING_PATTERNS = {
-            'first_last': '{first_name}_{last_name}',
-            'last_first': '{last_name}_{first_name}',
-            'first_last_class': '{first_name}_{last_name}_{class_name}',
-            'number_first_last': '{student_no}_{first_name}_{last_name}',
-            'class_last_first': '{class_name}_{last_name}_{first_name}'
-        }
-
-        # Face detection parameters
-        self.FACE_DETECTION = {
-            'scale_factor': 1.1,
-            'min_neighbors': 5,
-            'min_size': (30, 30),
-            'padding_factor': 0.3
-        }
-
-        # Watermark settings
-        self.WATERMARK_SETTINGS = {
-            'default_size': (30, 30),  # Default watermark size in pixels
-            'max_size': (100, 100),    # Maximum allowed watermark size
-            'default_opacity': 0.7,    # Default opacity (0.0 to 1.0)
-            'default_position': 'bottom_right',  # Default position
-            'supported_positions': ['bottom_right', 'bottom_left', 'top_right', 'top_left'],
-            'margin': 10,  # Margin from edges in pixels
-            'supported_formats': ['.png', '.jpg', '.jpeg', '.gif', '.bmp']  # Supported watermark formats
-        }
-
-        # PDF settings
-        self.PDF_SETTINGS = {
-            'page_format': 'A4',
-            'margin': 10,
-            'id_card_size': (85.6, 53.98),  # Credit card size in mm
-            'quality': 85
-        }
-
-        # Language settings
-        self.DEFAULT_LANGUAGE = 'en'
-        self.SUPPORTED_LANGUAGES = ['en', 'tr']
-
-        # Application colors (for customtkinter)
-        self.COLORS = {
-            'primary': '#1f538d',
-            'secondary': '#14375e',
-            'success': '#28a745',
-            'warning': '#ffc107',
-            'error': '#dc3545',
-            'info': '#17a2b8'
-        }
-
-        # File size limits (in MB)
-        self.MAX_FILE_SIZE = 50
-        self.MAX_EXCEL_SIZE = 10
-
-        # Processing limits
-        self.MAX_PHOTOS_PER_BATCH = 1000
-        self.MAX_STUDENTS_PER_CLASS = 50
-
-        # Logging settings
-        self.LOG_LEVEL = logging.INFO
-        self.LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        # Bu oturumda oluşturulduğu bilinen okul dizinleri
+        self._known_school_dirs = set()
+
+        # DPI -> {boyut adı: (genişlik_px, yükseklik_px)}; ilk kullanımda doldurulur
+        self._photo_size_px_cache: Dict[int, Dict[str, Tuple[int, int]]] = {}
 
     def _create_output_directories(self):
         """Gerekli temel dizinleri oluştur"""
@@ -132,9 +161,12 @@ class Config:
 
     def get_vesikolay_school_dir(self, school_name: str) -> Path:
         """Get VesiKolayPro school directory"""
-        clean_name = school_name.replace(' ', '_').replace('/', '_').replace('\\', '_')
+        clean_name = school_name.translate(_SCHOOL_DIR_TRANS)
         school_dir = self.VESIKOLAY_DIR / clean_name
-        school_dir.mkdir(parents=True, exist_ok=True)
+        # Aynı okul için mkdir sistem çağrısı tekrarlanmaz
+        if school_dir not in self._known_school_dirs:
+            school_dir.mkdir(parents=True, exist_ok=True)
+            self._known_school_dirs.add(school_dir)
         return school_dir
 
     def get_photo_size_pixels(self, size_name: str, dpi: int = None) -> Tuple[int, int]:
@@ -142,20 +174,25 @@ class Config:
         if dpi is None:
             dpi = self.DEFAULT_DPI
 
+        cache = self._photo_size_px_cache.setdefault(dpi, {})
+        pixels = cache.get(size_name)
+        if pixels is not None:
+            return pixels
+
         if size_name not in self.PHOTO_SIZES:
             return (300, 400)  # Default size
 
         width, height = self.PHOTO_SIZES[size_name]
 
         # If already in pixels (digital sizes)
-        if size_name.startswith('digital'):
-            return (width, height)
-
-        # Convert mm to pixels
-        width_px = int((width / 25.4) * dpi)
-        height_px = int((height / 25.4) * dpi)
+        if size_name in _DIGITAL_SIZES:
+            pixels = (width, height)
+        else:
+            # Convert mm to pixels
+            pixels = (int((width / 25.4) * dpi), int((height / 25.4) * dpi))
 
-        return (width_px, height_px)
+        cache[size_name] = pixels
+        return pixels
 
     def mm_to_pixels(self, mm: float, dpi: int = None) -> int:
         """Convert millimeters to pixels"""
@@ -175,32 +212,46 @@ class Config:
             dpi = self.DEFAULT_DPI
         return (pixels * 25.4) / dpi
 
-    def validate_image_file(self, file_path: Path) -> bool:
-        """Validate if file is a supported image"""
-        if not file_path.exists():
+    def validate_image_file(self, file_path: Union[Path, os.DirEntry]) -> bool:
+        """Validate if file is a supported image (Path or os.scandir DirEntry)"""
+        # Uzantı kontrolü sistem çağrısı gerektirmez, önce yapılır
+        if os.path.splitext(file_path.name)[1].lower() not in self.SUPPORTED_IMAGE_FORMATS:
             return False
 
-        if file_path.suffix.lower() not in self.SUPPORTED_IMAGE_FORMATS:
+        # Varlık ve boyut tek stat ile (DirEntry için çoğu platformda önbellekli)
+        try:
+            file_size = file_path.stat().st_size
+        except OSError:
             return False
 
-        # Check file size
-        file_size_mb = file_path.stat().st_size / (1024 * 1024)
-        if file_size_mb > self.MAX_FILE_SIZE:
-            return False
-
-        return True
+        return file_size <= self._MAX_FILE_SIZE_BYTES
+
+    def iter_valid_images(self, dir_path: Path) -> Iterator[Tuple[Path, os.stat_result]]:
+        """Yield (path, stat) for supported images in a directory using a single scandir pass"""
+        supported = self.SUPPORTED_IMAGE_FORMATS
+        max_bytes = self._MAX_FILE_SIZE_BYTES
+
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                # Uzantı ve dosya türü readdir bilgisinden; stat yalnızca adaylar için
+                if os.path.splitext(entry.name)[1].lower() not in supported or not entry.is_file():
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                if st.st_size <= max_bytes:
+                    yield Path(entry.path), st
 
     def validate_excel_file(self, file_path: Path) -> bool:
         """Validate if file is a supported Excel file"""
-        if not file_path.exists():
-            return False
-
-        if file_path.suffix.lower() not in ['.xlsx', '.xls']:
+        if file_path.suffix.lower() not in ('.xlsx', '.xls'):
             return False
 
-        # Check file size
-        file_size_mb = file_path.stat().st_size / (1024 * 1024)
-        if file_size_mb > self.MAX_EXCEL_SIZE:
+        # Check existence and file size with a single stat
+        try:
+            file_size = file_path.stat().st_size
+        except OSError:
             return False
 
-        return True
\ No newline at end of file
+        return file_size <= self._MAX_EXCEL_SIZE_BYTES
\ No newline at end of file
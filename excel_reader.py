@@ -3,11 +3,130 @@ VesiKolay Pro - Excel File Reader
 Handles reading and parsing Excel files containing student and teacher data
 """
 
+import numpy as np
 import pandas as pd
 import logging
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Iterator, Optional, Tuple
 import re
+from collections import OrderedDict
+from importlib.util import find_spec
+from functools import lru_cache
+from itertools import count
+
+# python-calamine (Rust) varsa pandas'ın çok daha hızlı 'calamine' motoru kullanılır
+_CALAMINE_AVAILABLE = find_spec('python_calamine') is not None
+# pyarrow varsa metin sütunları Arrow tabanlı string dtype ile tutulur
+_PYARROW_AVAILABLE = find_spec('pyarrow') is not None
+
+# Numba kuruluysa büyük listelerde TC sağlama toplamı derlenmiş, paralel bir çekirdekle yapılır
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Bu sayının altındaki listelerde NumPy yolu yeterince hızlıdır (JIT ısınmasına değmez)
+_TC_NUMBA_THRESHOLD = 10_000
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _tc_checksum_batch(digits):
+        """Check TC kimlik checksums for an (n, 11) digit matrix in one fused pass"""
+        n = digits.shape[0]
+        out = np.empty(n, np.bool_)
+        for i in prange(n):
+            odd_sum = 0
+            even_sum = 0
+            for k in range(0, 9, 2):
+                odd_sum += digits[i, k]
+            for k in range(1, 8, 2):
+                even_sum += digits[i, k]
+            out[i] = ((odd_sum * 7 - even_sum) % 10 == digits[i, 9]
+                      and (odd_sum + even_sum + digits[i, 9]) % 10 == digits[i, 10])
+        return out
+
+# Tek TC numarası doğrulamasında kullanılan SWAR sabitleri (8 ASCII rakam = bir uint64)
+_SWAR_ASCII_ZEROS = 0x3030303030303030
+_SWAR_EVEN_BYTES = 0x00FF00FF00FF00FF
+_SWAR_BYTE_SUM = 0x0101010101010101
+
+# Dosya adı temizliğinde kullanılan desenler bir kez derlenir
+_INVALID_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+_FILENAME_SEPARATOR_RE = re.compile(r'[\s_]+')
+
+# Seçili sütun yoksa dosya adı için sırayla denenen alanlar
+_FALLBACK_FIELDS = (
+    'student_no', 'numara', 'tc_no', 'first_name', 'ad',
+    'last_name', 'soyad', 'full_name'
+)
+
+# Bellekte tutulan okunmuş Excel tablosu sayısı (dosyalar büyük olabilir)
+_FRAME_CACHE_SIZE = 4
+
+# Satır döngüsünde DataFrame -> object dizisi dönüşümü bu kadar satırlık bloklarla yapılır
+_ROW_BLOCK_SIZE = 500
+
+# Farklı adlandırma alışkanlıkları için sütun adı desenleri (öncelik sırasıyla)
+_FLEXIBLE_MAPPINGS: Dict[str, Tuple[str, ...]] = {
+    'first_name': (
+        r'^ad$', r'^first.*name$', r'^ad[ıi]$', r'^isim$', r'^name$',
+        r'.*ad.*', r'.*first.*', r'.*isim.*'
+    ),
+    'last_name': (
+        r'^soyad$', r'^last.*name$', r'^surname$', r'^family.*name$',
+        r'.*soyad.*', r'.*last.*', r'.*surname.*'
+    ),
+    'student_no': (
+        r'^numara$', r'^no$', r'^student.*no$', r'^öğrenci.*no$',
+        r'^number$', r'.*numara.*', r'.*student.*', r'.*no.*'
+    ),
+    'tc_no': (
+        r'^tc$', r'^tc.*no$', r'^tc.*kimlik$', r'^kimlik.*no$',
+        r'.*tc.*', r'.*kimlik.*', r'.*identity.*'
+    ),
+    'class_name': (
+        r'^sınıf$', r'^sinif$', r'^class$', r'^sınıf.*adı$',
+        r'.*sınıf.*', r'.*sinif.*', r'.*class.*'
+    ),
+    'branch': (
+        r'^branş$', r'^brans$', r'^branch$', r'^dal$',
+        r'.*branş.*', r'.*brans.*', r'.*branch.*'
+    ),
+    'school_name': (
+        r'^okul$', r'^okul.*adı$', r'^school$', r'^school.*name$',
+        r'.*okul.*', r'.*school.*'
+    ),
+    'department': (
+        r'^bölüm$', r'^bolum$', r'^department$', r'^birim$',
+        r'.*bölüm.*', r'.*bolum.*', r'.*department.*'
+    ),
+    'phone': (
+        r'^telefon$', r'^tel$', r'^phone$', r'^gsm$',
+        r'.*telefon.*', r'.*phone.*', r'.*tel.*'
+    ),
+    'email': (
+        r'^email$', r'^e.*mail$', r'^eposta$', r'^mail$',
+        r'.*email.*', r'.*mail.*', r'.*posta.*'
+    ),
+    'birth_date': (
+        r'^doğum.*tarih$', r'^birth.*date$', r'^tarih$',
+        r'.*doğum.*', r'.*birth.*', r'.*tarih.*'
+    ),
+    'academic_year': (
+        r'^egitim.*yili$', r'^academic.*year$', r'^year$', r'^yil$', r'^dönem$', r'^donem$',
+        r'.*egitim.*', r'.*academic.*', r'.*year.*', r'.*yil.*', r'.*donem.*'
+    )
+}
+
+# Tüm alanların desenleri modül yüklenirken tek bir regex'te birleştirilir; her alan
+# adlandırılmış bir grup olur. Desenlerin hepsi ^ ya da .* ile başlar; DOTALL ile .* satır
+# sonlarını da (Alt+Enter başlıkları) geçtiğinden eşleşme 0. konumda bulunur ve alternatifler
+# sırayla denenir: alan önceliği korunur.
+_COLUMN_PATTERN: re.Pattern = re.compile('|'.join(
+    f"(?P<{name}>{'|'.join(f'(?:{p})' for p in patterns)})"
+    for name, patterns in _FLEXIBLE_MAPPINGS.items()
+), re.DOTALL)
 
 class ExcelReader:
     """Handles Excel file reading and data extraction"""
@@ -15,6 +134,8 @@ class ExcelReader:
     def __init__(self):
         """Initialize Excel reader"""
         self.logger = logging.getLogger(__name__)
+        # (path, mtime_ns, size) -> okunmuş DataFrame; aynı dosya tekrar çözümlenmez
+        self._frame_cache: "OrderedDict[Tuple[str, int, int], pd.DataFrame]" = OrderedDict()
 
     def read_excel_flexible(self, file_path: Path, data_type: str = 'students') -> Tuple[List[Dict], List[str], List[str]]:
         """
@@ -27,7 +148,7 @@ class ExcelReader:
 
         try:
             # Read Excel file
-            df = pd.read_excel(file_path)
+            df = self._read_excel(file_path)
             self.logger.info(f"Read Excel file with {len(df)} rows and {len(df.columns)} columns")
 
             if df.empty:
@@ -41,61 +162,59 @@ class ExcelReader:
             # Normalize column names for internal processing
             df.columns = df.columns.str.strip()
 
-            # Create flexible column mapping
-            flexible_mappings = self._create_flexible_mappings()
-
-            # Map available columns to standard names
+            # Map available columns to standard names (single combined pattern)
             mapped_columns = {}
             column_usage = {}
 
-            for col in df.columns:
-                col_lower = col.lower().strip()
-                for standard_name, patterns in flexible_mappings.items():
-                    for pattern in patterns:
-                        if re.search(pattern, col_lower):
-                            mapped_columns[col] = standard_name
-                            column_usage[standard_name] = col
-                            break
-                    if col in mapped_columns:
-                        break
-
-            # Rename mapped columns
-            df_mapped = df.rename(columns=mapped_columns)
-
-            # Process each row
-            for index, row in df.iterrows():
-                try:
-                    # Create record with all available data
-                    record = {}
-
-                    # Map all columns that have data
-                    for original_col in df.columns:
-                        value = row[original_col]
-                        if pd.notna(value) and str(value).strip():
-                            # Use mapped name if available, otherwise use original
-                            field_name = mapped_columns.get(original_col, original_col)
-                            record[field_name] = str(value).strip()
-
-                    # Add original column values for user selection
-                    record['_original_data'] = {}
-                    for col in original_columns:
-                        if col in df.columns:
-                            value = row[col]
-                            if pd.notna(value):
-                                record['_original_data'][col] = str(value).strip()
-
-                    # Validate TC kimlik number if present
-                    if 'tc_no' in record:
-                        tc_validated = self._validate_tc_number(record['tc_no'])
-                        if not tc_validated:
-                            errors.append(f"Row {index + 2}: Invalid TC number format (must be 11 digits)")
-
-                    # Only add if record has some data
-                    if any(record.get(key) for key in record if key != '_original_data'):
-                        data_list.append(record)
-
-                except Exception as e:
-                    errors.append(f"Row {index + 2}: Error processing data - {str(e)}")
+            # Sütun adları yukarıda kırpıldı; küçük harfe çevirme tek bir vektörel işlemle yapılır
+            for col, col_lower in zip(df.columns, df.columns.str.lower()):
+                match = _COLUMN_PATTERN.search(col_lower)
+                if match:
+                    standard_name = match.lastgroup
+                    mapped_columns[col] = standard_name
+                    column_usage[standard_name] = col
+
+            # Satır başına Series oluşturmadan çalış: değerler ve NaN maskesi blok blok alınır
+            columns = df.columns.tolist()
+            # Use mapped name if available, otherwise use original
+            field_names = [mapped_columns.get(col, col) for col in columns]
+            column_positions = {col: pos for pos, col in enumerate(columns)}
+            original_positions = [(col, column_positions[col]) for col in original_columns
+                                  if col in column_positions]
+
+            tc_rows = []
+            tc_values = []
+
+            # Process each row (hücreler zaten metin; satır başına hata yakalamaya gerek yok)
+            for index, values, present in self._iter_row_blocks(df):
+                # Her hücre bir kez metne çevrilir; kayıt ve _original_data aynı str nesnelerini paylaşır
+                texts = [str(value).strip() if has_value else None
+                         for value, has_value in zip(values, present)]
+
+                # Map all columns that have data
+                record = {field_name: text for field_name, text in zip(field_names, texts) if text}
+
+                # Add original column values for user selection
+                record['_original_data'] = {
+                    col: texts[pos] for col, pos in original_positions if texts[pos] is not None
+                }
+
+                # TC kimlik numarası döngüden sonra toplu doğrulanır
+                if 'tc_no' in record:
+                    tc_rows.append(index)
+                    tc_values.append(record['tc_no'])
+
+                # Only add if record has some data (kayıtta yalnızca boş olmayan metinler var)
+                if len(record) > 1:
+                    data_list.append(record)
+
+            # Validate TC kimlik numbers in one vectorized pass; hatalı satırlar maskeden alınır
+            if tc_values:
+                tc_invalid = np.flatnonzero(~self._validate_tc_numbers(tc_values))
+                errors.extend(
+                    f"Row {tc_rows[i] + 2}: Invalid TC number format (must be 11 digits)"
+                    for i in tc_invalid
+                )
 
             self.logger.info(f"Successfully processed {len(data_list)} records")
 
@@ -106,58 +225,104 @@ class ExcelReader:
 
         return data_list, errors, available_columns
 
+    def _iter_row_blocks(self, df: pd.DataFrame) -> Iterator[Tuple[int, np.ndarray, np.ndarray]]:
+        """Yield (row index, values, notna mask) converting the frame in fixed-size blocks"""
+        # Tüm tablo tek bir object dizisine çevrilmez; blok başına bir dönüşüm yapılır
+        for start in range(0, len(df), _ROW_BLOCK_SIZE):
+            block = df.iloc[start:start + _ROW_BLOCK_SIZE]
+            yield from zip(count(start), block.to_numpy(dtype=object), block.notna().to_numpy())
+
+    def _to_arrow_text(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Move text columns to pyarrow-backed strings, stripped in one vectorized pass"""
+        text_columns = df.select_dtypes(include='object').columns
+        if len(text_columns):
+            # Kırpılmış Arrow metinleri satır döngüsündeki str()/strip() çağrılarını kopyasız yapar
+            df[text_columns] = df[text_columns].apply(
+                lambda column: column.astype('string[pyarrow]').str.strip()
+            )
+        return df
+
+    def _read_excel(self, file_path: Path) -> pd.DataFrame:
+        """Read an Excel file once per (path, mtime, size); returns a shallow copy of the cached frame"""
+        stat = file_path.stat()
+        key = (str(file_path), stat.st_mtime_ns, stat.st_size)
+        df = self._frame_cache.get(key)
+        if df is None:
+            df = self._parse_excel(file_path)
+            if _PYARROW_AVAILABLE:
+                df = self._to_arrow_text(df)
+            self._frame_cache[key] = df
+            while len(self._frame_cache) > _FRAME_CACHE_SIZE:
+                self._frame_cache.popitem(last=False)
+        else:
+            self._frame_cache.move_to_end(key)
+        # Çağıran sütun adlarını değiştirebilir; veri paylaşılır, eksenler kopyalanır
+        return df.copy(deep=False)
+
+    def _parse_excel(self, file_path: Path, **kwargs) -> pd.DataFrame:
+        """Read an Excel file with the calamine engine when installed, else pandas' default"""
+        if _CALAMINE_AVAILABLE:
+            try:
+                return pd.read_excel(file_path, engine='calamine', **kwargs)
+            except (ImportError, ValueError) as e:
+                # Eski pandas sürümleri calamine motorunu tanımaz
+                self.logger.debug(f"calamine engine unavailable, using default: {e}")
+        return pd.read_excel(file_path, **kwargs)
+
+    def iter_records(self, file_path: Path) -> Iterator[Dict]:
+        """Stream rows of the first sheet as {header: value} dicts without building a DataFrame"""
+        if file_path.suffix.lower() != '.xlsx':
+            # .xls (xlrd) satır satır okunamaz; DataFrame üzerinden üretilir
+            df = self._read_excel(file_path)
+            columns = df.columns.tolist()
+            for values in df.itertuples(index=False, name=None):
+                yield dict(zip(columns, values))
+            return
+
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            columns = [str(col).strip() if col is not None else '' for col in header]
+            for values in rows:
+                # Tamamen boş satırlar atlanır
+                if any(value is not None for value in values):
+                    yield dict(zip(columns, values))
+        finally:
+            workbook.close()
+
     def _create_flexible_mappings(self) -> Dict[str, List[str]]:
         """Create flexible column mappings for different naming conventions"""
-        return {
-            'first_name': [
-                r'^ad$', r'^first.*name$', r'^ad[ıi]$', r'^isim$', r'^name$',
-                r'.*ad.*', r'.*first.*', r'.*isim.*'
-            ],
-            'last_name': [
-                r'^soyad$', r'^last.*name$', r'^surname$', r'^family.*name$',
-                r'.*soyad.*', r'.*last.*', r'.*surname.*'
-            ],
-            'student_no': [
-                r'^numara$', r'^no$', r'^student.*no$', r'^öğrenci.*no$',
-                r'^number$', r'.*numara.*', r'.*student.*', r'.*no.*'
-            ],
-            'tc_no': [
-                r'^tc$', r'^tc.*no$', r'^tc.*kimlik$', r'^kimlik.*no$',
-                r'.*tc.*', r'.*kimlik.*', r'.*identity.*'
-            ],
-            'class_name': [
-                r'^sınıf$', r'^sinif$', r'^class$', r'^sınıf.*adı$',
-                r'.*sınıf.*', r'.*sinif.*', r'.*class.*'
-            ],
-            'branch': [
-                r'^branş$', r'^brans$', r'^branch$', r'^dal$',
-                r'.*branş.*', r'.*brans.*', r'.*branch.*'
-            ],
-            'school_name': [
-                r'^okul$', r'^okul.*adı$', r'^school$', r'^school.*name$',
-                r'.*okul.*', r'.*school.*'
-            ],
-            'department': [
-                r'^bölüm$', r'^bolum$', r'^department$', r'^birim$',
-                r'.*bölüm.*', r'.*bolum.*', r'.*department.*'
-            ],
-            'phone': [
-                r'^telefon$', r'^tel$', r'^phone$', r'^gsm$',
-                r'.*telefon.*', r'.*phone.*', r'.*tel.*'
-            ],
-            'email': [
-                r'^email$', r'^e.*mail$', r'^eposta$', r'^mail$',
-                r'.*email.*', r'.*mail.*', r'.*posta.*'
-            ],
-            'birth_date': [
-                r'^doğum.*tarih$', r'^birth.*date$', r'^tarih$',
-                r'.*doğum.*', r'.*birth.*', r'.*tarih.*'
-            ],
-            'academic_year': [
-                r'^egitim.*yili$', r'^academic.*year$', r'^year$', r'^yil$', r'^dönem$', r'^donem$'
-                r'.*egitim.*', r'.*academic.*', r'.*year.*', r'.*yil.*', r'.*donem.*'
-            ]
-        }
+        return {name: list(patterns) for name, patterns in _FLEXIBLE_MAPPINGS.items()}
+
+    def _validate_tc_numbers(self, tc_values: List[str]) -> np.ndarray:
+        """Validate many TC identity numbers at once; returns a boolean array"""
+        tc_series = pd.Series(tc_values, dtype=object)
+
+        # 11 ASCII digits, first digit not 0
+        valid = tc_series.str.fullmatch(r'[1-9][0-9]{10}', na=False).to_numpy(dtype=bool)
+        if not valid.any():
+            return valid
+
+        # Geçerli biçimdeki numaraları (n, 11) rakam matrisine çevir
+        digits = np.frombuffer(''.join(tc_series[valid]).encode('ascii'), dtype=np.uint8)
+        digits = (digits.reshape(-1, 11) - ord('0')).astype(np.int16)
+
+        if NUMBA_AVAILABLE and len(digits) > _TC_NUMBA_THRESHOLD:
+            valid[valid] = _tc_checksum_batch(digits)
+            return valid
+
+        odd_sum = digits[:, 0:9:2].sum(axis=1)
+        even_sum = digits[:, 1:8:2].sum(axis=1)
+        tenth_ok = (odd_sum * 7 - even_sum) % 10 == digits[:, 9]
+        eleventh_ok = digits[:, :10].sum(axis=1) % 10 == digits[:, 10]
+
+        valid[valid] = tenth_ok & eleventh_ok
+        return valid
 
     def _validate_tc_number(self, tc_str: str) -> bool:
         """Validate Turkish TC identity number format"""
@@ -172,6 +337,17 @@ class ExcelReader:
             if tc_str[0] == '0':
                 return False
 
+            # ASCII fast path: ilk 8 rakam tek bir 64-bit tamsayıda (SWAR) toplanır
+            if tc_str.isascii():
+                raw = tc_str.encode('ascii')
+                packed = int.from_bytes(raw[:8], 'little') - _SWAR_ASCII_ZEROS
+                # Tek/çift konumdaki baytlar maskelenip çarpma ile en üst bayta toplanır
+                odd_sum = (((packed & _SWAR_EVEN_BYTES) * _SWAR_BYTE_SUM) >> 56 & 0xFF) + raw[8] - 48
+                even_sum = ((packed >> 8 & _SWAR_EVEN_BYTES) * _SWAR_BYTE_SUM) >> 56 & 0xFF
+                tenth = raw[9] - 48
+                return ((odd_sum * 7 - even_sum) % 10 == tenth
+                        and (odd_sum + even_sum + tenth) % 10 == raw[10] - 48)
+
             # TC number algorithm validation
             digits = [int(d) for d in tc_str]
 
@@ -243,12 +419,7 @@ class ExcelReader:
     def _get_fallback_identifier(self, record: Dict) -> str:
         """Get fallback identifier when selected column is not available"""
         # Try different fields in order of preference
-        fallback_fields = [
-            'student_no', 'numara', 'tc_no', 'first_name', 'ad',
-            'last_name', 'soyad', 'full_name'
-        ]
-
-        for field in fallback_fields:
+        for field in _FALLBACK_FIELDS:
             if field in record and record[field]:
                 return record[field]
 
@@ -260,12 +431,14 @@ class ExcelReader:
 
         return 'unknown'
 
-    def _clean_filename(self, filename: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _clean_filename(filename: str) -> str:
         """Clean filename for filesystem compatibility"""
         # Remove invalid characters
-        filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
+        filename = _INVALID_FILENAME_RE.sub('_', filename)
         # Replace multiple spaces/underscores with single underscore
-        filename = re.sub(r'[\s_]+', '_', filename)
+        filename = _FILENAME_SEPARATOR_RE.sub('_', filename)
         # Remove leading/trailing underscores
         filename = filename.strip('_')
         # Ensure not empty
@@ -278,24 +451,14 @@ class ExcelReader:
         if not data_list:
             return []
 
-        # Get all unique column names from original data
-        all_columns = set()
+        # Tek geçiş: en az bir kayıtta dolu olan sütunlar toplanır (boş sütunlar elenir)
+        useful_columns = set()
         for record in data_list:
-            original_data = record.get('_original_data', {})
-            all_columns.update(original_data.keys())
-
-        # Filter out empty columns
-        useful_columns = []
-        for col in sorted(all_columns):
-            # Check if this column has data in most records
-            non_empty_count = sum(
-                1 for record in data_list 
-                if record.get('_original_data', {}).get(col, '').strip()
-            )
-            if non_empty_count > 0:
-                useful_columns.append(col)
+            for col, value in record.get('_original_data', {}).items():
+                if col not in useful_columns and str(value).strip():
+                    useful_columns.add(col)
 
-        return useful_columns
+        return sorted(useful_columns)
 
     # Keep backward compatibility methods
     def read_students_excel(self, file_path: Path) -> Tuple[List[Dict], List[str]]:
@@ -322,10 +485,8 @@ class ExcelReader:
                 errors.append("File must be an Excel file (.xlsx or .xls)")
                 return False, errors
 
-            # Try to read the file
-            df = pd.read_excel(file_path)
-
-            if df.empty:
+            # Dosyanın tamamı yerine yalnızca ilk veri satırı akış olarak okunur
+            if next(self.iter_records(file_path), None) is None:
                 errors.append("Excel file is empty")
                 return False, errors
 
@@ -338,14 +499,84 @@ class ExcelReader:
             errors.append(error_msg)
             return False, errors
 
+    @staticmethod
+    def _trim_row(row) -> tuple:
+        """Drop trailing empty cells (None or '') as pandas does"""
+        filled = len(row)
+        while filled and (row[filled - 1] is None or row[filled - 1] == ''):
+            filled -= 1
+        return tuple(row[:filled])
+
+    @staticmethod
+    def _pandas_column_names(header: tuple, width: int) -> List:
+        """Column names as pandas.read_excel reports them: 'Unnamed: n' for blanks, '.1' suffix for repeats"""
+        names = []
+        seen = {}
+        for index in range(width):
+            name = header[index] if index < len(header) else None
+            if name is None or name == '':
+                name = f"Unnamed: {index}"
+            elif isinstance(name, float) and name.is_integer():
+                name = int(name)
+            count = seen.get(name, 0)
+            seen[name] = count + 1
+            if count:
+                name = f"{name}.{count}"
+            names.append(name)
+        return names
+
+    def _read_sheet_header(self, file_path: Path) -> Tuple[int, List]:
+        """Return (data row count, column names) of the first sheet without building a DataFrame
+
+        Sonuç pandas.read_excel ile aynıdır: boş satırlar sayılmaz (biçimlendirilmiş boş satırlar dahil),
+        genişlik en geniş dolu satırdan gelir ve boş başlıklar 'Unnamed: n' olarak adlandırılır.
+        """
+        if file_path.suffix.lower() == '.xls':
+            import xlrd
+
+            workbook = xlrd.open_workbook(str(file_path), on_demand=True)
+            try:
+                sheet = workbook.sheet_by_index(0)
+                rows_iter = (sheet.row_values(index) for index in range(sheet.nrows))
+                return self._summarize_rows(rows_iter)
+            finally:
+                workbook.release_resources()
+
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            # Hücreler değer olarak akıtılır; DataFrame ve tip dönüşümü yapılmaz
+            return self._summarize_rows(workbook.worksheets[0].iter_rows(values_only=True))
+        finally:
+            workbook.close()
+
+    def _summarize_rows(self, rows) -> Tuple[int, List]:
+        """Count non-empty data rows and name columns from a stream of raw row values"""
+        header = None
+        width = 0
+        data_rows = 0
+        for row in rows:
+            row = self._trim_row(row)
+            if not row:
+                continue
+            # Başlık ilk dolu satırdır (pandas boş satırları atlar)
+            if header is None:
+                header = row
+            else:
+                data_rows += 1
+            width = max(width, len(row))
+        return data_rows, self._pandas_column_names(header or (), width)
+
     def get_file_info(self, file_path: Path) -> Dict:
-        """Get basic information about Excel file"""
+        """Get basic information about Excel file (rows/columns as pandas.read_excel would report them)"""
         try:
-            df = pd.read_excel(file_path)
+            # Satırlar ham değer olarak akıtılır; DataFrame kurulmaz
+            rows, column_names = self._read_sheet_header(file_path)
             return {
-                'rows': len(df),
-                'columns': len(df.columns),
-                'column_names': df.columns.tolist(),
+                'rows': rows,
+                'columns': len(column_names),
+                'column_names': column_names,
                 'file_size': file_path.stat().st_size
             }
         except Exception as e:
@@ -7,18 +7,202 @@ Handles PDF generation for ID cards and student/teacher lists
 from fpdf import FPDF
 import logging
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, Optional, Tuple
 from PIL import Image
 import io
-import urllib.request
-import tempfile
+import re
+from datetime import datetime
 import os
+import sys
+import multiprocessing
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# simplejpeg (libjpeg-turbo) kuruluysa fotoğraf JPEG kodlaması onunla yapılır
+try:
+    import numpy as np
+    import simplejpeg
+    SIMPLEJPEG_AVAILABLE = True
+except ImportError:
+    SIMPLEJPEG_AVAILABLE = False
+
+# Bellekte tutulan hazır fotoğraf JPEG sayısı
+_PHOTO_JPEG_CACHE_SIZE = 512
+# PDF'e gömülen fotoğrafların hedef baskı çözünürlüğü
+_PHOTO_PRINT_DPI = 300
+# Kaynak JPEG hedef piksel boyutundan en fazla bu oranda farklıysa yeniden kodlanmaz
+_RAW_JPEG_TOLERANCE = 0.2
+# simplejpeg alt örnekleme adları -> Pillow 'subsampling' değerleri
+_PIL_SUBSAMPLING = {'444': 0, '422': 1, '420': 2}
+# Fotoğraf kodlama profilleri: (keskinleştirme, kalite, alt örnekleme, progressive)
+# list: sınıf/öğretmen listeleri; grid: fotoğraf listesi (yüzlerce fotoğraf, bellek sınırlı);
+# card: kimlik kartı (kart boyutunda basılır, tam kalite)
+_PHOTO_JPEG_PROFILES = {
+    'list': (None, 85, '420', True),
+    'grid': (1.3, 85, '420', True),
+    'card': (1.3, 100, '444', False),
+}
+# Arial yedeğinde Türkçe karakterlerin ASCII karşılıkları
+_TURKISH_ASCII_TRANS = str.maketrans({
+    'ç': 'c', 'Ç': 'C',
+    'ğ': 'g', 'Ğ': 'G',
+    'ı': 'i', 'İ': 'I',
+    'ö': 'o', 'Ö': 'O',
+    'ş': 's', 'Ş': 'S',
+    'ü': 'u', 'Ü': 'U'
+})
+# Fotoğraf listesi altyazıları bu ayraçlardan (boşluk, -, _, .) satırlara bölünür
+_CAPTION_SPLIT_RE = re.compile(r'[ \-_.]+')
+
+# Kimlik kartındaki fotoğraf kutusu (mm)
+_CARD_PHOTO_WIDTH = 16
+_CARD_PHOTO_HEIGHT = 20
+# Kart alanlarında denenen yazı boyutları (büyükten küçüğe)
+_CARD_FONT_SIZES = (6, 5.5, 5, 4.5)
+
+# Liste tablolarında yeni sayfaya geçilen y sınırı (mm)
+_LIST_PAGE_BREAK_Y = 280
+
+# Liste tablolarının sütunları (genişlik mm, başlık); anahtar: fotoğraflı mı
+_CLASS_LIST_HEADERS = {
+    True: ((20, 'Fotograf'), (15, 'No.'), (40, 'Adi'), (40, 'Soyadi'), (25, 'Ogrenci No')),
+    False: ((15, 'No.'), (50, 'Adi'), (50, 'Soyadi'), (30, 'Ogrenci No')),
+}
+_TEACHER_LIST_HEADERS = {
+    True: ((20, 'Fotograf'), (15, 'No.'), (40, 'Adi'), (40, 'Soyadi'), (35, 'Bransi')),
+    False: ((15, 'No.'), (50, 'Adi'), (50, 'Soyadi'), (40, 'Bransi')),
+}
+# Kart alanı -> (kişi sütunlarında aranan desen, _original_data'da tam sütun adları,
+# _original_data sütun adlarında aranan desen); desenler küçük harfli sütun adına uygulanır,
+# sıra eski eşleştirme sırasıyla aynıdır
+_PERSON_FIELD_RULES = {
+    'first_name': (re.compile(r'ad|name|first|isim'),
+                   ('ad', 'adi', 'first_name', 'name', 'isim', 'adı', 'Ad', 'ADI', 'ISIM'),
+                   re.compile(r'ad')),
+    'last_name': (re.compile(r'soyad|last|surname'),
+                  ('soyad', 'soyadi', 'last_name', 'surname', 'soyadı', 'Soyad', 'SOYAD'),
+                  re.compile(r'soyad')),
+    'class_info': (re.compile(r'sınıf|sinif|class|branş|brans|branch'),
+                   ('sınıf', 'sinif', 'class', 'class_name', 'branş', 'brans', 'branch', 'Sınıf', 'SINIF'),
+                   re.compile(r'sınıf|sinif|class')),
+    'student_no': (re.compile(r'no|numara|student_no|sicil'),
+                   ('numara', 'no', 'student_no', 'öğrenci_no', 'ogrenci_no', 'okul_no', 'sicil_no', 'sicil',
+                    'Numara', 'NO'),
+                   re.compile(r'numara|no')),
+    'tc_no': (re.compile(r'tc|kimlik'),
+              ('tc_kimlik', 'tc_no', 'tc', 'kimlik', 'kimlik_no', 'tcno', 'tc kimlik', 'TC', 'KIMLIK'),
+              re.compile(r'tc|kimlik')),
+}
+# Önbellekte tutulan farklı QR içeriği sayısı (PNG'ler küçüktür)
+_QR_PNG_CACHE_SIZE = 1024
+# Bundan az fotoğraf için süreç havuzu açmanın maliyeti kazançtan büyüktür
+_PHOTO_PREFETCH_MIN = 16
+
+
+@lru_cache(maxsize=8192)
+def _ascii_turkish(text: str) -> str:
+    """Replace Turkish letters with ASCII equivalents in one C-level pass (memoized)"""
+    return text.translate(_TURKISH_ASCII_TRANS)
+
+
+def _fit_photo_jpeg(photo_path: Path, width: float, height: float,
+                    profile: str) -> Tuple[bytes, float, float, float, float]:
+    """Fit photo into a width x height mm box; returns (jpeg, w, h, dx, dy) (süreç havuzunda da çalışır)"""
+    with Image.open(photo_path) as img:
+        # Calculate proper dimensions to maintain aspect ratio (başlıktan okunur, çözme gerekmez)
+        img_width, img_height = img.size
+        img_aspect = img_width / img_height
+        target_aspect = width / height
+
+        # Calculate new dimensions that fit within the target area
+        if img_aspect > target_aspect:
+            # Image is wider than target, fit by width, center vertically
+            new_width = width
+            new_height = width / img_aspect
+            x_offset, y_offset = 0.0, (height - new_height) / 2
+        else:
+            # Image is taller than target, fit by height, center horizontally
+            new_height = height
+            new_width = height * img_aspect
+            x_offset, y_offset = (width - new_width) / 2, 0.0
+
+        # Baskı çözünürlüğüne (300 DPI, mm cinsinden kutu) göre boyutlandır
+        px_per_mm = _PHOTO_PRINT_DPI / 25.4
+        target_pixel_width = max(int(new_width * px_per_mm), 1)
+        target_pixel_height = max(int(new_height * px_per_mm), 1)
+
+        # Zaten hedef boyuta yakın RGB JPEG'ler çözülmeden olduğu gibi gömülür
+        if (img.format == 'JPEG' and img.mode == 'RGB'
+                and abs(img_width - target_pixel_width) <= target_pixel_width * _RAW_JPEG_TOLERANCE
+                and abs(img_height - target_pixel_height) <= target_pixel_height * _RAW_JPEG_TOLERANCE):
+            return Path(photo_path).read_bytes(), new_width, new_height, x_offset, y_offset
+
+        # JPEG'ler libjpeg ölçeklemesiyle hedefin en az 2 katı boyutta çözülür
+        if img.format == 'JPEG':
+            img.draft('RGB', (target_pixel_width * 2, target_pixel_height * 2))
+
+        # Convert to RGB if necessary
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+
+        # Kaynaktan büyütme yapma
+        target_pixel_width = min(target_pixel_width, img.width)
+        target_pixel_height = min(target_pixel_height, img.height)
+
+        if (target_pixel_width, target_pixel_height) == img.size:
+            img_resized = img
+        else:
+            img_resized = img.resize((target_pixel_width, target_pixel_height), Image.Resampling.LANCZOS)
+
+        sharpness, quality, subsampling, progressive = _PHOTO_JPEG_PROFILES[profile]
+        if sharpness:
+            # Apply sharpening for better quality
+            from PIL import ImageEnhance
+            img_resized = ImageEnhance.Sharpness(img_resized).enhance(sharpness)
+        # Liste/ızgara fotoğrafları: 85 kalite ve 4:2:0 gözle ayırt edilemez, gömülen bayt ~4 kat azalır
+        jpeg_bytes = _encode_jpeg_bytes(img_resized, quality=quality, subsampling=subsampling,
+                                        progressive=progressive)
+
+    return jpeg_bytes, new_width, new_height, x_offset, y_offset
+
+
+def _encode_jpeg_bytes(img: Image.Image, quality: int, subsampling: str = '444',
+                       progressive: bool = False) -> bytes:
+    """Encode an RGB image to JPEG with simplejpeg (libjpeg-turbo) when available, else Pillow"""
+    # simplejpeg progressive kodlama desteklemez; o durumda Pillow kullanılır
+    if SIMPLEJPEG_AVAILABLE and not progressive:
+        try:
+            return simplejpeg.encode_jpeg(np.asarray(img), quality=quality,
+                                          colorspace='RGB', colorsubsampling=subsampling)
+        except Exception as e:
+            logging.getLogger(__name__).debug(f"simplejpeg encode failed, using Pillow: {e}")
+    img_bytes = io.BytesIO()
+    img.save(img_bytes, format='JPEG', quality=quality, optimize=False,
+             subsampling=_PIL_SUBSAMPLING[subsampling], progressive=progressive,
+             dpi=(_PHOTO_PRINT_DPI, _PHOTO_PRINT_DPI))
+    return img_bytes.getvalue()
+
 
 class PDFGenerator:
     """PDF generation handler for class lists and ID cards"""
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        # Logo dosyaları kartlar arasında bir kez çözülür: {(yol, mtime): Image}
+        self._logo_cache = {}
+        # (yol, mtime, boyut, arka plan) -> kodlanmış logo JPEG'i ve yerleşimi
+        self._logo_jpeg_cache = {}
+        # Kutuya sığdırılmış fotoğraf JPEG'leri: {(yol, mtime, genişlik, yükseklik, kalite): sonuç}
+        self._photo_jpeg_cache = OrderedDict()
+        self._font_files = None
+        # (font, stil, metin) -> 1pt genişlik; kart alanlarının otomatik boyutlandırması için
+        self._text_width_cache = {}
+        # (sütunlar, _original_data mı) -> kart alanı başına aday sütunlar
+        self._field_map_cache = {}
+        # QR içeriği -> PNG baytları (LRU)
+        self._qr_png_cache = OrderedDict()
         self.setup_fonts()
 
     def setup_fonts(self):
@@ -46,56 +230,103 @@ class PDFGenerator:
                          width: float, height: float) -> None:
         """Add photo to PDF at specified position with proper aspect ratio"""
         try:
-            # Open image
-            with Image.open(photo_path) as img:
-                # Convert to RGB if necessary
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
+            jpeg_bytes, new_width, new_height, x_offset, y_offset = self._render_photo_jpeg(
+                photo_path, width, height, profile='list')
 
-                # Calculate proper dimensions to maintain aspect ratio
-                img_width, img_height = img.size
-                img_aspect = img_width / img_height
-                target_aspect = width / height
-
-                # Calculate new dimensions that fit within the target area
-                if img_aspect > target_aspect:
-                    # Image is wider than target, fit by width
-                    new_width = width
-                    new_height = width / img_aspect
-                    # Center vertically
-                    y_offset = (height - new_height) / 2
-                    final_x = x
-                    final_y = y + y_offset
-                else:
-                    # Image is taller than target, fit by height
-                    new_height = height
-                    new_width = height * img_aspect
-                    # Center horizontally
-                    x_offset = (width - new_width) / 2
-                    final_x = x + x_offset
-                    final_y = y
-
-                # Resize image with much higher resolution for better quality
-                scale_factor = 8  # Increased from 4 to 8 for much better quality
-                target_pixel_width = int(new_width * scale_factor)
-                target_pixel_height = int(new_height * scale_factor)
-
-                img_resized = img.resize((target_pixel_width, target_pixel_height), Image.Resampling.LANCZOS)
-
-                # Save to temporary bytes with maximum quality
-                img_bytes = io.BytesIO()
-                img_resized.save(img_bytes, format='JPEG', quality=98, optimize=False, dpi=(300, 300))
-                img_bytes.seek(0)
-
-                # Add to PDF with calculated dimensions
-                pdf.image(img_bytes, final_x, final_y, new_width, new_height)
+            # FPDF akışı tükettiği için her çağrıda yeni bir BytesIO verilir
+            pdf.image(io.BytesIO(jpeg_bytes), x + x_offset, y + y_offset, new_width, new_height)
 
         except Exception as e:
             self.logger.error(f"Error adding photo to PDF: {e}")
             raise
 
-    def _hex_to_rgb(self, hex_color):
-        """Convert hex color to RGB tuple"""
+    def _photo_cache_key(self, photo_path: Path, width: float, height: float, profile: str) -> Tuple:
+        """Cache key for a fitted photo: (path, mtime, box width, box height, quality profile)"""
+        return (str(photo_path), os.stat(photo_path).st_mtime_ns,
+                round(width, 2), round(height, 2), profile)
+
+    def _store_photo_jpeg(self, key: Tuple, result: Tuple) -> None:
+        """Put a fitted photo into the LRU cache"""
+        self._photo_jpeg_cache[key] = result
+        if len(self._photo_jpeg_cache) > _PHOTO_JPEG_CACHE_SIZE:
+            self._photo_jpeg_cache.popitem(last=False)
+
+    def _render_photo_jpeg(self, photo_path: Path, width: float, height: float,
+                           profile: str) -> Tuple[bytes, float, float, float, float]:
+        """Fit photo into a width x height box; returns (jpeg, w, h, dx, dy), cached per file and box"""
+        key = self._photo_cache_key(photo_path, width, height, profile)
+        cached = self._photo_jpeg_cache.get(key)
+        if cached is not None:
+            self._photo_jpeg_cache.move_to_end(key)
+            return cached
+
+        # Aynı fotoğraf sınıf listesi, fotoğraf listesi ve kartlarda yeniden kullanılır
+        result = _fit_photo_jpeg(photo_path, width, height, profile)
+        self._store_photo_jpeg(key, result)
+        return result
+
+    def _create_photo_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Process pool for photo preparation, or None where one must not be started"""
+        # Uygulama sınıf PDF'lerini zaten ayrı süreçlerde üretir; işçi süreç içinde yeni havuz açılmaz.
+        # PyInstaller ile paketlenmiş sürümde freeze_support olmadan başlatılan süreçler uygulamayı yeniden açar
+        if multiprocessing.parent_process() is not None or getattr(sys, 'frozen', False):
+            return None
+        try:
+            # Çok iş parçacıklı Tk sürecini fork etmemek için her platformda spawn kullanılır
+            return ProcessPoolExecutor(max_workers=os.cpu_count() or 1,
+                                       mp_context=multiprocessing.get_context('spawn'))
+        except Exception as e:
+            self.logger.warning(f"Parallel photo preparation unavailable, continuing serially: {e}")
+            return None
+
+    def _prefetch_photo_jpegs(self, photo_paths: List[Path], width: float, height: float,
+                              profile: str, executor: Optional[ProcessPoolExecutor] = None,
+                              is_cancelled: Optional[callable] = None) -> None:
+        """Decode/resize/encode photos in a process pool ahead of the serial FPDF layout loop"""
+        pending = {}
+        for photo_path in photo_paths[:_PHOTO_JPEG_CACHE_SIZE]:
+            try:
+                key = self._photo_cache_key(photo_path, width, height, profile)
+            except OSError:
+                continue
+            if key not in self._photo_jpeg_cache:
+                pending[key] = photo_path
+        if len(pending) < _PHOTO_PREFETCH_MIN:
+            return
+
+        # Çağıran havuz vermediyse yalnızca bu çağrı için açılır
+        own_executor = executor is None
+        if own_executor:
+            executor = self._create_photo_pool()
+            if executor is None:
+                return
+
+        try:
+            futures = {
+                executor.submit(_fit_photo_jpeg, photo_path, width, height, profile): key
+                for key, photo_path in pending.items()
+            }
+            for future in as_completed(futures):
+                if is_cancelled is not None and is_cancelled():
+                    # Başlamamış işler bırakılır; sonuçlar zaten önbellek dışında kalır
+                    for pending_future in futures:
+                        pending_future.cancel()
+                    break
+                try:
+                    self._store_photo_jpeg(futures[future], future.result())
+                except Exception as e:
+                    # Hatalı fotoğraf düzen döngüsünde tekrar denenir ve orada raporlanır
+                    self.logger.debug(f"Photo prefetch failed: {e}")
+        except Exception as e:
+            self.logger.warning(f"Parallel photo preparation unavailable, continuing serially: {e}")
+        finally:
+            if own_executor:
+                executor.shutdown(cancel_futures=True)
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _hex_to_rgb(hex_color):
+        """Convert hex color to RGB tuple (şablon renkleri az sayıda; sonuç önbelleklenir)"""
         try:
             hex_color = hex_color.lstrip('#')
             if len(hex_color) == 6:
@@ -106,6 +337,71 @@ class PDFGenerator:
             return (45, 85, 165)  # Default blue if conversion fails
 
        
+    def _write_pdf(self, pdf: FPDF, output_path: Path) -> None:
+        """Write the PDF through a file object into a temporary file, then move it into place"""
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Yarım kalan yazım eski/eksik bir PDF bırakmaz; tamponu yazdıktan sonra FPDF'i bırak
+        tmp_path = output_path.with_name(output_path.name + '.part')
+        try:
+            with open(tmp_path, 'wb') as pdf_file:
+                pdf.output(pdf_file)
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _list_photo_names(self, photos_dir: Optional[Path]) -> frozenset:
+        """Names in photos_dir (os.path.normcase applied) from a single directory scan"""
+        if not photos_dir:
+            return frozenset()
+        try:
+            with os.scandir(photos_dir) as entries:
+                return frozenset(os.path.normcase(entry.name) for entry in entries)
+        except OSError as e:
+            self.logger.warning(f"Could not list photos directory {photos_dir}: {e}")
+            return frozenset()
+
+    def _prepare_table_headers(self, columns: Tuple[Tuple[float, str], ...]) -> List[Tuple[float, str]]:
+        """Convert table header labels once per document"""
+        return [(width, self._convert_turkish_chars(label)) for width, label in columns]
+
+    def _draw_table_header(self, pdf: FPDF, headers: List[Tuple[float, str]]) -> None:
+        """Draw a bold table header row; the last cell moves to the next line"""
+        pdf.set_font(self.default_font, 'B', 12)
+        last = len(headers) - 1
+        for index, (width, label) in enumerate(headers):
+            pdf.cell(width, 8, label, 1, 1 if index == last else 0, 'C')
+
+    def _rows_fitting(self, pdf: FPDF, row_height: float) -> int:
+        """Number of fixed-height table rows that fit between the cursor and the list page-break line"""
+        # FPDF'in otomatik sayfa sonu daha yukarıdaysa o sınır esas alınır (satır ortadan bölünmesin)
+        limit = min(_LIST_PAGE_BREAK_Y, pdf.page_break_trigger)
+        # Satır y + row_height <= sınır olduğu sürece sığar; en az bir satır her sayfaya yazılır
+        return max(1, int((limit - pdf.get_y()) / row_height + 1e-9))
+
+    def _draw_table_grid(self, pdf: FPDF, headers: List[Tuple[float, str]], top: float,
+                         row_height: float, rows: int) -> None:
+        """Draw the borders of a page's data rows with one line per grid edge"""
+        if rows <= 0:
+            return
+        left = pdf.l_margin
+        right = left + sum(width for width, _ in headers)
+        bottom = top + rows * row_height
+        # Yatay çizgiler (üst kenar başlık satırının alt kenarıdır)
+        for index in range(1, rows + 1):
+            line_y = top + index * row_height
+            pdf.line(left, line_y, right, line_y)
+        # Dikey çizgiler
+        line_x = left
+        pdf.line(line_x, top, line_x, bottom)
+        for width, _ in headers:
+            line_x += width
+            pdf.line(line_x, top, line_x, bottom)
+
+    def _creation_footer_text(self) -> str:
+        """Footer line with the document creation time"""
+        return self._convert_turkish_chars(f'Olusturma Tarihi: {datetime.now().strftime("%d.%m.%Y %H:%M")}')
+
     def generate_class_list(self, students: List[Dict], class_name: str, 
                         output_path: Path, include_photos: bool = False,
                         photos_dir: Optional[Path] = None) -> bool:
@@ -116,6 +412,9 @@ class PDFGenerator:
             # Yazı tipi yüklemesini tek noktadan yap
             self._register_fonts(pdf)
 
+            # Fotoğraf klasörü bir kez listelenir; satır başına exists() çağrısı yapılmaz
+            photo_names = self._list_photo_names(photos_dir) if include_photos else frozenset()
+
             pdf.add_page()
             
             # Başlık - Türkçe karakterlerle
@@ -123,83 +422,72 @@ class PDFGenerator:
             pdf.cell(0, 10, f'Sınıf Listesi - {class_name}', 0, 1, 'C')
             pdf.ln(5)
 
-            # Headers
-            pdf.set_font(self.default_font, 'B', 12)
-            if include_photos:
-                pdf.cell(20, 8, 'Fotoğraf', 1, 0, 'C')
-                pdf.cell(15, 8, 'No.', 1, 0, 'C')
-                pdf.cell(40, 8, 'Adı', 1, 0, 'C')
-                pdf.cell(40, 8, 'Soyadı', 1, 0, 'C')
-                pdf.cell(25, 8, 'Öğrenci No', 1, 1, 'C')
-                row_height = 20
-            else:
-                pdf.cell(15, 8, self._convert_turkish_chars('No.'), 1, 0, 'C')
-                pdf.cell(50, 8, self._convert_turkish_chars('Adi'), 1, 0, 'C')
-                pdf.cell(50, 8, self._convert_turkish_chars('Soyadi'), 1, 0, 'C')
-                pdf.cell(30, 8, self._convert_turkish_chars('Ogrenci No'), 1, 1, 'C')
-                row_height = 8
+            # Headers (dönüştürülmüş başlıklar bir kez hazırlanır, sayfa sonlarında yeniden kullanılır)
+            headers = self._prepare_table_headers(_CLASS_LIST_HEADERS[include_photos])
+            self._draw_table_header(pdf, headers)
+            pdf.set_font(self.default_font, '', 10)
+            row_height = 20 if include_photos else 8
 
             # Student data with Turkish character support
-            pdf.set_font(self.default_font, '', 10)
+            # Sayfaya sığan satır sayısı sayfa başında bir kez hesaplanır (satır başına get_y() yok);
+            # hücreler kenarlıksız yazılır, kenarlıklar sayfa sonunda tek seferde çizilir
+            rows_left = self._rows_fitting(pdf, row_height)
+            page_top = pdf.get_y()
+            page_rows = 0
             for i, student in enumerate(students, 1):
                 # Check if new page needed
-                if pdf.get_y() + row_height > 280:
+                if rows_left == 0:
+                    self._draw_table_grid(pdf, headers, page_top, row_height, page_rows)
                     pdf.add_page()
                     # Re-add headers
-                    pdf.set_font(self.default_font, 'B', 12)
-                    if include_photos:
-                        pdf.cell(20, 8, 'Fotograf', 1, 0, 'C')
-                        pdf.cell(15, 8, 'No.', 1, 0, 'C')
-                        pdf.cell(40, 8, 'Adi', 1, 0, 'C')
-                        pdf.cell(40, 8, 'Soyadi', 1, 0, 'C')
-                        pdf.cell(25, 8, 'Ogrenci No', 1, 1, 'C')
-                    else:
-                        pdf.cell(15, 8, 'No.', 1, 0, 'C')
-                        pdf.cell(50, 8, 'Adi', 1, 0, 'C')
-                        pdf.cell(50, 8, 'Soyadi', 1, 0, 'C')
-                        pdf.cell(30, 8, 'Ogrenci No', 1, 1, 'C')
+                    self._draw_table_header(pdf, headers)
                     pdf.set_font(self.default_font, '', 10)
-
-                y_start = pdf.get_y()
+                    rows_left = self._rows_fitting(pdf, row_height)
+                    page_top = pdf.get_y()
+                    page_rows = 0
+                rows_left -= 1
+                page_rows += 1
 
                 # Convert student names to safe characters
                 safe_first_name = self._convert_turkish_chars(student.get('first_name', ''))
                 safe_last_name = self._convert_turkish_chars(student.get('last_name', ''))
 
                 if include_photos:
+                    y_start = pdf.get_y()
+
                     # Photo cell
-                    pdf.cell(20, row_height, '', 1, 0, 'C')
+                    pdf.cell(20, row_height, '', 0, 0, 'C')
 
                     # Add photo if available
                     if photos_dir and student.get('photo_filename'):
                         photo_path = photos_dir / student['photo_filename']
-                        if photo_path.exists():
+                        if os.path.normcase(student['photo_filename']) in photo_names:
                             try:
                                 self._add_photo_to_pdf(pdf, photo_path, 
                                                      pdf.get_x() - 18, y_start + 2, 16, 16)
                             except Exception as e:
                                 self.logger.warning(f"Could not add photo for student {i}: {e}")
 
-                    pdf.cell(15, row_height, str(i), 1, 0, 'C')
-                    pdf.cell(40, row_height, safe_first_name[:18], 1, 0, 'L')
-                    pdf.cell(40, row_height, safe_last_name[:18], 1, 0, 'L')
-                    pdf.cell(25, row_height, str(student.get('student_no', ''))[:12], 1, 1, 'C')
+                    pdf.cell(15, row_height, str(i), 0, 0, 'C')
+                    pdf.cell(40, row_height, safe_first_name[:18], 0, 0, 'L')
+                    pdf.cell(40, row_height, safe_last_name[:18], 0, 0, 'L')
+                    pdf.cell(25, row_height, str(student.get('student_no', ''))[:12], 0, 1, 'C')
                 else:
-                    pdf.cell(15, row_height, str(i), 1, 0, 'C')
-                    pdf.cell(50, row_height, safe_first_name[:23], 1, 0, 'L')
-                    pdf.cell(50, row_height, safe_last_name[:23], 1, 0, 'L')
-                    pdf.cell(30, row_height, str(student.get('student_no', ''))[:15], 1, 1, 'C')
+                    pdf.cell(15, row_height, str(i), 0, 0, 'C')
+                    pdf.cell(50, row_height, safe_first_name[:23], 0, 0, 'L')
+                    pdf.cell(50, row_height, safe_last_name[:23], 0, 0, 'L')
+                    pdf.cell(30, row_height, str(student.get('student_no', ''))[:15], 0, 1, 'C')
+
+            self._draw_table_grid(pdf, headers, page_top, row_height, page_rows)
 
             # Footer with Turkish character support
             pdf.ln(10)
             pdf.set_font(self.default_font, 'I', 8)
-            from datetime import datetime
-            footer_text = self._convert_turkish_chars(f'Olusturma Tarihi: {datetime.now().strftime("%d.%m.%Y %H:%M")}')
+            footer_text = self._creation_footer_text()
             pdf.cell(0, 5, footer_text, 0, 1, 'R')
 
             # Save PDF
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            pdf.output(str(output_path))
+            self._write_pdf(pdf, output_path)
 
             self.logger.info(f"Generated class list PDF: {output_path}")
             return True
@@ -217,6 +505,9 @@ class PDFGenerator:
             
             # Add DejaVu fonts if available
             self._register_fonts(pdf)
+
+            # Fotoğraf klasörü bir kez listelenir (ağ sürücülerinde N adet stat yerine tek okuma)
+            photo_names = self._list_photo_names(photos_dir)
             
             pdf.add_page()
 
@@ -268,6 +559,23 @@ class PDFGenerator:
             pdf.ln(5)
             current_y = pdf.get_y()
 
+            # Fotoğraflar düzen döngüsünden önce paralel hazırlanır; döngü yalnızca önbellekten yerleştirir
+            self._prefetch_photo_jpegs(
+                [photos_dir / info['filename'] for info in photos_with_names
+                 if info.get('filename') and os.path.normcase(info['filename']) in photo_names],
+                photo_width - 2, photo_height - 2, profile='grid')
+
+            # Sayfa içi hücre konumları ve altyazı satırları bir kez hesaplanır
+            cell_offsets = [
+                (margin + (i % grid_cols) * (photo_width + spacing),
+                 (i // grid_cols) * (photo_height + text_space + spacing))
+                for i in range(photos_per_page)
+            ]
+            char_width = 0.7  # Character width for 6pt font
+            available_width = photo_width - 4  # Leave 2mm margin on each side
+            max_chars_per_line = max(8, int(available_width / char_width))
+            captions = [self._wrap_grid_caption(info, max_chars_per_line) for info in photos_with_names]
+
             for page_start in range(0, len(photos_with_names), photos_per_page):
                 if page_start > 0:
                     pdf.add_page()
@@ -280,12 +588,9 @@ class PDFGenerator:
                 page_photos = photos_with_names[page_start:page_start + photos_per_page]
 
                 for i, photo_info in enumerate(page_photos):
-                    row = i // grid_cols
-                    col = i % grid_cols
-
-                    # Calculate position with proper spacing
-                    x = margin + col * (photo_width + spacing)
-                    y = current_y + row * (photo_height + text_space + spacing)
+                    # Position with proper spacing (sayfa içi konumlar önceden hesaplandı)
+                    x, y_offset = cell_offsets[i]
+                    y = current_y + y_offset
 
                     # Photo frame with proper proportions
                     pdf.set_line_width(0.2)
@@ -294,10 +599,10 @@ class PDFGenerator:
 
                     # Add photo if exists with high quality
                     photo_path = photos_dir / photo_info['filename']
-                    if photo_path.exists():
+                    if os.path.normcase(photo_info['filename']) in photo_names:
                         try:
                             self._add_high_quality_photo_to_pdf(pdf, photo_path, x + 1, y + 1, 
-                                                 photo_width - 2, photo_height - 2)
+                                                 photo_width - 2, photo_height - 2, profile='grid')
                         except Exception as e:
                             self.logger.warning(f"Could not add photo {photo_info['filename']}: {e}")
                             # Photo placeholder on error
@@ -320,81 +625,8 @@ class PDFGenerator:
                     pdf.set_text_color(0, 0, 0)
                     pdf.set_font(self.default_font, '', 6)  # 6 punto font as requested
 
-                    # Get filename and convert Turkish characters
-                    display_name = photo_info.get('display_name', photo_info.get('filename', 'Unknown'))
-                    
-                    # If display_name is empty or just the filename, try to extract meaningful name
-                    if not display_name or display_name == 'Unknown' or display_name == photo_info.get('filename', ''):
-                        # Use filename without extension as fallback
-                        display_name = Path(photo_info.get('filename', 'Unknown')).stem
-                    
-                    # Convert Turkish characters for font compatibility
-                    safe_display_name = self._convert_turkish_chars(str(display_name))
-
-                    # Smart line breaking based on separators in filename
-                    # Split by common separators used in Excel data
-                    separators = [' ', '-', '_', '.']
-                    parts = []
-
-                    # Split the filename by separators while keeping track of what was split
-                    temp_parts = [safe_display_name]
-                    for sep in separators:
-                        new_temp_parts = []
-                        for part in temp_parts:
-                            if sep in part:
-                                split_parts = part.split(sep)
-                                # Filter out empty parts
-                                split_parts = [p.strip() for p in split_parts if p.strip()]
-                                new_temp_parts.extend(split_parts)
-                            else:
-                                new_temp_parts.append(part)
-                        temp_parts = new_temp_parts
-
-                    parts = temp_parts
-
-                    # Create lines from parts - each part on separate line for clarity
-                    lines = []
-                    for part in parts:  # Use all parts, no limit
-                        if part and part.strip():
-                            # Ensure part fits in available width
-                            char_width = 0.7  # Character width for 6pt font
-                            available_width = photo_width - 4  # Leave 2mm margin on each side
-                            max_chars_per_line = max(8, int(available_width / char_width))
-
-                            if len(part) > max_chars_per_line:
-                                # Truncate long parts with ellipsis
-                                part = part[:max_chars_per_line-3] + "..."
-
-                            lines.append(part.strip())
-
-                    # If we have very short parts (4-5 chars), we can combine some on same line
-                    if len(lines) > 1:
-                        combined_lines = []
-                        current_combined = ""
-
-                        for line in lines:
-                            # If both current and new line are short, combine them
-                            if len(line) <= 5 and len(current_combined) <= 5 and current_combined:
-                                test_combined = current_combined + " " + line
-                                char_width = 0.7
-                                available_width = photo_width - 4
-                                max_chars_per_line = max(8, int(available_width / char_width))
-
-                                if len(test_combined) <= max_chars_per_line:
-                                    current_combined = test_combined
-                                else:
-                                    combined_lines.append(current_combined)
-                                    current_combined = line
-                            else:
-                                if current_combined:
-                                    combined_lines.append(current_combined)
-                                current_combined = line
-
-                        if current_combined:
-                            combined_lines.append(current_combined)
-
-                        # Use combined lines if they result in better layout
-                        lines = combined_lines
+                    # Satırlara bölünmüş altyazı döngüden önce hazırlandı
+                    lines = captions[page_start + i]
 
                     # Write each line with proper spacing - text area width equals photo width
                     text_start_y = y + photo_height + spacing  # Use same spacing as between photos
@@ -419,13 +651,11 @@ class PDFGenerator:
             # Footer
             pdf.ln(10)
             pdf.set_font(self.default_font, 'I', 8)
-            from datetime import datetime
-            footer_text = self._convert_turkish_chars(f'Olusturma Tarihi: {datetime.now().strftime("%d.%m.%Y %H:%M")}')
+            footer_text = self._creation_footer_text()
             pdf.cell(0, 5, footer_text, 0, 1, 'R')
 
             # Save PDF
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            pdf.output(str(output_path))
+            self._write_pdf(pdf, output_path)
 
             self.logger.info(f"Generated class photo grid PDF: {output_path}")
             return True
@@ -434,6 +664,58 @@ class PDFGenerator:
             self.logger.error(f"Error generating class photo grid PDF: {e}")
             return False
 
+    def _wrap_grid_caption(self, photo_info: Dict, max_chars_per_line: int) -> List[str]:
+        """Split a grid photo caption into short lines on name separators"""
+        # Get filename and convert Turkish characters
+        display_name = photo_info.get('display_name', photo_info.get('filename', 'Unknown'))
+
+        # If display_name is empty or just the filename, try to extract meaningful name
+        if not display_name or display_name == 'Unknown' or display_name == photo_info.get('filename', ''):
+            # Use filename without extension as fallback
+            display_name = Path(photo_info.get('filename', 'Unknown')).stem
+
+        # Convert Turkish characters for font compatibility
+        safe_display_name = self._convert_turkish_chars(str(display_name))
+
+        # Smart line breaking based on separators in filename
+        # Split by common separators used in Excel data (tek regex geçişi, boş parçalar atılır)
+        parts = [p.strip() for p in _CAPTION_SPLIT_RE.split(safe_display_name) if p.strip()]
+
+        # Create lines from parts - each part on separate line for clarity
+        lines = []
+        for part in parts:  # Use all parts, no limit
+            if len(part) > max_chars_per_line:
+                # Truncate long parts with ellipsis
+                part = part[:max_chars_per_line-3] + "..."
+            lines.append(part.strip())
+
+        # If we have very short parts (4-5 chars), we can combine some on same line
+        if len(lines) > 1:
+            combined_lines = []
+            current_combined = ""
+
+            for line in lines:
+                # If both current and new line are short, combine them
+                if len(line) <= 5 and len(current_combined) <= 5 and current_combined:
+                    test_combined = current_combined + " " + line
+                    if len(test_combined) <= max_chars_per_line:
+                        current_combined = test_combined
+                    else:
+                        combined_lines.append(current_combined)
+                        current_combined = line
+                else:
+                    if current_combined:
+                        combined_lines.append(current_combined)
+                    current_combined = line
+
+            if current_combined:
+                combined_lines.append(current_combined)
+
+            # Use combined lines if they result in better layout
+            lines = combined_lines
+
+        return lines
+
     def generate_teacher_list(self, teachers: List[Dict], school_name: str,
                              output_path: Path, include_photos: bool = False,
                              photos_dir: Optional[Path] = None) -> bool:
@@ -443,6 +725,9 @@ class PDFGenerator:
             
             # Add DejaVu fonts if available
             self._register_fonts(pdf)
+
+            # Fotoğraf klasörü bir kez listelenir; satır başına exists() çağrısı yapılmaz
+            photo_names = self._list_photo_names(photos_dir) if include_photos else frozenset()
             
             pdf.add_page()
 
@@ -453,44 +738,31 @@ class PDFGenerator:
             pdf.cell(0, 10, safe_title, 0, 1, 'C')
             pdf.ln(5)
 
-            # Headers with Turkish character support
-            pdf.set_font(self.default_font, 'B', 12)
-            if include_photos:
-                pdf.cell(20, 8, self._convert_turkish_chars('Fotograf'), 1, 0, 'C')
-                pdf.cell(15, 8, self._convert_turkish_chars('No.'), 1, 0, 'C')
-                pdf.cell(40, 8, self._convert_turkish_chars('Adi'), 1, 0, 'C')
-                pdf.cell(40, 8, self._convert_turkish_chars('Soyadi'), 1, 0, 'C')
-                pdf.cell(35, 8, self._convert_turkish_chars('Bransi'), 1, 1, 'C')
-                row_height = 20
-            else:
-                pdf.cell(15, 8, self._convert_turkish_chars('No.'), 1, 0, 'C')
-                pdf.cell(50, 8, self._convert_turkish_chars('Adi'), 1, 0, 'C')
-                pdf.cell(50, 8, self._convert_turkish_chars('Soyadi'), 1, 0, 'C')
-                pdf.cell(40, 8, self._convert_turkish_chars('Bransi'), 1, 1, 'C')
-                row_height = 8
+            # Headers with Turkish character support (bir kez dönüştürülür)
+            headers = self._prepare_table_headers(_TEACHER_LIST_HEADERS[include_photos])
+            self._draw_table_header(pdf, headers)
+            pdf.set_font(self.default_font, '', 10)
+            row_height = 20 if include_photos else 8
 
             # Teacher data with Turkish character support
-            pdf.set_font(self.default_font, '', 10)
+            # Sayfaya sığan satır sayısı sayfa başında bir kez hesaplanır (satır başına get_y() yok);
+            # hücreler kenarlıksız yazılır, kenarlıklar sayfa sonunda tek seferde çizilir
+            rows_left = self._rows_fitting(pdf, row_height)
+            page_top = pdf.get_y()
+            page_rows = 0
             for i, teacher in enumerate(teachers, 1):
                 # Check if new page needed
-                if pdf.get_y() + row_height > 280:
+                if rows_left == 0:
+                    self._draw_table_grid(pdf, headers, page_top, row_height, page_rows)
                     pdf.add_page()
                     # Re-add headers
-                    pdf.set_font(self.default_font, 'B', 12)
-                    if include_photos:
-                        pdf.cell(20, 8, 'Fotograf', 1, 0, 'C')
-                        pdf.cell(15, 8, 'No.', 1, 0, 'C')
-                        pdf.cell(40, 8, 'Adi', 1, 0, 'C')
-                        pdf.cell(40, 8, 'Soyadi', 1, 0, 'C')
-                        pdf.cell(35, 8, 'Bransi', 1, 1, 'C')
-                    else:
-                        pdf.cell(15, 8, 'No.', 1, 0, 'C')
-                        pdf.cell(50, 8, 'Adi', 1, 0, 'C')
-                        pdf.cell(50, 8, 'Soyadi', 1, 0, 'C')
-                        pdf.cell(40, 8, 'Bransi', 1, 1, 'C')
+                    self._draw_table_header(pdf, headers)
                     pdf.set_font(self.default_font, '', 10)
-
-                y_start = pdf.get_y()
+                    rows_left = self._rows_fitting(pdf, row_height)
+                    page_top = pdf.get_y()
+                    page_rows = 0
+                rows_left -= 1
+                page_rows += 1
 
                 # Convert teacher names and branch to safe characters
                 safe_first_name = self._convert_turkish_chars(teacher.get('first_name', ''))
@@ -498,39 +770,41 @@ class PDFGenerator:
                 safe_branch = self._convert_turkish_chars(teacher.get('branch', ''))
 
                 if include_photos:
+                    y_start = pdf.get_y()
+
                     # Photo cell
-                    pdf.cell(20, row_height, '', 1, 0, 'C')
+                    pdf.cell(20, row_height, '', 0, 0, 'C')
 
                     # Add photo if available
                     if photos_dir and teacher.get('photo_filename'):
                         photo_path = photos_dir / teacher['photo_filename']
-                        if photo_path.exists():
+                        if os.path.normcase(teacher['photo_filename']) in photo_names:
                             try:
                                 self._add_photo_to_pdf(pdf, photo_path, 
                                                      pdf.get_x() - 18, y_start + 2, 16, 16)
                             except Exception as e:
                                 self.logger.warning(f"Could not add photo for teacher {i}: {e}")
 
-                    pdf.cell(15, row_height, str(i), 1, 0, 'C')
-                    pdf.cell(40, row_height, safe_first_name[:18], 1, 0, 'L')
-                    pdf.cell(40, row_height, safe_last_name[:18], 1, 0, 'L')
-                    pdf.cell(35, row_height, safe_branch[:15], 1, 1, 'L')
+                    pdf.cell(15, row_height, str(i), 0, 0, 'C')
+                    pdf.cell(40, row_height, safe_first_name[:18], 0, 0, 'L')
+                    pdf.cell(40, row_height, safe_last_name[:18], 0, 0, 'L')
+                    pdf.cell(35, row_height, safe_branch[:15], 0, 1, 'L')
                 else:
-                    pdf.cell(15, row_height, str(i), 1, 0, 'C')
-                    pdf.cell(50, row_height, safe_first_name[:23], 1, 0, 'L')
-                    pdf.cell(50, row_height, safe_last_name[:23], 1, 0, 'L')
-                    pdf.cell(40, row_height, safe_branch[:18], 1, 1, 'L')
+                    pdf.cell(15, row_height, str(i), 0, 0, 'C')
+                    pdf.cell(50, row_height, safe_first_name[:23], 0, 0, 'L')
+                    pdf.cell(50, row_height, safe_last_name[:23], 0, 0, 'L')
+                    pdf.cell(40, row_height, safe_branch[:18], 0, 1, 'L')
+
+            self._draw_table_grid(pdf, headers, page_top, row_height, page_rows)
 
             # Footer with Turkish character support
             pdf.ln(10)
             pdf.set_font(self.default_font, 'I', 8)
-            from datetime import datetime
-            footer_text = self._convert_turkish_chars(f'Olusturma Tarihi: {datetime.now().strftime("%d.%m.%Y %H:%M")}')
+            footer_text = self._creation_footer_text()
             pdf.cell(0, 5, footer_text, 0, 1, 'R')
 
             # Save PDF
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            pdf.output(str(output_path))
+            self._write_pdf(pdf, output_path)
 
             self.logger.info(f"Generated teacher list PDF: {output_path}")
             return True
@@ -539,12 +813,17 @@ class PDFGenerator:
             self.logger.error(f"Error generating teacher list PDF: {e}")
             return False
 
-    def generate_id_cards(self, people: List[Dict], template_type: str, 
+    def generate_id_cards(self, people: Iterable[Dict], template_type: str, 
                           output_path: Path, photos_dir: Optional[Path] = None, 
-                          progress_callback: Optional[callable] = None) -> bool:
+                          progress_callback: Optional[callable] = None,
+                          total_people: Optional[int] = None,
+                          is_cancelled: Optional[callable] = None) -> bool:
         """
         Generate professional ID cards PDF with cutting guides - 10 cards per A4 page
+        people may be a generator; pass total_people for progress in that case
         """
+        # Fotoğraf hazırlama havuzu tüm parçalar için bir kez açılır
+        photo_pool = self._create_photo_pool() if photos_dir else None
         try:
             pdf = FPDF('P', 'mm', 'A4')
             pdf.set_auto_page_break(auto=False)
@@ -581,39 +860,57 @@ class PDFGenerator:
             start_y = card_spacing_y
 
             card_count = 0
-            total_people = len(people)
-
-            for person in people:
-                # Add new page if needed
-                if card_count % cards_per_page == 0:
-                    pdf.add_page()
-
-                    # Draw cutting guides for 2x5 layout
-                    self._draw_cutting_guides_2x5(pdf, start_x, start_y, card_width, card_height,
-                                                  card_spacing_x, card_spacing_y)
-
-                # Calculate position for this card
-                row = (card_count % cards_per_page) // cards_per_row
-                col = (card_count % cards_per_page) % cards_per_row
-
-                x = start_x + col * (card_width + card_spacing_x)
-                y = start_y + row * (card_height + card_spacing_y)
-
-                # Draw card
-                self._draw_professional_id_card(pdf, person, x, y, card_width, card_height, 
-                                                template_type, photos_dir)
-
-                card_count += 1
+            if total_people is None:
+                total_people = len(people)
+
+            # Kişiler parçalar halinde akar; her parçanın fotoğrafları süreç havuzunda hazırlanır,
+            # yerleşim tek FPDF üzerinde seri kalır (font/logo nesneleri tek belgede paylaşılır)
+            people_iter = iter(people)
+            while True:
+                batch = list(islice(people_iter, _PHOTO_JPEG_CACHE_SIZE))
+                if not batch:
+                    break
+                if photo_pool is not None:
+                    self._prefetch_photo_jpegs(
+                        [photos_dir / person['photo_filename'] for person in batch if person.get('photo_filename')],
+                        _CARD_PHOTO_WIDTH, _CARD_PHOTO_HEIGHT, profile='card',
+                        executor=photo_pool, is_cancelled=is_cancelled)
+
+                for person in batch:
+                    # Add new page if needed
+                    if card_count % cards_per_page == 0:
+                        pdf.add_page()
+
+                        # Draw cutting guides for 2x5 layout
+                        self._draw_cutting_guides_2x5(pdf, start_x, start_y, card_width, card_height,
+                                                      card_spacing_x, card_spacing_y)
+
+                    # Calculate position for this card
+                    row = (card_count % cards_per_page) // cards_per_row
+                    col = (card_count % cards_per_page) % cards_per_row
+
+                    x = start_x + col * (card_width + card_spacing_x)
+                    y = start_y + row * (card_height + card_spacing_y)
+
+                    # Draw card
+                    self._draw_professional_id_card(pdf, person, x, y, card_width, card_height, 
+                                                    template_type, photos_dir)
+
+                    card_count += 1
                 
-                # İlerleme callback'ini çağır
-                if progress_callback:
-                    progress_percent = (card_count / total_people) * 100
-                    person_name = f"{person.get('first_name', '')} {person.get('last_name', '')}".strip()
-                    progress_callback(progress_percent, f"Kimlik kartı: {person_name} ({card_count}/{total_people})")
+                    # İlerleme callback'ini çağır
+                    if progress_callback:
+                        progress_percent = (card_count / total_people) * 100
+                        person_name = f"{person.get('first_name', '')} {person.get('last_name', '')}".strip()
+                        progress_callback(progress_percent, f"Kimlik kartı: {person_name} ({card_count}/{total_people})")
+
+            # İptal edildiyse eksik PDF yazılmaz; aynı yoldaki önceki PDF olduğu gibi kalır
+            if is_cancelled is not None and is_cancelled():
+                self.logger.info("ID card generation cancelled, PDF not written")
+                return False
 
             # Save PDF
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            pdf.output(str(output_path))
+            self._write_pdf(pdf, output_path)
 
             self.logger.info(f"Generated {card_count} ID cards PDF: {output_path}")
             return True
@@ -621,68 +918,59 @@ class PDFGenerator:
         except Exception as e:
             self.logger.error(f"Error generating ID cards PDF: {e}")
             return False
+        finally:
+            if photo_pool is not None:
+                photo_pool.shutdown(cancel_futures=True)
 
 
     def _draw_cutting_guides_2x4(self, pdf: FPDF, start_x: float, start_y: float, 
                                 card_width: float, card_height: float,
                                 spacing_x: float, spacing_y: float):
         """Draw cutting guides for 2x4 card layout"""
-        pdf.set_line_width(0.2)
-        pdf.set_draw_color(128, 128, 128)
-        pdf.set_dash_pattern(dash=2, gap=2)
-
-        guide_length = 5
-
-        # Vertical cutting lines (between columns)
-        center_x = start_x + card_width + spacing_x/2
-        for row in range(4):
-            y_pos = start_y + row * (card_height + spacing_y)
-            # Top guide
-            pdf.line(center_x, y_pos - guide_length, center_x, y_pos)
-            # Bottom guide
-            pdf.line(center_x, y_pos + card_height, center_x, y_pos + card_height + guide_length)
-
-        # Horizontal cutting lines (between rows)
-        for row in range(1, 4):
-            y_pos = start_y + row * (card_height + spacing_y) - spacing_y/2
-            for col in range(2):
-                x_pos = start_x + col * (card_width + spacing_x)
-                # Left guide
-                pdf.line(x_pos - guide_length, y_pos, x_pos, y_pos)
-                # Right guide
-                pdf.line(x_pos + card_width, y_pos, x_pos + card_width + guide_length, y_pos)
-
-        # Reset line style
-        pdf.set_dash_pattern()
+        self._draw_cutting_guides(pdf, 4, start_x, start_y, card_width, card_height, spacing_x, spacing_y)
 
     def _draw_cutting_guides_2x5(self, pdf: FPDF, start_x: float, start_y: float, 
                                 card_width: float, card_height: float,
                                 spacing_x: float, spacing_y: float):
         """Draw cutting guides for 2x5 card layout"""
+        self._draw_cutting_guides(pdf, 5, start_x, start_y, card_width, card_height, spacing_x, spacing_y)
+
+    def _draw_cutting_guides(self, pdf: FPDF, rows: int, start_x: float, start_y: float,
+                             card_width: float, card_height: float,
+                             spacing_x: float, spacing_y: float):
+        """Draw cutting guides for a 2-column card layout as one content-stream write"""
         pdf.set_line_width(0.2)
         pdf.set_draw_color(128, 128, 128)
         pdf.set_dash_pattern(dash=2, gap=2)
 
         guide_length = 5
+        segments = []
 
         # Vertical cutting lines (between columns)
         center_x = start_x + card_width + spacing_x/2
-        for row in range(5):
+        for row in range(rows):
             y_pos = start_y + row * (card_height + spacing_y)
             # Top guide
-            pdf.line(center_x, y_pos - guide_length, center_x, y_pos)
+            segments.append((center_x, y_pos - guide_length, center_x, y_pos))
             # Bottom guide
-            pdf.line(center_x, y_pos + card_height, center_x, y_pos + card_height + guide_length)
+            segments.append((center_x, y_pos + card_height, center_x, y_pos + card_height + guide_length))
 
         # Horizontal cutting lines (between rows)
-        for row in range(1, 5):
+        for row in range(1, rows):
             y_pos = start_y + row * (card_height + spacing_y) - spacing_y/2
             for col in range(2):
                 x_pos = start_x + col * (card_width + spacing_x)
                 # Left guide
-                pdf.line(x_pos - guide_length, y_pos, x_pos, y_pos)
+                segments.append((x_pos - guide_length, y_pos, x_pos, y_pos))
                 # Right guide
-                pdf.line(x_pos + card_width, y_pos, x_pos + card_width + guide_length, y_pos)
+                segments.append((x_pos + card_width, y_pos, x_pos + card_width + guide_length, y_pos))
+
+        # pdf.line() ile aynı operatörler; satır başına bir çağrı yerine tek yazım
+        k, page_h = pdf.k, pdf.h
+        pdf._out("\n".join(
+            f"{x1 * k:.2f} {(page_h - y1) * k:.2f} m {x2 * k:.2f} {(page_h - y2) * k:.2f} l S"
+            for x1, y1, x2, y2 in segments
+        ))
 
         # Reset line style
         pdf.set_dash_pattern()
@@ -784,14 +1072,12 @@ class PDFGenerator:
         safe_line1 = self._convert_turkish_chars(str(header_line1)[:35])
         pdf.cell(text_width, line_height, safe_line1, 0, 0, 'C')
         
-        # Line 2 - Valilik/Müdürlük - dikey ortalanmış
-        pdf.set_font(self.default_font, 'B', 6)
+        # Line 2 - Valilik/Müdürlük - dikey ortalanmış (font 1. satırla aynı)
         pdf.set_xy(text_start_x, text_start_y + line_height)
         safe_line2 = self._convert_turkish_chars(str(header_line2)[:35])
         pdf.cell(text_width, line_height, safe_line2, 0, 0, 'C')
         
         # Line 3 - Okul adı - dikey ortalanmış
-        pdf.set_font(self.default_font, 'B', 6)
         pdf.set_xy(text_start_x, text_start_y + (2 * line_height))
         safe_line3 = self._convert_turkish_chars(str(header_line3)[:35])
         pdf.cell(text_width, line_height, safe_line3, 0, 0, 'C')
@@ -808,8 +1094,8 @@ class PDFGenerator:
         content_start_y = y + header_height + 4  # Reduced from 8 to 4
 
         # Photo area - thin border, positioned higher
-        photo_width = 16
-        photo_height = 20
+        photo_width = _CARD_PHOTO_WIDTH
+        photo_height = _CARD_PHOTO_HEIGHT
         photo_x = x + 3
 
         # QR kod kontrolü - eğer QR kod varsa fotoğrafı ortalı konuma al
@@ -881,6 +1167,10 @@ class PDFGenerator:
             max_rows = 6  # Tam 6 satır
             available_height = photo_height + 10  # Daha geniş alan
 
+            # Etiket/değer çerçeveleri tüm satırlarda aynı çizgi ayarını kullanır
+            pdf.set_line_width(0.2)
+            pdf.set_draw_color(150, 150, 150)
+
             # Kullanıcının seçtiği sütunları sırasıyla göster - 6 satıra kadar
             for i, (column, value) in enumerate(valid_data):
                 if i >= max_rows:
@@ -892,30 +1182,22 @@ class PDFGenerator:
 
                 # Etiket çerçeveli kutu
                 pdf.set_xy(info_x, current_y)
-                pdf.set_font(self.default_font, 'B', 6)
                 pdf.set_text_color(60, 60, 60)
 
                 # Etiket çerçevesi
-                pdf.set_line_width(0.2)
-                pdf.set_draw_color(150, 150, 150)
                 pdf.rect(info_x, current_y, label_width, line_height)
 
                 # Etiket metni - otomatik boyutlandırma ile
                 safe_label = self._convert_turkish_chars(str(column))
                 
-                # Otomatik font boyutlandırma - etiket için
-                font_size = 6
-                while font_size > 4:  # Minimum 4pt
-                    pdf.set_font(self.default_font, 'B', font_size)
-                    test_width = pdf.get_string_width(safe_label + ":")
-                    if test_width <= (label_width - 1):  # 1mm padding
-                        break
-                    font_size -= 0.5
+                # Otomatik font boyutlandırma - etiket için (1mm padding; genişlik önbellekten)
+                font_size = self._fit_font_size(pdf, safe_label + ":", 'B', label_width - 1)
+                pdf.set_font(self.default_font, 'B', font_size)
                 
                 # Eğer hala sığmıyorsa kırp
-                if pdf.get_string_width(safe_label + ":") > (label_width - 1):
-                    while pdf.get_string_width(safe_label + ":") > (label_width - 1) and len(safe_label) > 3:
-                        safe_label = safe_label[:-1]
+                while (self._text_width(pdf, safe_label + ":", 'B') * font_size > (label_width - 1)
+                       and len(safe_label) > 3):
+                    safe_label = safe_label[:-1]
                 
                 # Etiket metnini yazdır - azaltılmış padding ile
                 pdf.set_xy(info_x + 0.5, current_y + 0.3)  # Padding azaltıldı
@@ -928,24 +1210,18 @@ class PDFGenerator:
                 pdf.rect(value_x, current_y, value_width, line_height)
 
                 # Değer metni - otomatik boyutlandırma ile
-                pdf.set_font(self.default_font, '', 6)
                 pdf.set_text_color(0, 0, 0)
                 
                 safe_value = self._convert_turkish_chars(str(value))
                 
-                # Otomatik font boyutlandırma - değer için
-                font_size = 6
-                while font_size > 4:  # Minimum 4pt
-                    pdf.set_font(self.default_font, '', font_size)
-                    test_width = pdf.get_string_width(safe_value)
-                    if test_width <= (value_width - 0.8):  # 0.8mm padding
-                        break
-                    font_size -= 0.5
+                # Otomatik font boyutlandırma - değer için (0.8mm padding; genişlik önbellekten)
+                font_size = self._fit_font_size(pdf, safe_value, '', value_width - 0.8)
+                pdf.set_font(self.default_font, '', font_size)
                 
                 # Eğer hala sığmıyorsa kırp
-                if pdf.get_string_width(safe_value) > (value_width - 0.8):
-                    while pdf.get_string_width(safe_value) > (value_width - 0.8) and len(safe_value) > 1:
-                        safe_value = safe_value[:-1]
+                while (self._text_width(pdf, safe_value, '') * font_size > (value_width - 0.8)
+                       and len(safe_value) > 1):
+                    safe_value = safe_value[:-1]
                 
                 # Değer metnini yazdır - azaltılmış padding ile
                 pdf.set_xy(value_x + 0.4, current_y + 0.3)  # Padding azaltıldı
@@ -1086,169 +1362,120 @@ class PDFGenerator:
         safe_line5 = self._convert_turkish_chars(str(header_line5)[:50])
         pdf.cell(width - 4, 3, safe_line5, 0, 0, 'C')
 
+    def _text_width(self, pdf: FPDF, text: str, style: str) -> float:
+        """Width of text at 1pt in the default font and given style, cached"""
+        key = (self.default_font, style, text)
+        width = self._text_width_cache.get(key)
+        if width is None:
+            # Yalnızca önbellek ıskasında ölçüm için stil değiştirilir (aynıysa fpdf2 bir şey yazmaz)
+            pdf.set_font(self.default_font, style, pdf.font_size_pt)
+            # Metin genişliği punto ile doğrusal ölçeklenir; 1pt değeri saklanır
+            width = pdf.get_string_width(text) / pdf.font_size_pt
+            if len(self._text_width_cache) >= 4096:
+                self._text_width_cache.clear()
+            self._text_width_cache[key] = width
+        return width
+
+    def _fit_font_size(self, pdf: FPDF, text: str, style: str, max_width: float) -> float:
+        """Largest of 6, 5.5, 5, 4.5 pt at which text fits max_width (4.5pt if none does)"""
+        width_per_pt = self._text_width(pdf, text, style)
+        for font_size in _CARD_FONT_SIZES:
+            if width_per_pt * font_size <= max_width:
+                return font_size
+        return _CARD_FONT_SIZES[-1]
+
+    def _build_field_map(self, columns: Tuple[str, ...], original: bool = False) -> Dict[str, Tuple[str, ...]]:
+        """Candidate column names per card field, in lookup order (once per column layout)"""
+        key = (columns, original)
+        field_map = self._field_map_cache.get(key)
+        if field_map is None:
+            lowered = [(col, str(col).lower()) for col in columns]
+            field_map = {}
+            for field, (loose, exact, column) in _PERSON_FIELD_RULES.items():
+                if original:
+                    present = set(columns)
+                    candidates = [name for name in exact if name in present]
+                    pattern = column
+                else:
+                    candidates = []
+                    pattern = loose
+                candidates += [col for col, low in lowered
+                               if pattern.search(low)
+                               and not (field == 'first_name' and 'soyad' in low)]
+                field_map[field] = tuple(candidates)
+            if len(self._field_map_cache) >= 64:
+                self._field_map_cache.clear()
+            self._field_map_cache[key] = field_map
+        return field_map
+
+    @staticmethod
+    def _first_field_value(data: Dict, keys: Tuple[str, ...], min_len: int = 0) -> str:
+        """First usable (non-empty, non-'nan') value among keys"""
+        for key in keys:
+            value = data.get(key)
+            if value:
+                value = str(value).strip()
+                if value and value != 'nan' and len(value) >= min_len:
+                    return value
+        return ''
+
     def _extract_person_data(self, person: Dict) -> Dict[str, str]:
         """Extract person data using smart field matching from Excel columns"""
-        extracted = {
-            'tc_no': '',
-            'student_no': '',
-            'class_info': '',
-            'first_name': '',
-            'last_name': ''
-        }
-
         # Debug: Log mevcut person data
-        self.logger.debug(f"Extracting data from person: {person.keys()}")
+        self.logger.debug("Extracting data from person: %s", person.keys())
 
         # Önce doğrudan person dict'inden al
-        extracted['first_name'] = str(person.get('first_name', '')).strip()
-        extracted['last_name'] = str(person.get('last_name', '')).strip()
-        extracted['class_info'] = str(person.get('class_name', '')).strip()
-        extracted['student_no'] = str(person.get('student_no', '')).strip()
-        extracted['tc_no'] = str(person.get('tc_kimlik', '')).strip()
+        extracted = {
+            'tc_no': str(person.get('tc_kimlik', '')).strip(),
+            'student_no': str(person.get('student_no', '')).strip(),
+            'class_info': str(person.get('class_name', '')).strip(),
+            'first_name': str(person.get('first_name', '')).strip(),
+            'last_name': str(person.get('last_name', '')).strip(),
+        }
 
         # Branch bilgisini de kontrol et (öğretmenler için)
         if not extracted['class_info']:
             extracted['class_info'] = str(person.get('branch', '')).strip()
 
-        # Eğer boşsa, _original_data'dan al veya person'ın kendisinden
-        original_data = person.get('_original_data', person)
-
-        # İlk olarak doğrudan person dict'inden tüm alanları kontrol et
-        for key, value in person.items():
-            if value and str(value).strip() and str(value).strip() != 'nan':
-                value_str = str(value).strip()
-
-                # Ad için
-                if not extracted['first_name'] and any(pattern in key.lower() for pattern in ['ad', 'name', 'first', 'isim']) and 'soyad' not in key.lower():
-                    extracted['first_name'] = value_str
-
-                # Soyad için
-                if not extracted['last_name'] and any(pattern in key.lower() for pattern in ['soyad', 'last', 'surname']):
-                    extracted['last_name'] = value_str
-
-                # Sınıf/Branş için
-                if not extracted['class_info'] and any(pattern in key.lower() for pattern in ['sınıf', 'sinif', 'class', 'branş', 'brans', 'branch']):
-                    extracted['class_info'] = value_str
-
-                # Numara için
-                if not extracted['student_no'] and any(pattern in key.lower() for pattern in ['no', 'numara', 'student_no', 'sicil']):
-                    extracted['student_no'] = value_str
-
-                # TC için
-                if not extracted['tc_no'] and any(pattern in key.lower() for pattern in ['tc', 'kimlik']) and len(value_str) >= 10:
-                    extracted['tc_no'] = value_str
-
-        if not extracted['first_name']:
-            first_name_fields = ['ad', 'adi', 'first_name', 'name', 'isim', 'adı', 'Ad', 'ADI', 'ISIM']
-            for field in first_name_fields:
-                if field in original_data and original_data[field]:
-                    value = str(original_data[field]).strip()
-                    if value and value != 'nan':
-                        extracted['first_name'] = value
-                        break
-
-            # Sütun adına göre arama
-            if not extracted['first_name']:
-                for col_name, col_value in original_data.items():
-                    if col_value and 'ad' in col_name.lower() and 'soyad' not in col_name.lower():
-                        value = str(col_value).strip()
-                        if value and value != 'nan':
-                            extracted['first_name'] = value
-                            break
-
-        if not extracted['last_name']:
-            last_name_fields = ['soyad', 'soyadi', 'last_name', 'surname', 'soyadı', 'Soyad', 'SOYAD']
-            for field in last_name_fields:
-                if field in original_data and original_data[field]:
-                    value = str(original_data[field]).strip()
-                    if value and value != 'nan':
-                        extracted['last_name'] = value
-                        break
-
-            # Sütun adına göre arama
-            if not extracted['last_name']:
-                for col_name, col_value in original_data.items():
-                    if col_value and 'soyad' in col_name.lower():
-                        value = str(col_value).strip()
-                        if value and value != 'nan':
-                            extracted['last_name'] = value
-                            break
-
-        if not extracted['class_info']:
-            class_fields = ['sınıf', 'sinif', 'class', 'class_name', 'branş', 'brans', 'branch', 'Sınıf', 'SINIF']
-            for field in class_fields:
-                if field in original_data and original_data[field]:
-                    value = str(original_data[field]).strip()
-                    if value and value != 'nan':
-                        extracted['class_info'] = value
-                        break
-
-            # Sütun adına göre arama
-            if not extracted['class_info']:
-                for col_name, col_value in original_data.items():
-                    if col_value and ('sınıf' in col_name.lower() or 'sinif' in col_name.lower() or 'class' in col_name.lower()):
-                        value = str(col_value).strip()
-                        if value and value != 'nan':
-                            extracted['class_info'] = value
-                            break
+        if all(extracted.values()):
+            return extracted
 
-        if not extracted['student_no']:
-            student_fields = ['numara', 'no', 'student_no', 'öğrenci_no', 'ogrenci_no', 'okul_no', 'sicil_no', 'sicil', 'Numara', 'NO']
-            for field in student_fields:
-                if field in original_data and original_data[field]:
-                    value = str(original_data[field]).strip()
-                    if value and value != 'nan':
-                        extracted['student_no'] = value
-                        break
-
-            # Sütun adına göre arama
-            if not extracted['student_no']:
-                for col_name, col_value in original_data.items():
-                    if col_value and ('numara' in col_name.lower() or 'no' in col_name.lower()):
-                        value = str(col_value).strip()
-                        if value and value != 'nan':
-                            extracted['student_no'] = value
-                            break
+        # Sütun eşleştirmesi sütun düzeni başına bir kez yapılır; burada yalnızca sözlük okumaları kalır
+        original_data = person.get('_original_data', person)
+        person_map = self._build_field_map(tuple(person))
+        original_map = self._build_field_map(tuple(original_data), original=True)
 
-        if not extracted['tc_no']:
-            tc_fields = ['tc_kimlik', 'tc_no', 'tc', 'kimlik', 'kimlik_no', 'tcno', 'tc kimlik', 'TC', 'KIMLIK']
-            for field in tc_fields:
-                if field in original_data and original_data[field]:
-                    value = str(original_data[field]).strip()
-                    if value and value != 'nan' and len(value) >= 10:
-                        extracted['tc_no'] = value
-                        break
-
-            # Sütun adına göre arama
-            if not extracted['tc_no']:
-                for col_name, col_value in original_data.items():
-                    if col_value and ('tc' in col_name.lower() or 'kimlik' in col_name.lower()):
-                        value = str(col_value).strip()
-                        if value and value != 'nan' and len(value) >= 10:
-                            extracted['tc_no'] = value
-                            break
+        for field, value in extracted.items():
+            if not value:
+                min_len = 10 if field == 'tc_no' else 0
+                extracted[field] = (self._first_field_value(person, person_map[field], min_len)
+                                    or self._first_field_value(original_data, original_map[field], min_len))
 
         return extracted
     
+    def _get_font_files(self) -> Dict[str, str]:
+        """Mevcut DejaVu font dosyalarını bir kez bul: {stil: yol}"""
+        if self._font_files is None:
+            font_dir = Path(__file__).parent / "fonts"
+            candidates = {
+                '': font_dir / "DejaVuSans.ttf",
+                'B': font_dir / "DejaVuSans-Bold.ttf",
+                'I': font_dir / "DejaVuSans-Oblique.ttf",
+            }
+            self._font_files = {style: str(path) for style, path in candidates.items() if path.exists()}
+        return self._font_files
+
     def _register_fonts(self, pdf: FPDF):
         """Register DejaVu fonts (with bold/italic) or fallback to Arial"""
         try:
-            from pathlib import Path
-            font_dir = Path(__file__).parent / "fonts"
-
-            regular = font_dir / "DejaVuSans.ttf"
-            bold = font_dir / "DejaVuSans-Bold.ttf"
-            italic = font_dir / "DejaVuSans-Oblique.ttf"
+            font_files = self._get_font_files()
 
-            if regular.exists():
-                pdf.add_font("DejaVu", '', str(regular), uni=True)
+            if '' in font_files:
+                # fpdf2 çıktı sırasında yalnızca kullanılan glifleri (fontTools ile) gömer; ayrıca alt küme gerekmez
+                for style, font_file in font_files.items():
+                    pdf.add_font("DejaVu", style, font_file, uni=True)
                 self.default_font = "DejaVu"
                 self.logger.info("Using DejaVu font for Turkish character support")
-
-                if bold.exists():
-                    pdf.add_font("DejaVu", 'B', str(bold), uni=True)
-                if italic.exists():
-                    pdf.add_font("DejaVu", 'I', str(italic), uni=True)
             else:
                 self.default_font = "Arial"
                 self.logger.warning("DejaVu fonts not found, using Arial as fallback")
@@ -1275,207 +1502,184 @@ class PDFGenerator:
         pdf.cell(width, 4, 'Foto', 0, 0, 'C')
 
     def _add_high_quality_photo_to_pdf(self, pdf: FPDF, photo_path: Path, x: float, y: float, 
-                         width: float, height: float) -> None:
+                         width: float, height: float, profile: str = 'card') -> None:
         """Add high quality photo to PDF at specified position with proper aspect ratio"""
         try:
-            # Open image
-            with Image.open(photo_path) as img:
-                # Convert to RGB if necessary
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
+            jpeg_bytes, new_width, new_height, x_offset, y_offset = self._render_photo_jpeg(
+                photo_path, width, height, profile=profile)
 
-                # Calculate proper dimensions to maintain aspect ratio
-                img_width, img_height = img.size
-                img_aspect = img_width / img_height
-                target_aspect = width / height
-
-                # Calculate new dimensions that fit within the target area
-                if img_aspect > target_aspect:
-                    # Image is wider than target, fit by width
-                    new_width = width
-                    new_height = width / img_aspect
-                    # Center vertically
-                    y_offset = (height - new_height) / 2
-                    final_x = x
-                    final_y = y + y_offset
-                else:
-                    # Image is taller than target, fit by height
-                    new_height = height
-                    new_width = height * img_aspect
-                    # Center horizontally
-                    x_offset = (width - new_width) / 2
-                    final_x = x + x_offset
-                    final_y = y
-
-                # Use much higher resolution for crisp images
-                scale_factor = 12  # Very high scale for ID cards
-                target_pixel_width = int(new_width * scale_factor)
-                target_pixel_height = int(new_height * scale_factor)
-
-                # Ensure minimum resolution
-                if target_pixel_width < 300:
-                    target_pixel_width = 300
-                if target_pixel_height < 400:
-                    target_pixel_height = 400
-
-                img_resized = img.resize((target_pixel_width, target_pixel_height), Image.Resampling.LANCZOS)
-
-                # Apply sharpening for better quality
-                from PIL import ImageEnhance
-                enhancer = ImageEnhance.Sharpness(img_resized)
-                img_resized = enhancer.enhance(1.3)
-
-                # Save to temporary bytes with maximum quality
-                img_bytes = io.BytesIO()
-                img_resized.save(img_bytes, format='JPEG', quality=100, optimize=False, dpi=(600, 600))
-                img_bytes.seek(0)
-
-                # Add to PDF with calculated dimensions
-                pdf.image(img_bytes, final_x, final_y, new_width, new_height)
+            # Add to PDF with calculated dimensions
+            pdf.image(io.BytesIO(jpeg_bytes), x + x_offset, y + y_offset, new_width, new_height)
 
         except Exception as e:
             self.logger.error(f"Error adding high quality photo to PDF: {e}")
             # Fallback to placeholder
             self._draw_modern_photo_placeholder(pdf, x, y, width, height)
 
-    def _add_logo_with_transparency(self, pdf: FPDF, logo_path: Path, x: float, y: float, 
-                                   width: float, height: float, header_color: str = '#2D55A5', 
-                                   header_gradient: bool = False, header_color2: str = '#1B3F73',
-                                   logo_position: str = 'left') -> None:
-        """Add logo to PDF with proper PNG transparency support and gradient background"""
-        try:
-            # Open image
-            with Image.open(logo_path) as img:
-                # PNG transparency desteği - gradient arka plana göre renk hesapla
-                if img.mode in ('RGBA', 'LA'):
-                    # Gradient varsa logo pozisyonuna göre arka plan rengini hesapla
-                    if header_gradient:
-                        if logo_position == 'left':
-                            # Sol logo: %100 başlangıç rengi
-                            background_color = header_color
-                        else:  # right
-                            # Sağ logo: %100 bitiş rengi
-                            background_color = header_color2
-                    else:
-                        background_color = header_color
-                    
-                    # Arka plan rengini RGB'ye çevir
-                    bg_rgb = self._hex_to_rgb(background_color)
-                    
-                    if img.mode == 'RGBA':
-                        # RGBA için gelişmiş alpha composite - kenar yumuşatma ile
-                        # Yüksek çözünürlükte işle
-                        high_res_factor = 4
-                        high_res_size = (img.size[0] * high_res_factor, img.size[1] * high_res_factor)
-                        
-                        # Resmi büyüt
-                        img_high_res = img.resize(high_res_size, Image.Resampling.LANCZOS)
-                        
-                        # Yüksek çözünürlükte arka plan oluştur
-                        rgba_background = Image.new('RGBA', high_res_size, bg_rgb + (255,))
-                        
-                        # Alpha composite ile birleştir
-                        composite = Image.alpha_composite(rgba_background, img_high_res)
-                        
-                        # Orijinal boyuta küçült - antialiasing ile
-                        img = composite.resize(img.size, Image.Resampling.LANCZOS)
-                        
-                        # RGB'ye çevir
-                        img = img.convert('RGB')
-                    else:  # LA mode
-                        # LA modunda alpha kanalını mask olarak kullan - yumuşatma ile
-                        background = Image.new('RGB', img.size, bg_rgb)
-                        # Mask'ı yumuşat
-                        alpha_mask = img.split()[-1]
-                        # Gaussian blur uygula
-                        from PIL import ImageFilter
-                        alpha_mask = alpha_mask.filter(ImageFilter.GaussianBlur(radius=0.5))
-                        background.paste(img, mask=alpha_mask)
-                        img = background
-                        
-                elif img.mode == 'P' and 'transparency' in img.info:
-                    # Palette mode'da transparency varsa - gelişmiş işleme
-                    if header_gradient:
-                        if logo_position == 'left':
-                            # Sol logo: %100 başlangıç rengi  
-                            background_color = header_color
-                        else:
-                            # Sağ logo: %100 bitiş rengi
-                            background_color = header_color2
-                    else:
-                        background_color = header_color
+    def _load_logo(self, logo_path: Path) -> Image.Image:
+        """Logoyu bir kez açıp çöz; dosya değişirse (mtime) yeniden yükle"""
+        key = (str(logo_path), os.stat(logo_path).st_mtime_ns)
+        img = self._logo_cache.get(key)
+        if img is None:
+            with Image.open(logo_path) as source:
+                source.load()
+                img = source.copy()
+            # Logo değiştirildiğinde eski kayıtlar birikmesin
+            if len(self._logo_cache) >= 8:
+                self._logo_cache.clear()
+            self._logo_cache[key] = img
+        return img
+
+    def _render_logo_jpeg(self, logo_path: Path, width: float, height: float,
+                          background_color: str) -> Tuple[bytes, float, float, float, float]:
+        """Logoyu arka plana karıştırıp JPEG'e kodla; (bayt, x ofseti, y ofseti, genişlik, yükseklik) önbellekten"""
+        key = (str(logo_path), os.stat(logo_path).st_mtime_ns, width, height, background_color)
+        rendered = self._logo_jpeg_cache.get(key)
+        if rendered is None:
+            # Çözülmüş logo önbellekten alınır; aşağıdaki dönüşümler yeni görüntü üretir
+            img = self._load_logo(logo_path)
+
+            # PNG transparency desteği - gradient arka plana göre renk hesapla
+            if img.mode in ('RGBA', 'LA'):
+                # Arka plan rengini RGB'ye çevir
+                bg_rgb = self._hex_to_rgb(background_color)
+                
+                if img.mode == 'RGBA':
+                    # RGBA için gelişmiş alpha composite - kenar yumuşatma ile
+                    # Yüksek çözünürlükte işle
+                    high_res_factor = 4
+                    high_res_size = (img.size[0] * high_res_factor, img.size[1] * high_res_factor)
                     
-                    bg_rgb = self._hex_to_rgb(background_color)
+                    # Resmi büyüt
+                    img_high_res = img.resize(high_res_size, Image.Resampling.LANCZOS)
                     
-                    # Palette mode'u RGBA'ya çevir - transparency korunarak
-                    img = img.convert('RGBA')
+                    # Yüksek çözünürlükte arka plan oluştur
+                    rgba_background = Image.new('RGBA', high_res_size, bg_rgb + (255,))
                     
-                    # Yüksek kaliteli arka plan karışımı
-                    high_res_factor = 3
-                    high_res_size = (img.size[0] * high_res_factor, img.size[1] * high_res_factor)
+                    # Alpha composite ile birleştir
+                    composite = Image.alpha_composite(rgba_background, img_high_res)
                     
-                    img_high_res = img.resize(high_res_size, Image.Resampling.LANCZOS)
-                    background = Image.new('RGBA', high_res_size, bg_rgb + (255,))
-                    composite = Image.alpha_composite(background, img_high_res)
+                    # Orijinal boyuta küçült - antialiasing ile
                     img = composite.resize(img.size, Image.Resampling.LANCZOS)
-                    img = img.convert('RGB')
                     
-                elif img.mode != 'RGB':
+                    # RGB'ye çevir
                     img = img.convert('RGB')
+                else:  # LA mode
+                    # LA modunda alpha kanalını mask olarak kullan - yumuşatma ile
+                    background = Image.new('RGB', img.size, bg_rgb)
+                    # Mask'ı yumuşat
+                    alpha_mask = img.split()[-1]
+                    # Gaussian blur uygula
+                    from PIL import ImageFilter
+                    alpha_mask = alpha_mask.filter(ImageFilter.GaussianBlur(radius=0.5))
+                    background.paste(img, mask=alpha_mask)
+                    img = background
+                    
+            elif img.mode == 'P' and 'transparency' in img.info:
+                # Palette mode'da transparency varsa - gelişmiş işleme
+                bg_rgb = self._hex_to_rgb(background_color)
+                
+                # Palette mode'u RGBA'ya çevir - transparency korunarak
+                img = img.convert('RGBA')
+                
+                # Yüksek kaliteli arka plan karışımı
+                high_res_factor = 3
+                high_res_size = (img.size[0] * high_res_factor, img.size[1] * high_res_factor)
+                
+                img_high_res = img.resize(high_res_size, Image.Resampling.LANCZOS)
+                background = Image.new('RGBA', high_res_size, bg_rgb + (255,))
+                composite = Image.alpha_composite(background, img_high_res)
+                img = composite.resize(img.size, Image.Resampling.LANCZOS)
+                img = img.convert('RGB')
+                
+            elif img.mode != 'RGB':
+                img = img.convert('RGB')
+
+            # Calculate proper dimensions to maintain aspect ratio
+            img_width, img_height = img.size
+            img_aspect = img_width / img_height
+            target_aspect = width / height
+
+            # Calculate new dimensions that fit within the target area
+            if img_aspect > target_aspect:
+                # Image is wider than target, fit by width
+                new_width = width
+                new_height = width / img_aspect
+                # Center vertically
+                x_offset = 0
+                y_offset = (height - new_height) / 2
+            else:
+                # Image is taller than target, fit by height
+                new_height = height
+                new_width = height * img_aspect
+                # Center horizontally
+                x_offset = (width - new_width) / 2
+                y_offset = 0
+
+            # Resize image with much higher resolution for crisp logos
+            scale_factor = 10  # Çok daha yüksek çözünürlük için artırıldı
+            target_pixel_width = int(new_width * scale_factor)
+            target_pixel_height = int(new_height * scale_factor)
+
+            # Minimum çözünürlük garantisi
+            if target_pixel_width < 200:
+                target_pixel_width = 200
+            if target_pixel_height < 200:
+                target_pixel_height = 200
+
+            img_resized = img.resize((target_pixel_width, target_pixel_height), Image.Resampling.LANCZOS)
+
+            # Apply sharpening for even better quality
+            from PIL import ImageEnhance
+            enhancer = ImageEnhance.Sharpness(img_resized)
+            img_resized = enhancer.enhance(1.2)  # Keskinlik artırma
+
+            # Save to temporary bytes with maximum quality
+            img_bytes = io.BytesIO()
+            img_resized.save(img_bytes, format='JPEG', quality=100, optimize=False, dpi=(600, 600))
+
+            rendered = (img_bytes.getvalue(), x_offset, y_offset, new_width, new_height)
+            # Logo/renk değiştirildiğinde eski kayıtlar birikmesin
+            if len(self._logo_jpeg_cache) >= 16:
+                self._logo_jpeg_cache.clear()
+            self._logo_jpeg_cache[key] = rendered
+        return rendered
 
-                # Calculate proper dimensions to maintain aspect ratio
-                img_width, img_height = img.size
-                img_aspect = img_width / img_height
-                target_aspect = width / height
-
-                # Calculate new dimensions that fit within the target area
-                if img_aspect > target_aspect:
-                    # Image is wider than target, fit by width
-                    new_width = width
-                    new_height = width / img_aspect
-                    # Center vertically
-                    y_offset = (height - new_height) / 2
-                    final_x = x
-                    final_y = y + y_offset
-                else:
-                    # Image is taller than target, fit by height
-                    new_height = height
-                    new_width = height * img_aspect
-                    # Center horizontally
-                    x_offset = (width - new_width) / 2
-                    final_x = x + x_offset
-                    final_y = y
-
-                # Resize image with much higher resolution for crisp logos
-                scale_factor = 10  # Çok daha yüksek çözünürlük için artırıldı
-                target_pixel_width = int(new_width * scale_factor)
-                target_pixel_height = int(new_height * scale_factor)
-
-                # Minimum çözünürlük garantisi
-                if target_pixel_width < 200:
-                    target_pixel_width = 200
-                if target_pixel_height < 200:
-                    target_pixel_height = 200
-
-                img_resized = img.resize((target_pixel_width, target_pixel_height), Image.Resampling.LANCZOS)
-
-                # Apply sharpening for even better quality
-                from PIL import ImageEnhance
-                enhancer = ImageEnhance.Sharpness(img_resized)
-                img_resized = enhancer.enhance(1.2)  # Keskinlik artırma
-
-                # Save to temporary bytes with maximum quality
-                img_bytes = io.BytesIO()
-                img_resized.save(img_bytes, format='JPEG', quality=100, optimize=False, dpi=(600, 600))
-                img_bytes.seek(0)
-
-                # Add to PDF with calculated dimensions
-                pdf.image(img_bytes, final_x, final_y, new_width, new_height)
+    def _add_logo_with_transparency(self, pdf: FPDF, logo_path: Path, x: float, y: float, 
+                                   width: float, height: float, header_color: str = '#2D55A5', 
+                                   header_gradient: bool = False, header_color2: str = '#1B3F73',
+                                   logo_position: str = 'left') -> None:
+        """Add logo to PDF with proper PNG transparency support and gradient background"""
+        try:
+            # Gradient varsa sağ logo bitiş rengine, diğer durumlarda başlangıç rengine karışır
+            if header_gradient and logo_position != 'left':
+                background_color = header_color2
+            else:
+                background_color = header_color
+
+            # Karıştırma/keskinleştirme/kodlama her kart için tekrarlanmaz
+            jpeg_bytes, x_offset, y_offset, new_width, new_height = self._render_logo_jpeg(
+                logo_path, width, height, background_color)
+
+            # Add to PDF with calculated dimensions
+            pdf.image(io.BytesIO(jpeg_bytes), x + x_offset, y + y_offset, new_width, new_height)
 
         except Exception as e:
             self.logger.error(f"Error adding logo with transparency to PDF: {e}")
             raise
 
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _gradient_ramp(rgb1: Tuple[int, int, int], rgb2: Tuple[int, int, int],
+                       strips: int) -> Tuple[Tuple[int, int, int], ...]:
+        """Intermediate strip colors from rgb1 to rgb2 (aynı renk çifti her kartta tekrarlanır)"""
+        ramp = []
+        for i in range(strips):
+            # Calculate intermediate color
+            ratio = i / (strips - 1) if strips > 1 else 0
+            ramp.append(tuple(int(c1 + (c2 - c1) * ratio) for c1, c2 in zip(rgb1, rgb2)))
+        return tuple(ramp)
+
     def _draw_gradient_rectangle(self, pdf: FPDF, x: float, y: float, width: float, height: float,
                                 color1: str, color2: str, direction: str = 'horizontal'):
         """Draw a gradient rectangle using thin strips"""
@@ -1488,25 +1692,13 @@ class PDFGenerator:
             
             if direction == 'horizontal':
                 strip_width = width / strips
-                for i in range(strips):
-                    # Calculate intermediate color
-                    ratio = i / (strips - 1) if strips > 1 else 0
-                    r = int(rgb1[0] + (rgb2[0] - rgb1[0]) * ratio)
-                    g = int(rgb1[1] + (rgb2[1] - rgb1[1]) * ratio)
-                    b = int(rgb1[2] + (rgb2[2] - rgb1[2]) * ratio)
-                    
+                for i, (r, g, b) in enumerate(self._gradient_ramp(rgb1, rgb2, strips)):
                     pdf.set_fill_color(r, g, b)
                     strip_x = x + i * strip_width
                     pdf.rect(strip_x, y, strip_width + 0.1, height, 'F')  # +0.1 to avoid gaps
             else:  # vertical
                 strip_height = height / strips
-                for i in range(strips):
-                    # Calculate intermediate color
-                    ratio = i / (strips - 1) if strips > 1 else 0
-                    r = int(rgb1[0] + (rgb2[0] - rgb1[0]) * ratio)
-                    g = int(rgb1[1] + (rgb2[1] - rgb1[1]) * ratio)
-                    b = int(rgb1[2] + (rgb2[2] - rgb1[2]) * ratio)
-                    
+                for i, (r, g, b) in enumerate(self._gradient_ramp(rgb1, rgb2, strips)):
                     pdf.set_fill_color(r, g, b)
                     strip_y = y + i * strip_height
                     pdf.rect(x, strip_y, width, strip_height + 0.1, 'F')  # +0.1 to avoid gaps
@@ -1527,22 +1719,8 @@ class PDFGenerator:
         if self.default_font == 'DejaVu':
             return str(text)
         
-        # For Arial fallback, convert Turkish characters
-        replacements = {
-            'ç': 'c', 'Ç': 'C',
-            'ğ': 'g', 'Ğ': 'G', 
-            'ı': 'i', 'I': 'I',
-            'İ': 'I',
-            'ö': 'o', 'Ö': 'O',
-            'ş': 's', 'Ş': 'S',
-            'ü': 'u', 'Ü': 'U'
-        }
-        
-        result = str(text)
-        for turkish_char, replacement in replacements.items():
-            result = result.replace(turkish_char, replacement)
-        
-        return result
+        # For Arial fallback, convert Turkish characters (tekrarlanan etiket/isimler önbellekten)
+        return _ascii_turkish(str(text))
 
     def _draw_modern_photo_placeholder(self, pdf: FPDF, x: float, y: float, width: float, height: float):
         """Draw modern styled photo placeholder"""
@@ -1588,30 +1766,35 @@ class PDFGenerator:
         try:
             # Try to use qrcode library if available
             try:
-                import qrcode
-                from PIL import Image as PILImage
-                import io
-                
-                # Generate QR code
-                qr = qrcode.QRCode(
-                    version=1,
-                    error_correction=qrcode.constants.ERROR_CORRECT_L,
-                    box_size=10,
-                    border=4,
-                )
-                qr.add_data(content)
-                qr.make(fit=True)
-                
-                # Create QR code image
-                qr_img = qr.make_image(fill_color="black", back_color="white")
-                
-                # Convert to bytes
-                img_buffer = io.BytesIO()
-                qr_img.save(img_buffer, format='PNG')
-                img_buffer.seek(0)
-                
-                # Add to PDF
-                pdf.image(img_buffer, x, y, size, size)
+                # Aynı içerik (ör. sabit 'custom' metni) her kartta yeniden kodlanmaz
+                png_bytes = self._qr_png_cache.get(content)
+                if png_bytes is None:
+                    import qrcode
+
+                    # Generate QR code
+                    qr = qrcode.QRCode(
+                        version=1,
+                        error_correction=qrcode.constants.ERROR_CORRECT_L,
+                        box_size=10,
+                        border=4,
+                    )
+                    qr.add_data(content)
+                    qr.make(fit=True)
+
+                    # Create QR code image and convert to bytes
+                    qr_img = qr.make_image(fill_color="black", back_color="white")
+                    img_buffer = io.BytesIO()
+                    qr_img.save(img_buffer, format='PNG')
+                    png_bytes = img_buffer.getvalue()
+
+                    if len(self._qr_png_cache) >= _QR_PNG_CACHE_SIZE:
+                        self._qr_png_cache.popitem(last=False)
+                    self._qr_png_cache[content] = png_bytes
+                else:
+                    self._qr_png_cache.move_to_end(content)
+
+                # Add to PDF (fpdf2 aynı baytları tek bir görsel nesnesi olarak paylaşır)
+                pdf.image(io.BytesIO(png_bytes), x, y, size, size)
                 
             except ImportError:
                 # Fallback: Simple pattern placeholder
@@ -15,7 +15,12 @@ from pathlib import Path
 from typing import List, Dict, Optional, Tuple, Union, Any
 import re
 import shutil
+import threading
 from dataclasses import dataclass
+from contextlib import nullcontext
+
+# Windows dosya adlarında geçersiz karakterleri tek geçişte silen tablo
+_INVALID_FILENAME_CHARS = str.maketrans('', '', '<>:"/\\|?*')
 
 
 @dataclass
@@ -56,10 +61,14 @@ class PhotoProcessor:
         # Desteklenen dosya formatları
         self.supported_formats = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.webp'}
 
+        # detectMultiScale sınıflandırıcının iç durumunu değiştirir; her iş parçacığı kendi kopyasını kullanır
+        self._cascade_local = threading.local()
+
         # Face detection cascade dosyasını yükle
         try:
             import cv2
-            self.face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+            self._cascade_path = cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
+            self.face_cascade = cv2.CascadeClassifier(self._cascade_path)
             if self.face_cascade.empty():
                 raise ValueError("Cascade classifier yüklenemedi")
             self.logger.info("OpenCV yüz tanıma başarıyla yüklendi")
@@ -69,26 +78,47 @@ class PhotoProcessor:
         except Exception as e:
             self.logger.error(f"Face cascade yüklenirken hata: {e}")
             self.face_cascade = None
-
-    def detect_faces(self, image_path: Path) -> List[Tuple[int, int, int, int]]:
-        """Görüntüde yüzleri algıla ve koordinatlarını döndür"""
+        self._cascade_local.cascade = self.face_cascade
+
+    def _thread_face_cascade(self):
+        """Çağıran iş parçacığına ait cascade sınıflandırıcısı (ilk kullanımda yüklenir)"""
+        cascade = getattr(self._cascade_local, 'cascade', None)
+        if cascade is None:
+            cascade = cv2.CascadeClassifier(self._cascade_path)
+            self._cascade_local.cascade = cascade
+        return cascade
+
+    def _open_drafted(self, image_path: Path, dimensions: CropDimensions, headroom: int = 3) -> Image.Image:
+        """JPEG'leri hedef boyutun birkaç katına düşürülmüş ölçekte aç (libjpeg 1/2, 1/4, 1/8 çözümü)"""
+        img = Image.open(image_path)
+        target_width, target_height = dimensions.to_pixels()
+        # draft sadece JPEG'de etkilidir; diğer formatlarda değişiklik yapmaz
+        img.draft('RGB', (target_width * headroom, target_height * headroom))
+        return img
+
+    def detect_faces(self, image_path: Path, image: Optional[Image.Image] = None) -> List[Tuple[int, int, int, int]]:
+        """Görüntüde yüzleri algıla ve koordinatlarını döndür (image verilirse onun koordinatlarında)"""
         if self.face_cascade is None:
             self.logger.warning("Face cascade yüklenmemiş, yüz algılama atlanıyor")
             return []
 
         try:
             import cv2
-            # Görüntüyü oku
-            img = cv2.imread(str(image_path))
-            if img is None:
-                self.logger.error(f"Görüntü okunamadı: {image_path}")
-                return []
+            if image is not None:
+                # Zaten açılmış (ve küçültülmüş) görüntüyü kullan
+                gray = np.asarray(image.convert('L'))
+            else:
+                # Görüntüyü oku
+                img = cv2.imread(str(image_path))
+                if img is None:
+                    self.logger.error(f"Görüntü okunamadı: {image_path}")
+                    return []
 
-            # Gri tonlamaya çevir
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+                # Gri tonlamaya çevir
+                gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
 
             # Yüzleri algıla
-            faces = self.face_cascade.detectMultiScale(
+            faces = self._thread_face_cascade().detectMultiScale(
                 gray,
                 scaleFactor=1.1,
                 minNeighbors=5,
@@ -211,45 +241,52 @@ class PhotoProcessor:
         Automatically crop face from image using face detection
         """
         try:
-            faces = self.detect_faces(image_path)
+            # Büyük JPEG'leri küçültülmüş ölçekte bir kez aç; yüz algılama ve kırpma aynı görüntüyü kullanır
+            with self._open_drafted(image_path, dimensions) as img:
+                img.load()
+                return self._crop_face_auto_loaded(img, image_path, output_path, dimensions, padding_factor)
 
-            if not faces:
-                self.logger.warning(f"No faces detected in {image_path}")
-                return False
+        except Exception as e:
+            self.logger.error(f"Error auto-cropping face from {image_path}: {e}")
+            return False
 
-            # Use the largest face (assume it's the main subject)
-            largest_face = max(faces, key=lambda f: f[2] * f[3])
-            x, y, w, h = largest_face
+    def _crop_face_auto_loaded(self, img: Image.Image, image_path: Path, output_path: Path,
+                               dimensions: CropDimensions, padding_factor: float) -> bool:
+        """crop_face_auto için açılmış görüntü üzerinde yüz algıla ve kırp"""
+        faces = self.detect_faces(image_path, image=img)
 
-            # Vesikalık fotoğraf için daha uygun padding
-            # Yüzün üst kısmında saç için daha fazla alan
-            padding_w = int(w * padding_factor)
-            padding_h_top = int(h * 0.8)  # Üst kısım için %80 daha fazla
-            padding_h_bottom = int(h * 0.4)  # Alt kısım için %40 daha fazla
+        if not faces:
+            self.logger.warning(f"No faces detected in {image_path}")
+            return False
 
-            # Resim boyutlarını kontrol et
-            with Image.open(image_path) as img:
-                img_width, img_height = img.size
+        # Use the largest face (assume it's the main subject)
+        largest_face = max(faces, key=lambda f: f[2] * f[3])
+        x, y, w, h = largest_face
 
-            # Calculate crop coordinates with improved padding
-            crop_x = max(0, x - padding_w)
-            crop_y = max(0, y - padding_h_top)
-            crop_w = min(w + 2 * padding_w, img_width - crop_x)
-            crop_h = min(h + padding_h_top + padding_h_bottom, img_height - crop_y)
+        # Vesikalık fotoğraf için daha uygun padding
+        # Yüzün üst kısmında saç için daha fazla alan
+        padding_w = int(w * padding_factor)
+        padding_h_top = int(h * 0.8)  # Üst kısım için %80 daha fazla
+        padding_h_bottom = int(h * 0.4)  # Alt kısım için %40 daha fazla
 
-            # Ensure we don't exceed image boundaries
-            if crop_x + crop_w > img_width:
-                crop_w = img_width - crop_x
-            if crop_y + crop_h > img_height:
-                crop_h = img_height - crop_y
+        # Resim boyutlarını kontrol et
+        img_width, img_height = img.size
 
-            # Crop and resize image
-            return self.crop_image(image_path, output_path, dimensions,
-                                 crop_x, crop_y, crop_w, crop_h)
+        # Calculate crop coordinates with improved padding
+        crop_x = max(0, x - padding_w)
+        crop_y = max(0, y - padding_h_top)
+        crop_w = min(w + 2 * padding_w, img_width - crop_x)
+        crop_h = min(h + padding_h_top + padding_h_bottom, img_height - crop_y)
 
-        except Exception as e:
-            self.logger.error(f"Error auto-cropping face from {image_path}: {e}")
-            return False
+        # Ensure we don't exceed image boundaries
+        if crop_x + crop_w > img_width:
+            crop_w = img_width - crop_x
+        if crop_y + crop_h > img_height:
+            crop_h = img_height - crop_y
+
+        # Crop and resize image
+        return self.crop_image(image_path, output_path, dimensions,
+                             crop_x, crop_y, crop_w, crop_h, image=img)
 
     def crop_image_with_white_background_optimized(self, image_path: Path, output_path: Path, 
                                                dimensions: CropDimensions, x: int = None, y: int = None, 
@@ -458,10 +495,12 @@ class PhotoProcessor:
 
     def crop_image(self, image_path: Path, output_path: Path, 
                   dimensions: CropDimensions, x: int = None, y: int = None, 
-                  width: int = None, height: int = None) -> bool:
+                  width: int = None, height: int = None,
+                  image: Optional[Image.Image] = None) -> bool:
         """
         Crop image to specified dimensions
         If crop coordinates are not provided, center crop is used
+        If image is given, it is used instead of re-opening image_path
         """
         try:
             # Orijinal dosya formatını al
@@ -474,8 +513,16 @@ class PhotoProcessor:
                 output_path = output_path.with_suffix(original_format)
 
             # Open image with better error handling
+            if image is not None:
+                source = nullcontext(image)
+            elif x is None or y is None or width is None or height is None:
+                # Merkezi kırpmada koordinatlar açıldıktan sonra hesaplanır, küçültülmüş çözümle açılabilir
+                source = self._open_drafted(image_path, dimensions, headroom=2)
+            else:
+                source = Image.open(image_path)
+
             try:
-                with Image.open(image_path) as img:
+                with source as img:
                     # PNG dosyaları için RGBA modunu koru, diğerleri için RGB'ye çevir
                     if output_format == '.png':
                         if img.mode not in ['RGBA']:
@@ -769,17 +816,14 @@ class PhotoProcessor:
             # Clean the filename
             if filename:
                 # Remove invalid characters for Windows filenames
-                invalid_chars = '<>:"/\\|?*'
-                for char in invalid_chars:
-                    filename = filename.replace(char, '')
+                filename = filename.translate(_INVALID_FILENAME_CHARS)
 
                 # Remove multiple spaces with single space
                 filename = ' '.join(filename.split())
 
-                # Remove consecutive separators
+                # Remove consecutive separators (tek geçişte; desen re önbelleğinde tutulur)
                 if separator:
-                    while separator + separator in filename:
-                        filename = filename.replace(separator + separator, separator)
+                    filename = re.sub(f"(?:{re.escape(separator)}){{2,}}", separator, filename)
 
                     # Remove leading/trailing separators
                     filename = filename.strip(separator)